@@ -0,0 +1,46 @@
+"""
+Alembic 마이그레이션 환경
+
+테이블은 앱 시작 시 create_all로 생성되므로, 마이그레이션은 기존 데이터베이스에
+새 색인처럼 create_all이 반영하지 못하는 변경을 적용하는 용도로 사용합니다.
+"""
+from alembic import context
+from sqlalchemy import create_engine
+from app.config import settings
+from app.database import Base
+import app.models  # noqa: F401 - 모든 모델을 메타데이터에 등록
+
+target_metadata = Base.metadata
+
+
+def run_migrations_offline():
+    """SQL 스크립트만 출력 (alembic upgrade head --sql)"""
+    context.configure(
+        url=settings.DATABASE_FALLBACK_URL,
+        target_metadata=target_metadata,
+        literal_binds=True,
+        render_as_batch=True,
+    )
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online():
+    """데이터베이스에 직접 적용"""
+    engine = create_engine(settings.DATABASE_FALLBACK_URL)
+    with engine.connect() as connection:
+        # SQLite는 ALTER TABLE 지원이 제한적이므로 batch 모드 사용
+        context.configure(
+            connection=connection,
+            target_metadata=target_metadata,
+            render_as_batch=True,
+        )
+        with context.begin_transaction():
+            context.run_migrations()
+    engine.dispose()
+
+
+if context.is_offline_mode():
+    run_migrations_offline()
+else:
+    run_migrations_online()
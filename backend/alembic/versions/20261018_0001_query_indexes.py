@@ -0,0 +1,51 @@
+"""목록 조회 필터/정렬에 맞춘 복합 색인과 부분 색인 추가
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (색인 이름, 테이블, 컬럼, 부분 색인 조건)
+INDEXES = [
+    ("ix_consultations_user_status", "consultations", ["user_id", "status"], None),
+    ("ix_consultations_status", "consultations", ["status"], None),
+    ("ix_consultations_counselor_id", "consultations", ["counselor_id"], None),
+    ("ix_reviews_counselor_approved_active", "reviews", ["counselor_id", "is_approved", "is_active"], None),
+    ("ix_reviews_public", "reviews", ["id"], "is_approved = 1 AND is_active = 1"),
+    ("ix_reviews_user_id", "reviews", ["user_id"], None),
+    ("ix_notices_status_active_pinned_created", "notices", ["status", "is_active", "is_pinned", "created_at"], None),
+    ("ix_notices_published", "notices", ["is_pinned", "created_at", "id", "updated_at"], "status = 'PUBLISHED' AND is_active = 1"),
+    ("ix_counselors_online_active", "counselors", ["is_online", "is_active"], None),
+]
+
+
+def _existing_indexes(table: str) -> set:
+    """이미 있는 색인 이름 (--sql 오프라인 모드에서는 확인할 수 없으므로 빈 집합)"""
+    if op.get_context().as_sql:
+        return set()
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    # create_all로 새로 만든 데이터베이스에는 이미 색인이 있으므로 없는 것만 생성
+    for name, table, columns, where in INDEXES:
+        if name in _existing_indexes(table):
+            continue
+        op.create_index(
+            name, table, columns,
+            sqlite_where=sa.text(where) if where else None,
+        )
+    op.execute("ANALYZE")
+
+
+def downgrade():
+    for name, table, _, _ in reversed(INDEXES):
+        if op.get_context().as_sql or name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
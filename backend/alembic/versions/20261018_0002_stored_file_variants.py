@@ -0,0 +1,37 @@
+"""stored_files에 이미지 변환본 manifest 컬럼 추가
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def _existing_columns(table: str):
+    """이미 있는 컬럼 이름 (테이블이 없으면 None, --sql 오프라인 모드에서는 빈 집합)"""
+    if op.get_context().as_sql:
+        return set()
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return None
+    return {column["name"] for column in inspector.get_columns(table)}
+
+
+def upgrade():
+    # create_all로 새로 만든 데이터베이스에는 이미 컬럼이 있으므로 없을 때만 추가
+    columns = _existing_columns("stored_files")
+    if columns is not None and "variants" not in columns:
+        op.add_column("stored_files", sa.Column("variants", sa.Text(), nullable=True))
+
+
+def downgrade():
+    columns = _existing_columns("stored_files")
+    if columns is not None and (op.get_context().as_sql or "variants" in columns):
+        with op.batch_alter_table("stored_files") as batch:
+            batch.drop_column("variants")
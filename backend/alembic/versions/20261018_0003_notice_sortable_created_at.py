@@ -0,0 +1,66 @@
+"""공지사항 목록 색인의 created_at을 정렬/커서 비교 식(마이크로초 고정 폭)으로 교체
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+from app.core.pagination import sortable_datetime_sql
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+PUBLISHED_WHERE = "status = 'PUBLISHED' AND is_active = 1"
+
+# (색인 이름, 교체할 컬럼 목록, 이전 컬럼 목록, 부분 색인 조건)
+INDEXES = [
+    (
+        "ix_notices_status_active_pinned_created",
+        ["status", "is_active", "is_pinned", sortable_datetime_sql("created_at")],
+        ["status", "is_active", "is_pinned", "created_at"],
+        None,
+    ),
+    (
+        "ix_notices_published",
+        ["is_pinned", sortable_datetime_sql("created_at"), "id", "updated_at"],
+        ["is_pinned", "created_at", "id", "updated_at"],
+        PUBLISHED_WHERE,
+    ),
+]
+
+
+def _index_sql(name: str):
+    """저장된 색인 생성문 (없으면 None, --sql 오프라인 모드에서는 빈 문자열)"""
+    if op.get_context().as_sql:
+        return ""
+    return op.get_bind().exec_driver_sql(
+        "SELECT sql FROM sqlite_master WHERE type = 'index' AND name = ?", (name,)
+    ).scalar()
+
+
+def _replace(name: str, columns: list, where, expression: bool):
+    sql = _index_sql(name)
+    # create_all로 새로 만든 데이터베이스는 이미 표현식 색인이므로 건너뜀
+    if sql is not None and sql and ("substr(" in sql) == expression:
+        return
+    if sql is not None:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.create_index(
+        name, "notices",
+        [sa.text(column) if column.startswith("(") else column for column in columns],
+        sqlite_where=sa.text(where) if where else None,
+    )
+
+
+def upgrade():
+    for name, columns, _, where in INDEXES:
+        _replace(name, columns, where, expression=True)
+    op.execute("ANALYZE")
+
+
+def downgrade():
+    for name, _, columns, where in INDEXES:
+        _replace(name, columns, where, expression=False)
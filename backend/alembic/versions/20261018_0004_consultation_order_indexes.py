@@ -0,0 +1,41 @@
+"""상담 신청 목록 정렬(id 순 / 최신순)에 맞춘 색인 추가
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# (색인 이름, 테이블, 컬럼)
+INDEXES = [
+    ("ix_consultations_user_id", "consultations", ["user_id"]),
+    ("ix_consultations_status_created", "consultations", ["status", "created_at", "id"]),
+    ("ix_consultations_created", "consultations", ["created_at", "id"]),
+]
+
+
+def _existing_indexes(table: str) -> set:
+    """이미 있는 색인 이름 (--sql 오프라인 모드에서는 확인할 수 없으므로 빈 집합)"""
+    if op.get_context().as_sql:
+        return set()
+    return {index["name"] for index in sa.inspect(op.get_bind()).get_indexes(table)}
+
+
+def upgrade():
+    # create_all로 새로 만든 데이터베이스에는 이미 색인이 있으므로 없는 것만 생성
+    for name, table, columns in INDEXES:
+        if name not in _existing_indexes(table):
+            op.create_index(name, table, columns)
+    op.execute("ANALYZE")
+
+
+def downgrade():
+    for name, table, _ in reversed(INDEXES):
+        if op.get_context().as_sql or name in _existing_indexes(table):
+            op.drop_index(name, table_name=table)
@@ -1,3 +1,3 @@
-from . import auth, consultations, counselors, reviews, notices
+from . import auth, consultations, counselors, reviews, notices, admin, search
 
-__all__ = ["auth", "consultations", "counselors", "reviews", "notices"]
+__all__ = ["auth", "consultations", "counselors", "reviews", "notices", "admin", "search"]
@@ -0,0 +1,380 @@
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional
+from datetime import datetime, timedelta
+from ..database import get_db, SessionLocal
+from ..models.consultation import Consultation, ConsultationStatus, ConsultationType
+from ..models.counselor import Counselor
+from ..models.user import User
+from ..models.stat_counter import StatCounter
+from ..core.totals import totals, TotalMode
+from ..core.auth_cache import Principal
+from ..core.cache import invalidate_tables, response_cache
+from ..dependencies import get_current_admin_user
+from ..services import stats_service, counselor_service
+from ..services.consultation_service import (
+    build_admin_consultation_query,
+    count_admin_consultations,
+    serialize_admin_consultation,
+    iter_admin_consultations_ndjson,
+)
+
+# 관리자 대시보드/샘플 데이터 API
+# 모두 동기 함수로 선언하여 스레드풀에서 실행되므로 이벤트 루프를 막지 않습니다.
+router = APIRouter(tags=["관리자"])
+
+# 개발용 테스트 엔드포인트 (/api 접두사 없이 등록)
+debug_router = APIRouter(tags=["관리자"])
+
+
+def build_sample_counselors() -> list:
+    """샘플 상담사 데이터 (시작 시 자동 삽입과 수동 삽입 API에서 공용)
+
+    평점/후기 수는 후기 트리거가 증분 계산하므로 후기 없이 임의 값을 넣지 않습니다 (기본값 0).
+    """
+    return [
+        Counselor(
+            name="김상담",
+            email="counselor1@suwon-healing.com",
+            phone="010-1000-1000",
+            specialization="개인상담",
+            education="서울대학교 심리학과 졸업",
+            experience="10년",
+            certification="상담심리사 1급",
+            bio="개인상담 전문가로서 다양한 심리적 어려움을 겪는 분들에게 따뜻한 마음으로 상담을 제공합니다.",
+            is_online=True,
+            is_active=True
+        ),
+        Counselor(
+            name="이치유",
+            email="counselor2@suwon-healing.com",
+            phone="010-2000-2000",
+            specialization="부부상담",
+            education="연세대학교 가족학과 졸업",
+            experience="8년",
+            certification="부부상담 전문가",
+            bio="부부 간 소통 문제와 갈등 해결에 특화되어 있습니다. 건강한 관계 회복을 돕습니다.",
+            is_online=True,
+            is_active=True
+        ),
+        Counselor(
+            name="박가족",
+            email="counselor3@suwon-healing.com",
+            phone="010-3000-3000",
+            specialization="가족상담",
+            education="고려대학교 아동가족학과 졸업",
+            experience="12년",
+            certification="가족상담사",
+            bio="가족 구성원 간의 이해와 소통을 돕고, 건강한 가족 관계를 만들어갑니다.",
+            is_online=True,
+            is_active=True
+        )
+    ]
+
+
+@debug_router.get("/test-counselors")
+def test_counselors(db: Session = Depends(get_db)):
+    """상담사 테스트 엔드포인트"""
+    try:
+        counselors = db.query(Counselor).all()
+        
+        return {
+            "message": "상담사 테스트",
+            "count": len(counselors),
+            "counselors": [
+                {
+                    "id": c.id,
+                    "name": c.name,
+                    "specialization": c.specialization,
+                    "rating": c.rating
+                } for c in counselors
+            ]
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.post("/insert-sample-data")
+def insert_sample_data(db: Session = Depends(get_db)):
+    """샘플 데이터 수동 삽입"""
+    try:
+        # 기존 데이터 확인
+        existing_count = db.query(Counselor).count()
+        if existing_count > 0:
+            return {"message": f"이미 {existing_count}명의 상담사가 있습니다."}
+        
+        # 샘플 상담사 데이터
+        sample_counselors = build_sample_counselors()
+        
+        for counselor in sample_counselors:
+            db.add(counselor)
+        
+        db.commit()
+        invalidate_tables(Counselor.__tablename__)
+        
+        return {
+            "message": "샘플 데이터 삽입 완료",
+            "inserted_count": len(sample_counselors)
+        }
+        
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.post("/insert-sample-consultations")
+def insert_sample_consultations(db: Session = Depends(get_db)):
+    """샘플 상담 신청 데이터 삽입"""
+    try:
+        # 기존 데이터 확인
+        existing_count = db.query(Consultation).count()
+        if existing_count > 0:
+            return {"message": f"이미 {existing_count}개의 상담 신청이 있습니다."}
+        
+        # 사용자와 상담사 확인
+        users = db.query(User).all()
+        counselors = db.query(Counselor).all()
+        
+        if not users or not counselors:
+            return {"error": "사용자나 상담사 데이터가 없습니다. 먼저 사용자와 상담사를 추가해주세요."}
+        
+        # 샘플 상담 신청 데이터
+        sample_consultations = [
+            Consultation(
+                user_id=users[0].id,
+                counselor_id=counselors[0].id,
+                consultation_date=datetime.now().date() + timedelta(days=7),
+                consultation_time=datetime.strptime("14:00", "%H:%M").time(),
+                consultation_type="INDIVIDUAL",
+                status="pending",
+                created_at=datetime.now()
+            ),
+            Consultation(
+                user_id=users[0].id,
+                counselor_id=counselors[1].id,
+                consultation_date=datetime.now().date() + timedelta(days=10),
+                consultation_time=datetime.strptime("16:00", "%H:%M").time(),
+                consultation_type="FAMILY",
+                status="confirmed",
+                created_at=datetime.now()
+            ),
+            Consultation(
+                user_id=users[0].id,
+                counselor_id=counselors[2].id,
+                consultation_date=datetime.now().date() + timedelta(days=14),
+                consultation_time=datetime.strptime("10:00", "%H:%M").time(),
+                consultation_type="COUPLE",
+                status="pending",
+                created_at=datetime.now()
+            )
+        ]
+        
+        for consultation in sample_consultations:
+            db.add(consultation)
+        
+        db.commit()
+        invalidate_tables(Consultation.__tablename__)
+        
+        return {
+            "message": "샘플 상담 신청 데이터 삽입 완료",
+            "inserted_count": len(sample_consultations)
+        }
+        
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.post("/insert-sample-users")
+def insert_sample_users(db: Session = Depends(get_db)):
+    """샘플 사용자 데이터 삽입"""
+    try:
+        # 기존 데이터 확인
+        existing_count = db.query(User).count()
+        if existing_count > 0:
+            return {"message": f"이미 {existing_count}명의 사용자가 있습니다."}
+        
+        # 샘플 사용자 데이터
+        sample_users = [
+            User(
+                email="user1@example.com",
+                full_name="김사용자",
+                phone="010-1111-1111",
+                is_active=True
+            ),
+            User(
+                email="user2@example.com",
+                full_name="이상담",
+                phone="010-2222-2222",
+                is_active=True
+            )
+        ]
+        
+        for user in sample_users:
+            db.add(user)
+        
+        db.commit()
+        
+        return {
+            "message": "샘플 사용자 데이터 삽입 완료",
+            "inserted_count": len(sample_users)
+        }
+        
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.get("/admin/stats")
+def get_admin_stats(db: Session = Depends(get_db)):
+    """관리자 대시보드 통계 (공개, 트리거로 관리되는 카운터 테이블에서 읽기만 함)"""
+    try:
+        return stats_service.get_admin_stats(db)
+        
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.post("/admin/stats/recompute")
+def recompute_admin_stats(
+    current_user: Principal = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """통계 카운터를 원본 테이블에서 다시 계산 (관리자만, 누적 오차 보정용)"""
+    stats_service.rebuild_stat_counters(db)
+    invalidate_tables(StatCounter.__tablename__)
+    
+    return stats_service.get_admin_stats(db)
+
+
+@router.get("/admin/cache-stats")
+def get_cache_stats(current_user: Principal = Depends(get_current_admin_user)):
+    """공개 조회 응답 캐시 적중/미스 지표 (관리자만)"""
+    return response_cache.snapshot()
+
+
+@router.get("/admin/counselors")
+def get_admin_counselors(db: Session = Depends(get_db)):
+    """관리자용 상담사 목록 (공개)"""
+    try:
+        counselors = db.query(Counselor).all()
+        
+        return {
+            "counselors": [
+                {
+                    "id": c.id,
+                    "name": c.name,
+                    "email": c.email,
+                    "specialization": c.specialization,
+                    "rating": c.rating,
+                    "total_reviews": c.total_reviews,
+                    "is_active": c.is_active,
+                    "is_online": c.is_online
+                } for c in counselors
+            ],
+            "total": len(counselors)
+        }
+        
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.post("/admin/counselors/reconcile-ratings")
+def reconcile_counselor_ratings(
+    current_user: Principal = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """상담사 평점/후기 수 일괄 재계산 (관리자만, 후기 테이블 기준)"""
+    try:
+        updated_count = counselor_service.reconcile_counselor_ratings(db)
+        if updated_count:
+            invalidate_tables(Counselor.__tablename__)
+        
+        return {
+            "message": "상담사 평점 재계산 완료",
+            "updated_count": updated_count
+        }
+        
+    except Exception as e:
+        return {"error": str(e)}
+
+
+@router.patch("/admin/users/{user_id}/toggle-status")
+def toggle_user_status(
+    user_id: int,
+    current_user: Principal = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """사용자 활성/비활성 상태 토글 (비활성화된 사용자는 캐시된 토큰으로도 인증되지 않음)"""
+    user = db.query(User).filter(User.id == user_id).first()
+    
+    if not user:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다."
+        )
+    
+    user.is_active = not user.is_active
+    db.commit()
+    # 인증 principal 캐시와 작성자 이름이 들어간 응답 캐시 무효화 (다른 워커 포함)
+    invalidate_tables(User.__tablename__)
+    
+    return {
+        "message": f"사용자가 {'활성화' if user.is_active else '비활성화'}되었습니다.",
+        "user_id": user_id,
+        "is_active": user.is_active
+    }
+
+
+@router.get("/admin/consultations")
+def get_admin_consultations(
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000, description="생략하면 전체 (기존 관리자 화면 호환)"),
+    status: Optional[ConsultationStatus] = None,
+    consultation_type: Optional[ConsultationType] = None,
+    counselor_id: Optional[int] = None,
+    stream: bool = False,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
+    current_user: Principal = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """관리자용 상담 신청 목록 (관리자만 - 사용자 연락처 포함)
+
+    사용자/상담사 정보를 JOIN 한 번으로 가져오며, stream=true이면 NDJSON으로 한 행씩 전송합니다.
+    limit을 주지 않으면 페이지를 나누지 않고 전체를 반환합니다.
+    """
+    filters = dict(status=status, consultation_type=consultation_type, counselor_id=counselor_id)
+    total = count_admin_consultations(db, total_mode=total_mode, **filters)
+
+    if stream:
+        def generate():
+            # 스트리밍은 응답 전송 중에 진행되므로 별도 세션 사용
+            stream_db = SessionLocal()
+            try:
+                query = _admin_consultation_page(stream_db, filters, skip, limit)
+                yield from iter_admin_consultations_ndjson(query)
+            finally:
+                stream_db.close()
+
+        return StreamingResponse(
+            generate(),
+            media_type="application/x-ndjson",
+            headers={"X-Total-Count": str(total)} if total is not None else None
+        )
+
+    rows = _admin_consultation_page(db, filters, skip, limit).all()
+
+    return {
+        "consultations": [serialize_admin_consultation(row) for row in rows],
+        "total": total,
+        "page": skip // limit + 1 if limit else 1,
+        "size": limit
+    }
+
+
+def _admin_consultation_page(db: Session, filters: dict, skip: int, limit: Optional[int]):
+    """관리자용 상담 신청 페이지 쿼리 (최신순, limit이 None이면 skip 이후 전체)"""
+    return (
+        build_admin_consultation_query(db, **filters)
+        .order_by(Consultation.created_at.desc(), Consultation.id.desc())
+        .offset(skip)
+        .limit(limit)
+    )
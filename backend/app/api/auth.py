@@ -1,35 +1,39 @@
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from ..database import get_db
-from ..core.security import verify_password, get_password_hash, create_access_token, create_refresh_token
+from ..core.password_pool import password_pool
+from ..core.security import create_access_token, create_refresh_token
 from ..models.user import User
 from ..schemas.user import UserCreate, UserLogin, Token, User as UserSchema
+from ..core.auth_cache import Principal
 from ..dependencies import get_current_active_user
 
 router = APIRouter(prefix="/auth", tags=["인증"])
 
 
-@router.post("/register", response_model=UserSchema)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
-    """사용자 회원가입"""
-    # 이메일 중복 확인
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
-    if existing_user:
+def _find_user_by_email(db: Session, email: str) -> Optional[User]:
+    return db.query(User).filter(User.email == email).first()
+
+
+def _check_duplicate_user(db: Session, user_data: UserCreate):
+    """이메일/사용자명 중복 확인"""
+    if _find_user_by_email(db, user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 등록된 이메일입니다."
         )
     
-    # 사용자명 중복 확인
     existing_username = db.query(User).filter(User.username == user_data.username).first()
     if existing_username:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="이미 사용 중인 사용자명입니다."
         )
-    
-    # 새 사용자 생성
-    hashed_password = get_password_hash(user_data.password)
+
+
+def _create_user(db: Session, user_data: UserCreate, hashed_password: str) -> User:
     db_user = User(
         email=user_data.email,
         username=user_data.username,
@@ -41,16 +45,36 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
-    
     return db_user
 
 
+def _update_password_hash(db: Session, user: User, hashed_password: str):
+    """bcrypt 비용이 바뀐 기존 해시를 새 해시로 교체"""
+    user.hashed_password = hashed_password
+    db.commit()
+
+
+# 비밀번호 해싱/검증은 전용 작업자 풀에서 실행하고, DB 작업만 스레드풀에서 실행
+@router.post("/register", response_model=UserSchema)
+async def register(user_data: UserCreate, db: Session = Depends(get_db)):
+    """사용자 회원가입"""
+    await run_in_threadpool(_check_duplicate_user, db, user_data)
+    
+    # 새 사용자 생성
+    hashed_password = await password_pool.hash(user_data.password)
+    return await run_in_threadpool(_create_user, db, user_data, hashed_password)
+
+
 @router.post("/login", response_model=Token)
-def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
+async def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
     """사용자 로그인"""
-    user = db.query(User).filter(User.email == user_credentials.email).first()
+    user = await run_in_threadpool(_find_user_by_email, db, user_credentials.email)
     
-    if not user or not verify_password(user_credentials.password, user.hashed_password):
+    verified, new_hash = (False, None)
+    if user:
+        verified, new_hash = await password_pool.verify(user_credentials.password, user.hashed_password)
+    
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="이메일 또는 비밀번호가 올바르지 않습니다.",
@@ -63,9 +87,14 @@ def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
             detail="비활성화된 계정입니다."
         )
     
+    # 설정한 bcrypt 비용이 바뀌었으면 검증에 성공한 비밀번호로 다시 해싱한 값을 저장
+    if new_hash:
+        await run_in_threadpool(_update_password_hash, db, user, new_hash)
+    
     # 토큰 생성
-    access_token = create_access_token(data={"sub": user.id})
-    refresh_token = create_refresh_token(data={"sub": user.id})
+    # JWT 표준상 sub는 문자열이어야 함 (정수면 디코딩 시 거절됨)
+    access_token = create_access_token(data={"sub": str(user.id)})
+    refresh_token = create_refresh_token(data={"sub": str(user.id)})
     
     return {
         "access_token": access_token,
@@ -75,9 +104,18 @@ def login(user_credentials: UserLogin, db: Session = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserSchema)
-def get_current_user_info(current_user: User = Depends(get_current_active_user)):
-    """현재 사용자 정보 조회"""
-    return current_user
+def get_current_user_info(
+    current_user: Principal = Depends(get_current_active_user),
+    db: Session = Depends(get_db)
+):
+    """현재 사용자 정보 조회 (인증은 권한 정보만 캐시하므로 전체 정보는 여기서 조회)"""
+    user = db.query(User).filter(User.id == current_user.id).first()
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="사용자를 찾을 수 없습니다."
+        )
+    return user
 
 
 @router.post("/refresh", response_model=Token)
@@ -92,7 +130,13 @@ def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
             detail="유효하지 않은 토큰입니다."
         )
     
-    user_id = payload.get("sub")
+    try:
+        user_id = int(payload["sub"])
+    except (TypeError, KeyError, ValueError):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="유효하지 않은 토큰입니다."
+        )
     user = db.query(User).filter(User.id == user_id).first()
     
     if not user or not user.is_active:
@@ -102,8 +146,8 @@ def refresh_token(refresh_token: str, db: Session = Depends(get_db)):
         )
     
     # 새 토큰 생성
-    access_token = create_access_token(data={"sub": user.id})
-    new_refresh_token = create_refresh_token(data={"sub": user.id})
+    access_token = create_access_token(data={"sub": str(user.id)})
+    new_refresh_token = create_refresh_token(data={"sub": str(user.id)})
     
     return {
         "access_token": access_token,
@@ -3,12 +3,18 @@ from sqlalchemy.orm import Session
 from typing import List, Optional
 from ..database import get_db
 from ..models.consultation import Consultation, ConsultationStatus
-from ..models.user import User
+from ..core.auth_cache import Principal
 from ..schemas.consultation import ConsultationCreate, ConsultationUpdate, Consultation as ConsultationSchema, ConsultationList
+from ..core.pagination import paginate
+from ..core.totals import totals, TotalMode
+from ..core.cache import invalidate_tables
 from ..dependencies import get_current_active_user, get_current_admin_user
 
 router = APIRouter(prefix="/consultations", tags=["상담 신청"])
 
+# 목록 정렬 키 (커서 페이지네이션 기준)
+CONSULTATION_SORT_KEY = [(Consultation.id, False)]
+
 
 @router.post("/", response_model=ConsultationSchema)
 def create_consultation(
@@ -24,6 +30,7 @@ def create_consultation(
     
     db.add(db_consultation)
     db.commit()
+    invalidate_tables(Consultation.__tablename__)
     db.refresh(db_consultation)
     
     return db_consultation
@@ -33,8 +40,10 @@ def create_consultation(
 def get_consultations(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
     status: Optional[ConsultationStatus] = None,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """사용자의 상담 신청 목록 조회"""
@@ -43,14 +52,20 @@ def get_consultations(
     if status:
         query = query.filter(Consultation.status == status)
     
-    total = query.count()
-    consultations = query.offset(skip).limit(limit).all()
+    total = totals.count(
+        query,
+        Consultation.__tablename__,
+        {"user_id": current_user.id, "status": status},
+        total_mode
+    )
+    consultations, next_cursor = paginate(query, CONSULTATION_SORT_KEY, skip, limit, cursor)
     
     return ConsultationList(
         consultations=consultations,
         total=total,
         page=skip // limit + 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 
@@ -58,6 +73,8 @@ def get_consultations(
 def get_public_consultations(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
     status: Optional[ConsultationStatus] = None,
     db: Session = Depends(get_db)
 ):
@@ -67,14 +84,20 @@ def get_public_consultations(
     if status:
         query = query.filter(Consultation.status == status)
     
-    total = query.count()
-    consultations = query.offset(skip).limit(limit).all()
+    total = totals.count(
+        query,
+        Consultation.__tablename__,
+        {"status": status},
+        total_mode
+    )
+    consultations, next_cursor = paginate(query, CONSULTATION_SORT_KEY, skip, limit, cursor)
     
     return ConsultationList(
         consultations=consultations,
         total=total,
         page=skip // limit + 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 
@@ -82,8 +105,10 @@ def get_public_consultations(
 def get_all_consultations(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
     status: Optional[ConsultationStatus] = None,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """관리자용 전체 상담 신청 목록 조회"""
@@ -92,21 +117,27 @@ def get_all_consultations(
     if status:
         query = query.filter(Consultation.status == status)
     
-    total = query.count()
-    consultations = query.offset(skip).limit(limit).all()
+    total = totals.count(
+        query,
+        Consultation.__tablename__,
+        {"status": status},
+        total_mode
+    )
+    consultations, next_cursor = paginate(query, CONSULTATION_SORT_KEY, skip, limit, cursor)
     
     return ConsultationList(
         consultations=consultations,
         total=total,
         page=skip // limit + 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/{consultation_id}", response_model=ConsultationSchema)
 def get_consultation(
     consultation_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """상담 신청 상세 조회"""
@@ -132,7 +163,7 @@ def get_consultation(
 def update_consultation(
     consultation_id: int,
     consultation_update: ConsultationUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """상담 신청 수정"""
@@ -163,6 +194,7 @@ def update_consultation(
         setattr(consultation, field, value)
     
     db.commit()
+    invalidate_tables(Consultation.__tablename__)
     db.refresh(consultation)
     
     return consultation
@@ -171,7 +203,7 @@ def update_consultation(
 @router.delete("/{consultation_id}")
 def delete_consultation(
     consultation_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """상담 신청 삭제"""
@@ -192,5 +224,6 @@ def delete_consultation(
     
     db.delete(consultation)
     db.commit()
+    invalidate_tables(Consultation.__tablename__)
     
     return {"message": "상담 신청이 삭제되었습니다."} 
\ No newline at end of file
@@ -1,30 +1,55 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query, File, UploadFile
+import base64
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 from typing import List, Optional
-import os
-import shutil
-from pathlib import Path
-from ..database import get_db
+from ..database import get_db, get_async_db
 from ..models.counselor import Counselor
-from ..models.user import User
+from ..core.auth_cache import Principal
+from ..models.stored_file import StoredFile
 from ..schemas.counselor import CounselorCreate, CounselorUpdate, Counselor as CounselorSchema, CounselorList
+from ..schemas.upload import UploadCompleteRequest, UploadPresignRequest, UploadPresignResponse, UploadResponse
+from ..services import counselor_service, file_service
+from ..services.file_service import profile_image_store
+from ..core.image_pipeline import image_pipeline
+from ..core.pagination import paginate_async
+from ..core.responses import list_response, schema_columns
+from ..services.search_service import search_conditions
+from ..core.totals import totals, TotalMode
+from ..core.content_store import CACHE_CONTROL_IMMUTABLE
+from ..core.uploads import IMAGE_EXTENSIONS, SNIFF_LENGTH, StoredUpload, receive_image_upload, sniff_image_type
+from ..core.cache import invalidate_tables
+from ..core.conditional import (
+    CACHE_CONTROL_DETAIL, CACHE_CONTROL_LIST, list_validator_async, make_validator, row_timestamp
+)
 from ..dependencies import get_current_active_user, get_current_admin_user
 
 router = APIRouter(prefix="/counselors", tags=["상담사"])
 
-# 업로드 폴더 설정
-UPLOAD_DIR = Path("uploads/profile_images")
-UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-
-# 허용된 이미지 타입
-ALLOWED_IMAGE_TYPES = ["image/jpeg", "image/png", "image/webp"]
+# 최대 이미지 크기 (허용 형식은 core.uploads.IMAGE_EXTENSIONS)
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
+# 목록 정렬 키 (커서 페이지네이션 기준)
+COUNSELOR_SORT_KEY = [(Counselor.id, False)]
+
+# 목록 응답 컬럼 (ORM 객체 대신 projection으로 조회)
+COUNSELOR_COLUMNS = schema_columns(Counselor, CounselorSchema)
+
+
+def counselor_list_statement():
+    """목록 조회문 - 썸네일 URL을 만들 프로필 이미지 변환본 manifest를 함께 조회"""
+    return (
+        select(*COUNSELOR_COLUMNS, StoredFile.variants.label("profile_variants"))
+        .outerjoin(StoredFile, StoredFile.url == Counselor.profile_image)
+    )
+
 
 @router.post("/", response_model=CounselorSchema)
 def create_counselor(
     counselor_data: CounselorCreate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """상담사 생성 (관리자만)"""
@@ -39,38 +64,61 @@ def create_counselor(
     db_counselor = Counselor(**counselor_data.dict())
     db.add(db_counselor)
     db.commit()
+    invalidate_tables(Counselor.__tablename__)
     db.refresh(db_counselor)
     
     return db_counselor
 
 
 @router.get("/", response_model=CounselorList)
-def get_counselors(
+async def get_counselors(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
     is_online: Optional[bool] = None,
     is_active: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    q: Optional[str] = Query(None, max_length=100, description="이름/전문 분야/소개 검색어"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """상담사 목록 조회"""
     try:
-        query = db.query(Counselor)
+        statement = counselor_list_statement()
         
         if is_online is not None:
-            query = query.filter(Counselor.is_online == is_online)
+            statement = statement.where(Counselor.is_online == is_online)
         
         if is_active is not None:
-            query = query.filter(Counselor.is_active == is_active)
+            statement = statement.where(Counselor.is_active == is_active)
+        
+        if q and q.strip():
+            statement = statement.where(*search_conditions(Counselor.__tablename__, q))
+        
+        # 변경이 없으면 페이지 조회 없이 304 응답
+        validator = await list_validator_async(
+            db, request, statement, [row_timestamp(Counselor)], [Counselor.__tablename__]
+        )
+        if validator.is_not_modified(request):
+            return validator.not_modified_response(CACHE_CONTROL_LIST)
         
-        total = query.count()
-        counselors = query.offset(skip).limit(limit).all()
+        total = await totals.count_async(
+            db,
+            statement,
+            Counselor.__tablename__,
+            {"is_online": is_online, "is_active": is_active, "q": q},
+            total_mode
+        )
+        counselors, next_cursor = await paginate_async(db, statement, COUNSELOR_SORT_KEY, skip, limit, cursor)
         
-        return CounselorList(
-            counselors=counselors,
-            total=total,
-            page=skip // limit + 1,
-            size=limit
+        # 검증된 DB 행이므로 스키마 재검증 없이 바로 직렬화
+        return list_response(
+            "counselors", counselors, total, skip, limit, next_cursor,
+            headers=validator.headers(CACHE_CONTROL_LIST),
+            extend=counselor_service.add_profile_thumbnail
         )
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"상담사 목록 조회 오류: {e}")
         raise HTTPException(
@@ -80,32 +128,49 @@ def get_counselors(
 
 
 @router.get("/online", response_model=CounselorList)
-def get_online_counselors(
+async def get_online_counselors(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
-    db: Session = Depends(get_db)
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """온라인 상담사 목록 조회"""
-    query = db.query(Counselor).filter(Counselor.is_online == True, Counselor.is_active == True)
+    statement = counselor_list_statement().where(Counselor.is_online == True, Counselor.is_active == True)
     
-    total = query.count()
-    counselors = query.offset(skip).limit(limit).all()
+    validator = await list_validator_async(
+        db, request, statement, [row_timestamp(Counselor)], [Counselor.__tablename__]
+    )
+    if validator.is_not_modified(request):
+        return validator.not_modified_response(CACHE_CONTROL_LIST)
     
-    return CounselorList(
-        counselors=counselors,
-        total=total,
-        page=skip // limit + 1,
-        size=limit
+    total = await totals.count_async(
+        db,
+        statement,
+        Counselor.__tablename__,
+        {"is_online": True, "is_active": True},
+        total_mode
+    )
+    counselors, next_cursor = await paginate_async(db, statement, COUNSELOR_SORT_KEY, skip, limit, cursor)
+    
+    # 검증된 DB 행이므로 스키마 재검증 없이 바로 직렬화
+    return list_response(
+        "counselors", counselors, total, skip, limit, next_cursor,
+        headers=validator.headers(CACHE_CONTROL_LIST),
+        extend=counselor_service.add_profile_thumbnail
     )
 
 
 @router.get("/{counselor_id}", response_model=CounselorSchema)
-def get_counselor(
+async def get_counselor(
     counselor_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """상담사 상세 조회"""
-    counselor = db.query(Counselor).filter(Counselor.id == counselor_id).first()
+    counselor = await db.get(Counselor, counselor_id)
     
     if not counselor:
         raise HTTPException(
@@ -113,6 +178,11 @@ def get_counselor(
             detail="상담사를 찾을 수 없습니다."
         )
     
+    validator = make_validator(request, counselor.updated_at or counselor.created_at)
+    if validator.is_not_modified(request):
+        return validator.not_modified_response(CACHE_CONTROL_DETAIL)
+    validator.apply(response, CACHE_CONTROL_DETAIL)
+    
     return counselor
 
 
@@ -120,7 +190,7 @@ def get_counselor(
 def update_counselor(
     counselor_id: int,
     counselor_update: CounselorUpdate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """상담사 정보 수정 (관리자만)"""
@@ -137,6 +207,7 @@ def update_counselor(
         setattr(counselor, field, value)
     
     db.commit()
+    invalidate_tables(Counselor.__tablename__)
     db.refresh(counselor)
     
     return counselor
@@ -145,7 +216,7 @@ def update_counselor(
 @router.delete("/{counselor_id}")
 def delete_counselor(
     counselor_id: int,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """상담사 삭제 (관리자만)"""
@@ -159,6 +230,7 @@ def delete_counselor(
     
     db.delete(counselor)
     db.commit()
+    invalidate_tables(Counselor.__tablename__)
     
     return {"message": "상담사가 삭제되었습니다."} 
 
@@ -181,6 +253,7 @@ def toggle_counselor_status(
     # 상태 토글
     counselor.is_active = not counselor.is_active
     db.commit()
+    invalidate_tables(Counselor.__tablename__)
     db.refresh(counselor)
     
     return {
@@ -190,53 +263,154 @@ def toggle_counselor_status(
     } 
 
 
-@router.post("/upload-image")
-async def upload_profile_image(
-    file: UploadFile = File(...),
-    db: Session = Depends(get_db)
-):
-    """프로필 이미지 업로드"""
-    try:
-        # 파일 타입 검증
-        if file.content_type not in ALLOWED_IMAGE_TYPES:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="지원되지 않는 파일 형식입니다. JPG, PNG, WebP만 허용됩니다."
-            )
-        
-        # 파일 크기 검증
-        file_size = 0
-        file.file.seek(0, 2)  # 파일 끝으로 이동
-        file_size = file.file.tell()
-        file.file.seek(0)  # 파일 시작으로 복귀
-        
-        if file_size > MAX_FILE_SIZE:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="파일 크기가 너무 큽니다. 5MB 이하만 허용됩니다."
-            )
-        
-        # 파일명 생성 (중복 방지)
-        file_extension = file.filename.split(".")[-1]
-        import uuid
-        unique_filename = f"{uuid.uuid4()}.{file_extension}"
-        file_path = UPLOAD_DIR / unique_filename
-        
-        # 파일 저장
-        with open(file_path, "wb") as buffer:
-            shutil.copyfileobj(file.file, buffer)
-        
-        # 상대 경로 반환 (프론트엔드에서 접근 가능한 형태)
-        relative_path = f"/uploads/profile_images/{unique_filename}"
-        
-        return {
-            "message": "이미지가 성공적으로 업로드되었습니다.",
-            "image_url": relative_path,
-            "filename": unique_filename
+@router.post(
+    "/upload-image",
+    response_model=UploadResponse,
+    # 본문을 직접 스트리밍으로 읽으므로 문서용 요청 스키마만 명시
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "multipart/form-data": {
+                    "schema": {
+                        "type": "object",
+                        "properties": {"file": {"type": "string", "format": "binary"}},
+                        "required": ["file"],
+                    }
+                }
+            },
         }
-        
+    },
+)
+async def upload_profile_image(request: Request, db: Session = Depends(get_db)):
+    """프로필 이미지 업로드 (청크 단위로 받으며 크기 초과 시 즉시 중단)
+
+    파일 이름은 내용의 SHA-256이므로 같은 사진을 다시 올리면 기존 파일과 URL을 그대로 재사용합니다.
+    """
+    try:
+        stored = await receive_image_upload(request, profile_image_store, MAX_FILE_SIZE)
+        has_variants = await run_in_threadpool(file_service.register_upload, db, profile_image_store, stored)
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"이미지 업로드에 실패했습니다: {str(e)}"
-        ) 
\ No newline at end of file
+        )
+    
+    # 크기별 변환본은 백그라운드에서 생성 (응답은 기다리지 않음, 이미 변환된 내용이면 생략)
+    if not has_variants:
+        image_pipeline.submit(stored.key, counselor_service.on_profile_variants_ready)
+    
+    return _upload_response(stored.filename)
+
+
+def _upload_response(filename: str) -> dict:
+    return {
+        "message": "이미지가 성공적으로 업로드되었습니다.",
+        "image_url": profile_image_store.url(filename),
+        "filename": filename
+    }
+
+
+def _image_extension(content_type: str) -> str:
+    extension = IMAGE_EXTENSIONS.get(content_type)
+    if extension is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="지원되지 않는 파일 형식입니다. JPG, PNG, WebP만 허용됩니다."
+        )
+    return extension
+
+
+@router.post("/upload-image/presign", response_model=UploadPresignResponse)
+def presign_profile_image(
+    upload: UploadPresignRequest,
+    current_user: Principal = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """프로필 이미지 직접 업로드 URL 발급 (관리자만, S3 저장소 전용)
+
+    서명에 크기/형식/SHA-256이 포함되므로 버킷은 선언한 내용과 다른 파일을 거절합니다.
+    업로드 후 /upload-image/complete로 등록해야 목록과 변환본에 반영됩니다.
+    """
+    extension = _image_extension(upload.content_type)
+    if upload.size > MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"파일 크기가 너무 큽니다. {MAX_FILE_SIZE // (1024 * 1024)}MB 이하만 허용됩니다."
+        )
+    
+    # 같은 내용이 이미 있으면 업로드 없이 기존 URL 재사용
+    existing = file_service.find_upload(db, upload.sha256)
+    if existing is not None:
+        return {"exists": True, "image_url": existing.url}
+    
+    filename = profile_image_store.filename(upload.sha256, extension)
+    presigned = profile_image_store.storage.presign_upload(
+        profile_image_store.key(filename),
+        upload.content_type,
+        upload.size,
+        base64.b64encode(bytes.fromhex(upload.sha256)).decode("ascii"),
+        CACHE_CONTROL_IMMUTABLE,
+    )
+    if presigned is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="현재 저장소는 직접 업로드를 지원하지 않습니다. /counselors/upload-image를 사용하세요."
+        )
+    
+    return {
+        "exists": False,
+        "image_url": profile_image_store.url(filename),
+        "method": presigned["method"],
+        "upload_url": presigned["url"],
+        "headers": presigned["headers"],
+        "expires_in": presigned["expires_in"],
+    }
+
+
+@router.post("/upload-image/complete", response_model=UploadResponse)
+def complete_profile_image_upload(
+    upload: UploadCompleteRequest,
+    current_user: Principal = Depends(get_current_admin_user),
+    db: Session = Depends(get_db)
+):
+    """버킷에 직접 올린 프로필 이미지 등록 (관리자만, 크기/형식을 확인하고 변환 예약)
+
+    검사를 통과하지 못한 객체는 삭제하므로 다른 프로필 쓰기 API와 같이 관리자만 호출할 수 있습니다.
+    """
+    extension = _image_extension(upload.content_type)
+    filename = profile_image_store.filename(upload.sha256, extension)
+    if file_service.find_upload(db, upload.sha256) is not None:
+        return _upload_response(filename)
+    
+    storage = profile_image_store.storage
+    key = profile_image_store.key(filename)
+    obj = storage.head(key)
+    if obj is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="업로드된 파일을 찾을 수 없습니다."
+        )
+    
+    # 서명 범위 밖에서 올라온 파일일 수 있으므로 크기와 시그니처를 다시 확인
+    if obj.size > MAX_FILE_SIZE or sniff_image_type(storage.read_range(key, 0, SNIFF_LENGTH)) != upload.content_type:
+        storage.delete(key)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="업로드된 파일이 이미지 형식이 아니거나 허용 크기를 넘습니다."
+        )
+    
+    stored = StoredUpload(
+        filename=filename,
+        key=key,
+        size=obj.size,
+        content_type=upload.content_type,
+        digest=upload.sha256,
+        created=True,
+    )
+    if not file_service.register_upload(db, profile_image_store, stored):
+        image_pipeline.submit(key, counselor_service.on_profile_variants_ready)
+    
+    return _upload_response(filename)
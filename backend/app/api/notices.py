@@ -1,19 +1,36 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_db, get_read_db, get_async_db
 from ..models.notice import Notice, NoticeType, NoticeStatus
-from ..models.user import User
+from ..core.auth_cache import Principal
 from ..schemas.notice import NoticeCreate, NoticeUpdate, Notice as NoticeSchema, NoticeList
+from ..core.pagination import paginate, paginate_async
+from ..core.responses import list_response, schema_columns
+from ..services.search_service import search_conditions
+from ..core.totals import totals, TotalMode
+from ..core.cache import invalidate_tables
+from ..core.conditional import (
+    CACHE_CONTROL_LIST, CACHE_CONTROL_REVALIDATE, list_validator_async, make_validator, row_timestamp
+)
+from ..services.notice_service import notice_view_counter
 from ..dependencies import get_current_active_user, get_current_admin_user
 
 router = APIRouter(prefix="/notices", tags=["공지사항"])
 
+# 고정된 공지사항을 먼저, 그 다음 최신순으로 정렬
+NOTICE_SORT_KEY = [(Notice.is_pinned, True), (Notice.created_at, True), (Notice.id, True)]
+
+# 목록 응답 컬럼 (ORM 객체 대신 projection으로 조회)
+NOTICE_COLUMNS = schema_columns(Notice, NoticeSchema)
+
 
 @router.post("/", response_model=NoticeSchema)
 def create_notice(
     notice_data: NoticeCreate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """공지사항 작성 (관리자만)"""
@@ -24,6 +41,7 @@ def create_notice(
     
     db.add(db_notice)
     db.commit()
+    invalidate_tables(Notice.__tablename__)
     db.refresh(db_notice)
     
     return db_notice
@@ -33,11 +51,13 @@ def create_notice(
 def get_notices(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
     notice_type: Optional[NoticeType] = None,
     status: Optional[NoticeStatus] = None,
     is_pinned: Optional[bool] = None,
     is_active: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """공지사항 목록 조회"""
     query = db.query(Notice)
@@ -54,57 +74,78 @@ def get_notices(
     if is_active is not None:
         query = query.filter(Notice.is_active == is_active)
     
-    # 고정된 공지사항을 먼저, 그 다음 최신순으로 정렬
-    query = query.order_by(Notice.is_pinned.desc(), Notice.created_at.desc())
-    
-    total = query.count()
-    notices = query.offset(skip).limit(limit).all()
+    total = totals.count(
+        query,
+        Notice.__tablename__,
+        {"notice_type": notice_type, "status": status, "is_pinned": is_pinned, "is_active": is_active},
+        total_mode
+    )
+    notices, next_cursor = paginate(query, NOTICE_SORT_KEY, skip, limit, cursor)
     
     return NoticeList(
         notices=notices,
         total=total,
         page=skip // limit + 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/published", response_model=NoticeList)
-def get_published_notices(
+async def get_published_notices(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(TotalMode.ESTIMATE, alias="total"),
     notice_type: Optional[NoticeType] = None,
-    db: Session = Depends(get_db)
+    q: Optional[str] = Query(None, max_length=100, description="제목/내용 검색어"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """발행된 공지사항 목록 조회"""
-    query = db.query(Notice).filter(
+    statement = select(*NOTICE_COLUMNS).where(
         Notice.status == NoticeStatus.PUBLISHED,
         Notice.is_active == True
     )
     
     if notice_type:
-        query = query.filter(Notice.notice_type == notice_type)
+        statement = statement.where(Notice.notice_type == notice_type)
     
-    # 고정된 공지사항을 먼저, 그 다음 최신순으로 정렬
-    query = query.order_by(Notice.is_pinned.desc(), Notice.created_at.desc())
+    if q and q.strip():
+        statement = statement.where(*search_conditions(Notice.__tablename__, q))
     
-    total = query.count()
-    notices = query.offset(skip).limit(limit).all()
+    # 목록의 조회수는 근사값이므로 검증자에 포함하지 않음
+    validator = await list_validator_async(
+        db, request, statement, [row_timestamp(Notice)], [Notice.__tablename__]
+    )
+    if validator.is_not_modified(request):
+        return validator.not_modified_response(CACHE_CONTROL_LIST)
+    
+    total = await totals.count_async(
+        db,
+        statement,
+        Notice.__tablename__,
+        {"notice_type": notice_type, "status": NoticeStatus.PUBLISHED, "is_active": True, "q": q},
+        total_mode
+    )
+    notices, next_cursor = await paginate_async(db, statement, NOTICE_SORT_KEY, skip, limit, cursor)
     
-    return NoticeList(
-        notices=notices,
-        total=total,
-        page=skip // limit + 1,
-        size=limit
+    # 검증된 DB 행이므로 스키마 재검증 없이 바로 직렬화
+    return list_response(
+        "notices", notices, total, skip, limit, next_cursor,
+        headers=validator.headers(CACHE_CONTROL_LIST)
     )
 
 
 @router.get("/{notice_id}", response_model=NoticeSchema)
-def get_notice(
+async def get_notice(
     notice_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """공지사항 상세 조회"""
-    notice = db.query(Notice).filter(Notice.id == notice_id).first()
+    notice = await db.get(Notice, notice_id)
     
     if not notice:
         raise HTTPException(
@@ -112,18 +153,25 @@ def get_notice(
             detail="공지사항을 찾을 수 없습니다."
         )
     
-    # 조회수 증가
-    notice.view_count += 1
-    db.commit()
+    # 조회수 증가 (버퍼에 누적 후 주기적으로 반영) - 304 응답도 조회로 기록
+    pending_views = notice_view_counter.record(notice.id)
     
-    return notice
+    # 조회수는 매번 바뀌므로 검증자는 내용 변경 시각만 사용 (no-cache로 매번 재검증)
+    validator = make_validator(request, notice.updated_at or notice.created_at)
+    if validator.is_not_modified(request):
+        return validator.not_modified_response(CACHE_CONTROL_REVALIDATE)
+    validator.apply(response, CACHE_CONTROL_REVALIDATE)
+    
+    notice_response = NoticeSchema.model_validate(notice)
+    notice_response.view_count += pending_views
+    return notice_response
 
 
 @router.put("/{notice_id}", response_model=NoticeSchema)
 def update_notice(
     notice_id: int,
     notice_update: NoticeUpdate,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """공지사항 수정 (관리자만)"""
@@ -140,6 +188,7 @@ def update_notice(
         setattr(notice, field, value)
     
     db.commit()
+    invalidate_tables(Notice.__tablename__)
     db.refresh(notice)
     
     return notice
@@ -148,7 +197,7 @@ def update_notice(
 @router.delete("/{notice_id}")
 def delete_notice(
     notice_id: int,
-    current_user: User = Depends(get_current_admin_user),
+    current_user: Principal = Depends(get_current_admin_user),
     db: Session = Depends(get_db)
 ):
     """공지사항 삭제 (관리자만)"""
@@ -162,5 +211,6 @@ def delete_notice(
     
     db.delete(notice)
     db.commit()
+    invalidate_tables(Notice.__tablename__)
     
     return {"message": "공지사항이 삭제되었습니다."} 
\ No newline at end of file
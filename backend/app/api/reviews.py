@@ -1,19 +1,35 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from ..database import get_db
+from ..database import get_db, get_read_db, get_async_db
 from ..models.review import Review
 from ..models.user import User
+from ..models.counselor import Counselor
 from ..schemas.review import ReviewCreate, ReviewUpdate, Review as ReviewSchema, ReviewList
+from ..core.pagination import paginate, paginate_async
+from ..core.responses import list_response
+from ..core.totals import totals, TotalMode
+from ..core.cache import invalidate_tables
+from ..core.conditional import (
+    CACHE_CONTROL_DETAIL, CACHE_CONTROL_LIST, list_validator_async, make_validator, row_timestamp
+)
+from ..services.review_service import public_review_statement
+from ..services.search_service import search_conditions
+from ..core.auth_cache import Principal
 from ..dependencies import get_current_active_user, get_current_admin_user
 
 router = APIRouter(prefix="/reviews", tags=["후기"])
 
+# 목록 정렬 키 (커서 페이지네이션 기준)
+REVIEW_SORT_KEY = [(Review.id, False)]
+
 
 @router.post("/", response_model=ReviewSchema)
 def create_review(
     review_data: ReviewCreate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """후기 작성"""
@@ -31,6 +47,7 @@ def create_review(
     
     db.add(db_review)
     db.commit()
+    invalidate_tables(Review.__tablename__, Counselor.__tablename__)
     db.refresh(db_review)
     
     return db_review
@@ -40,10 +57,12 @@ def create_review(
 def get_reviews(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(None, alias="total"),
     counselor_id: Optional[int] = None,
     is_approved: Optional[bool] = None,
     is_active: Optional[bool] = None,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """후기 목록 조회"""
     query = db.query(Review)
@@ -57,70 +76,86 @@ def get_reviews(
     if is_active is not None:
         query = query.filter(Review.is_active == is_active)
     
-    total = query.count()
-    reviews = query.offset(skip).limit(limit).all()
+    total = totals.count(
+        query,
+        Review.__tablename__,
+        {"counselor_id": counselor_id, "is_approved": is_approved, "is_active": is_active},
+        total_mode
+    )
+    reviews, next_cursor = paginate(query, REVIEW_SORT_KEY, skip, limit, cursor)
     
     return ReviewList(
         reviews=reviews,
         total=total,
         page=skip // limit + 1,
-        size=limit
+        size=limit,
+        next_cursor=next_cursor
     )
 
 
 @router.get("/approved", response_model=ReviewList)
-def get_approved_reviews(
+async def get_approved_reviews(
+    request: Request,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=100),
+    cursor: Optional[str] = None,
+    total_mode: Optional[TotalMode] = Query(TotalMode.ESTIMATE, alias="total"),
     counselor_id: Optional[int] = None,
-    db: Session = Depends(get_db)
+    q: Optional[str] = Query(None, max_length=100, description="제목/내용 검색어"),
+    db: AsyncSession = Depends(get_async_db)
 ):
     """승인된 후기 목록 조회"""
-    query = db.query(Review).filter(Review.is_approved == True, Review.is_active == True)
+    conditions = [Review.is_approved == True, Review.is_active == True]
     
     if counselor_id:
-        query = query.filter(Review.counselor_id == counselor_id)
+        conditions.append(Review.counselor_id == counselor_id)
     
-    total = query.count()
-    reviews = query.offset(skip).limit(limit).all()
-    
-    # 작성자와 상담사 정보 추가
-    for review in reviews:
-        # 작성자 정보 (익명 처리)
-        if review.user and not review.is_anonymous:
-            author_name = review.user.full_name
-            if author_name:
-                # 이름을 익명 처리 (예: "홍길동" -> "홍**")
-                if len(author_name) >= 2:
-                    review.author_name = author_name[0] + "**"
-                else:
-                    review.author_name = author_name + "**"
-        else:
-            review.author_name = "익명"
-        
-        # 상담사 정보
-        if review.counselor:
-            review.counselor_name = review.counselor.name
+    if q and q.strip():
+        conditions.extend(search_conditions(Review.__tablename__, q))
     
-    return ReviewList(
-        reviews=reviews,
-        total=total,
-        page=skip // limit + 1,
-        size=limit
+    # 작성자 익명 처리와 상담사 이름을 포함한 projection 한 번으로 조회
+    statement = public_review_statement().where(*conditions)
+    
+    # 후기와 JOIN한 상담사/작성자 중 하나라도 바뀌었으면 새로 응답
+    validator = await list_validator_async(
+        db, request, statement, [row_timestamp(Review), Counselor.updated_at, User.updated_at],
+        [Review.__tablename__, Counselor.__tablename__, User.__tablename__]
+    )
+    if validator.is_not_modified(request):
+        return validator.not_modified_response(CACHE_CONTROL_LIST)
+    
+    total = await totals.count_async(
+        db,
+        select(Review.id).where(*conditions),
+        Review.__tablename__,
+        {"counselor_id": counselor_id, "is_approved": True, "is_active": True, "q": q},
+        total_mode
+    )
+    reviews, next_cursor = await paginate_async(db, statement, REVIEW_SORT_KEY, skip, limit, cursor)
+    
+    # 검증된 DB 행이므로 스키마 재검증 없이 바로 직렬화
+    return list_response(
+        "reviews", reviews, total, skip, limit, next_cursor,
+        headers=validator.headers(CACHE_CONTROL_LIST)
     )
 
 
 @router.get("/{review_id}", response_model=ReviewSchema)
-def get_review(
+async def get_review(
     review_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """후기 상세 조회 (승인된 후기만)"""
-    review = db.query(Review).filter(
-        Review.id == review_id,
-        Review.is_approved == True,
-        Review.is_active == True
-    ).first()
+    result = await db.execute(
+        public_review_statement().where(
+            Review.id == review_id,
+            Review.is_approved == True,
+            Review.is_active == True
+        )
+    )
+    review = result.first()
     
     if not review:
         raise HTTPException(
@@ -128,22 +163,10 @@ def get_review(
             detail="후기를 찾을 수 없습니다."
         )
     
-    # 작성자와 상담사 정보 추가
-    # 작성자 정보 (익명 처리)
-    if review.user and not review.is_anonymous:
-        author_name = review.user.full_name
-        if author_name:
-            # 이름을 익명 처리 (예: "홍길동" -> "홍**")
-            if len(author_name) >= 2:
-                review.author_name = author_name[0] + "**"
-            else:
-                review.author_name = author_name + "**"
-    else:
-        review.author_name = "익명"
-    
-    # 상담사 정보
-    if review.counselor:
-        review.counselor_name = review.counselor.name
+    validator = make_validator(request, review.updated_at or review.created_at, review.author_name, review.counselor_name)
+    if validator.is_not_modified(request):
+        return validator.not_modified_response(CACHE_CONTROL_DETAIL)
+    validator.apply(response, CACHE_CONTROL_DETAIL)
     
     return review
 
@@ -152,7 +175,7 @@ def get_review(
 def update_review(
     review_id: int,
     review_update: ReviewUpdate,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """후기 수정"""
@@ -183,6 +206,7 @@ def update_review(
         setattr(review, field, value)
     
     db.commit()
+    invalidate_tables(Review.__tablename__, Counselor.__tablename__)
     db.refresh(review)
     
     return review
@@ -191,7 +215,7 @@ def update_review(
 @router.delete("/{review_id}")
 def delete_review(
     review_id: int,
-    current_user: User = Depends(get_current_active_user),
+    current_user: Principal = Depends(get_current_active_user),
     db: Session = Depends(get_db)
 ):
     """후기 삭제"""
@@ -212,5 +236,6 @@ def delete_review(
     
     db.delete(review)
     db.commit()
+    invalidate_tables(Review.__tablename__, Counselor.__tablename__)
     
     return {"message": "후기가 삭제되었습니다."} 
\ No newline at end of file
@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import get_async_db
+from ..schemas.search import SearchResponse
+from ..services import search_service
+
+router = APIRouter(prefix="/search", tags=["검색"])
+
+
+@router.get("", response_model=SearchResponse)
+async def search(
+    q: str = Query(..., min_length=1, max_length=100),
+    types: str = Query("notices,counselors,reviews", description="검색 대상 (쉼표로 구분)"),
+    limit: int = Query(5, ge=1, le=50),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """공지사항/상담사/후기 통합 검색 (관련도 순, 검색어 하이라이트 포함)"""
+    sources = [source.strip() for source in types.split(",") if source.strip()]
+    unknown = [source for source in sources if source not in search_service.SEARCH_TARGETS]
+    if unknown or not sources:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"지원하지 않는 검색 대상입니다: {', '.join(unknown)}"
+        )
+    
+    results = await search_service.search(db, q, sources, limit)
+    return SearchResponse(query=q, results=results)
@@ -16,9 +16,27 @@ class Settings(BaseSettings):
     DATABASE_AUTH_TOKEN: str = ""  # 빈 문자열로 설정하여 Turso 비활성화
     DATABASE_FALLBACK_URL: str = "sqlite:///./suwon_healing.db"
     DATABASE_TEST_URL: str = "sqlite:///./suwon_healing_test.db"
+    DATABASE_READ_URL: str = ""  # 읽기 복제본 URL (비어 있으면 로컬 파일을 읽기 전용으로 연결)
+    
+    # SQLite 엔진 프로파일 (연결마다 PRAGMA 적용)
+    SQLITE_JOURNAL_MODE: str = "WAL"  # 읽기가 쓰기에 막히지 않도록 WAL 사용
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # WAL에서는 NORMAL로도 충분히 안전
+    SQLITE_BUSY_TIMEOUT: int = 5000  # 쓰기 잠금 대기 시간 (ms)
+    SQLITE_CACHE_SIZE: int = -64000  # 음수는 KiB 단위 (약 64MB)
+    SQLITE_MMAP_SIZE: int = 268435456  # 256MB
+    SQLITE_TEMP_STORE: str = "MEMORY"
+    
+    # 커넥션 풀 설정 (uvicorn 스레드풀 기본 40개에 맞춤)
+    DATABASE_POOL_SIZE: int = 40
+    DATABASE_READ_POOL_SIZE: int = 40
+    DATABASE_MAX_OVERFLOW: int = 10
+    DATABASE_POOL_TIMEOUT: int = 30
     
     # Redis 설정
-    REDIS_URL: str = "redis://localhost:6379"
+    REDIS_URL: str = ""  # 예: redis://localhost:6379 - 비워 두면 공유 캐시(L2) 미사용
+    REDIS_CACHE_PREFIX: str = "swh:"
+    REDIS_SOCKET_TIMEOUT: float = 0.2
+    REDIS_RETRY_INTERVAL: float = 30.0
     
     # 보안 설정 (환경 변수로 받음)
     SECRET_KEY: str = "your-super-secret-key-here-change-in-production"
@@ -26,6 +44,37 @@ class Settings(BaseSettings):
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
+    # 인증 캐시 설정 (토큰 검증 결과/사용자 권한 정보 보관 시간, 초)
+    AUTH_TOKEN_CACHE_TTL: int = 300
+    AUTH_PRINCIPAL_CACHE_TTL: int = 30
+    AUTH_CACHE_MAX_ENTRIES: int = 4096
+    
+    # 비밀번호 해싱 설정 (bcrypt 비용을 바꾸면 다음 로그인 때 새 비용으로 다시 해싱)
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_EXECUTOR: str = "process"  # process | thread (프로세스를 띄울 수 없는 환경)
+    PASSWORD_HASH_WORKERS: int = 0  # 0이면 CPU 코어 수
+    PASSWORD_HASH_MAX_PENDING: int = 0  # 대기+처리 중 작업 상한 (0이면 작업자 수 x 4), 초과 시 503
+    PASSWORD_HASH_RETRY_AFTER: int = 1  # 503 응답의 Retry-After (초)
+
+    # 이미지 변환 설정 (업로드 후 백그라운드에서 크기별/형식별 변환본 생성)
+    IMAGE_VARIANT_SIZES: List[int] = [64, 256, 768]  # 긴 변 기준 px (원본보다 크게 늘리지 않음)
+    IMAGE_VARIANT_FORMATS: List[str] = ["webp", "avif"]  # Pillow가 지원하지 않는 형식은 건너뜀
+    IMAGE_VARIANT_QUALITY: int = 80
+    IMAGE_THUMBNAIL_SIZE: int = 64  # 목록 응답이 가리키는 변환본 크기
+    IMAGE_MAX_PIXELS: int = 40_000_000  # 이보다 큰 이미지는 변환하지 않음 (압축 폭탄 방지)
+    IMAGE_PIPELINE_EXECUTOR: str = "process"  # process | thread
+    IMAGE_PIPELINE_WORKERS: int = 1
+
+    # 업로드 파일 저장소 설정 (내용 주소 이름, 참조 없는 파일은 gc_uploads.py로 정리)
+    STORAGE_BACKEND: str = "local"  # local (UPLOAD_DIR) | s3 (AWS_S3_BUCKET, 여러 서버가 같은 파일 공유)
+    STORAGE_LOCAL_URL: str = "/uploads"  # local 저장소 파일의 URL 접두사
+    UPLOAD_GC_GRACE_HOURS: int = 24  # 업로드 후 아직 저장(참조)되지 않은 파일을 남겨 두는 시간
+    STATIC_IMMUTABLE_MAX_AGE: int = 31536000  # 내용 주소 정적 파일 캐시 기간 (초, 1년)
+    STATIC_STAT_CACHE_TTL: float = 5.0  # 정적 파일 stat 결과 재사용 시간 (초)
+    STATIC_STAT_CACHE_ENTRIES: int = 4096
+    STATIC_SMALL_FILE_MAX_SIZE: int = 64 * 1024  # 이 크기 이하 파일은 본문을 메모리에 보관
+    STATIC_MEMORY_CACHE_BYTES: int = 32 * 1024 * 1024  # 메모리에 보관하는 본문 총량 상한
+    
     # CORS 설정 (환경 변수로 받음)
     CORS_ORIGINS: Union[str, List[str]] = [
         "http://localhost:3000", 
@@ -47,6 +96,10 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: Optional[str] = None
     AWS_REGION: str = "ap-northeast-2"
     AWS_S3_BUCKET: Optional[str] = None
+    AWS_S3_ENDPOINT_URL: Optional[str] = None  # MinIO 등 S3 호환 저장소 주소
+    AWS_S3_PUBLIC_URL: Optional[str] = None  # 응답 URL 접두사 (CDN 등, 비우면 버킷 주소)
+    AWS_S3_MAX_POOL_CONNECTIONS: int = 32  # 공유 클라이언트의 연결 풀 크기
+    AWS_S3_PRESIGN_EXPIRES: int = 300  # 직접 업로드 URL 유효 시간 (초)
     
     # Google Maps API (선택적)
     GOOGLE_MAPS_API_KEY: Optional[str] = None
@@ -55,6 +108,24 @@ class Settings(BaseSettings):
     RATE_LIMIT_PER_MINUTE: int = 60
     RATE_LIMIT_PER_HOUR: int = 1000
     
+    # 목록 전체 개수(total) 캐시 설정 (초)
+    TOTALS_CACHE_TTL: int = 60
+    TOTALS_ESTIMATE_TTL: int = 600
+    
+    # 공개 조회 응답 캐시 설정
+    RESPONSE_CACHE_TTL: int = 30
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+
+    # 응답 압축 설정 (최소 크기 바이트 미만은 압축하지 않음)
+    COMPRESSION_MIN_SIZE: int = 1024
+    COMPRESSION_GZIP_LEVEL: int = 6
+    COMPRESSION_BROTLI_QUALITY: int = 5
+    COMPRESSION_ZSTD_LEVEL: int = 3
+
+    # 공지사항 조회수 반영 주기 (초)
+    NOTICE_VIEW_FLUSH_INTERVAL: float = 5.0
+    
     # 파일 업로드 설정
     MAX_FILE_SIZE: int = 10485760  # 10MB
     ALLOWED_EXTENSIONS: List[str] = ["jpg", "jpeg", "png", "gif", "pdf", "doc", "docx"]
@@ -0,0 +1,110 @@
+"""
+인증 캐시 (JWT 검증 결과, 사용자 principal)
+
+인증이 필요한 요청마다 JWT 서명 검증과 사용자 조회를 반복하지 않도록 워커 메모리에 짧게 보관합니다.
+- 토큰 캐시: 토큰 SHA-256 해시 -> 디코딩된 payload (토큰 만료 시각을 넘겨 보관하지 않음)
+- principal 캐시: 사용자 id -> (id, is_active, is_admin), users 테이블 무효화 시 비움
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Hashable, Optional
+from ..config import settings
+from .security import verify_token
+
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 사용자의 권한 판단에 필요한 최소 정보"""
+    id: int
+    is_active: bool
+    is_admin: bool
+
+
+class ExpiringCache:
+    """만료 시각이 있는 LRU 캐시 (세대가 바뀐 뒤 시작된 조회 결과는 저장하지 않음)"""
+
+    def __init__(self, ttl: float, max_entries: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        with self._lock:
+            return self._generation
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[1] <= time.time():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key: Hashable, value, generation: int, expires_at: Optional[float] = None):
+        """값 저장 (expires_at이 TTL보다 이르면 그 시각까지만 보관)"""
+        if self.ttl <= 0:
+            return
+        expires_at = min(time.time() + self.ttl, expires_at or float("inf"))
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._generation += 1
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+def _token_key(token: str) -> str:
+    # 원본 토큰을 메모리 키로 두지 않도록 해시 사용
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+def cached_token_payload(token: str) -> Optional[dict]:
+    """JWT 검증 결과 (캐시 적중 시 서명 검증 생략, 검증 실패는 캐시하지 않음)"""
+    key = _token_key(token)
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    generation = token_cache.generation
+    payload = verify_token(token)
+    if payload is not None:
+        token_cache.put(key, payload, generation, expires_at=payload.get("exp"))
+    return payload
+
+
+def invalidate_principals(tables=None):
+    """users 테이블 무효화 시 principal 캐시 비움 (tables가 None이면 항상)"""
+    if tables is None or "users" in tables:
+        principal_cache.clear()
+
+
+# 전역 인증 캐시 인스턴스
+token_cache = ExpiringCache(ttl=settings.AUTH_TOKEN_CACHE_TTL, max_entries=settings.AUTH_CACHE_MAX_ENTRIES)
+principal_cache = ExpiringCache(ttl=settings.AUTH_PRINCIPAL_CACHE_TTL, max_entries=settings.AUTH_CACHE_MAX_ENTRIES)
@@ -0,0 +1,389 @@
+"""
+공개 GET 응답 캐시 (메모리 LRU + TTL + 테이블 태그 기반 무효화)
+
+캐시 적중 시 라우터/ORM/Pydantic을 거치지 않고 저장된 응답 바이트를 그대로 전송합니다.
+압축본은 인코딩별로 처음 한 번만 만들어 항목에 함께 보관합니다.
+워커 메모리(L1) 뒤에 선택적으로 Redis 공유 캐시(L2)를 사용합니다 (cache_backend 참고).
+"""
+import json
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+from urllib.parse import parse_qsl, urlencode
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import Request
+from ..config import settings
+from .auth_cache import invalidate_principals
+from .cache_backend import get_cache_backend, versioned_key
+from .compression import compress, encoded_headers, is_compressible, request_encoding
+from .conditional import Validator
+from .totals import totals
+
+
+@dataclass
+class CachedResponse:
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    tags: Sequence[str]
+    expires_at: float
+    # 인코딩별 압축본 (처음 요청될 때 한 번만 압축)
+    variants: Dict[str, bytes] = field(default_factory=dict)
+
+
+@dataclass
+class CacheRule:
+    """캐시할 경로 설정 (tags는 응답이 의존하는 테이블 이름)"""
+    tags: Sequence[str]
+    ttl: Optional[float] = None
+    bypass: Sequence[str] = ()  # 값이 참이면 캐시를 거치지 않는 쿼리 파라미터
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    shared_hits: int = 0  # L1 미스 중 공유 캐시(L2)에서 찾은 횟수
+
+
+class ResponseCache:
+    def __init__(self, ttl: float, max_entries: int, max_bytes: int):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._tag_versions: Dict[str, int] = {}
+        self._bytes = 0
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.expires_at <= time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return entry
+
+    def record_shared_hit(self):
+        with self._lock:
+            self.stats.shared_hits += 1
+
+    def tag_versions(self, tags: Iterable[str]) -> Tuple[int, ...]:
+        """응답 생성 전 태그 버전 스냅샷 (생성 중 무효화되면 저장하지 않기 위함)"""
+        with self._lock:
+            return tuple(self._tag_versions.get(tag, 0) for tag in tags)
+
+    def set(self, key: str, entry: CachedResponse, versions: Tuple[int, ...]) -> bool:
+        size = len(entry.body)
+        if size > self.max_bytes:
+            return False
+
+        with self._lock:
+            current = tuple(self._tag_versions.get(tag, 0) for tag in entry.tags)
+            if current != versions:
+                return False
+
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = entry
+            self._bytes += size
+            for tag in entry.tags:
+                self._tag_index.setdefault(tag, set()).add(key)
+            self.stats.stores += 1
+            self._evict()
+            return True
+
+    def encoded_body(self, key: str, entry: CachedResponse, encoding: str) -> bytes:
+        """entry의 압축본 (없으면 압축해서 캐시에 함께 보관)"""
+        data = entry.variants.get(encoding)
+        if data is not None:
+            return data
+
+        data = compress(entry.body, encoding)
+        with self._lock:
+            if self._entries.get(key) is entry and encoding not in entry.variants:
+                entry.variants[encoding] = data
+                self._bytes += len(data)
+                self._evict()
+            else:
+                entry.variants.setdefault(encoding, data)
+        return data
+
+    def invalidate_tags(self, *tags: str):
+        """태그(테이블)에 의존하는 캐시 항목 모두 제거"""
+        with self._lock:
+            for tag in tags:
+                self._tag_versions[tag] = self._tag_versions.get(tag, 0) + 1
+                for key in list(self._tag_index.get(tag, ())):
+                    self._remove(key)
+                    self.stats.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._tag_index.clear()
+            self._bytes = 0
+
+    def snapshot(self) -> dict:
+        """적중/미스 지표"""
+        with self._lock:
+            lookups = self.stats.hits + self.stats.misses
+            return {
+                "hits": self.stats.hits,
+                "misses": self.stats.misses,
+                "hit_ratio": round(self.stats.hits / lookups, 4) if lookups else 0.0,
+                "stores": self.stats.stores,
+                "evictions": self.stats.evictions,
+                "invalidations": self.stats.invalidations,
+                "shared_hits": self.stats.shared_hits,
+                "shared_backend": get_cache_backend().name,
+                "shared_available": get_cache_backend().available,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def _evict(self):
+        while self._entries and (len(self._entries) > self.max_entries or self._bytes > self.max_bytes):
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.stats.evictions += 1
+
+    def _remove(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return
+        self._bytes -= len(entry.body) + sum(len(data) for data in entry.variants.values())
+        for tag in entry.tags:
+            keys = self._tag_index.get(tag)
+            if keys is not None:
+                keys.discard(key)
+
+
+class ResponseCacheMiddleware:
+    """규칙에 등록된 경로의 GET 200 응답을 캐시하는 ASGI 미들웨어
+
+    L1(워커 메모리)에 없으면 공유 캐시(L2)를 조회하고, 둘 다 없을 때만 라우터를 실행합니다.
+    """
+
+    def __init__(self, app, cache: "ResponseCache", rules: Dict[str, CacheRule]):
+        self.app = app
+        self.cache = cache
+        self.rules = {path: rule for path, rule in rules.items() if "{" not in path}
+        # "/api/counselors/{id}" 형태의 경로 템플릿
+        self.patterns = [
+            (re.compile("^" + re.sub(r"\{\w+\}", "[^/]+", path) + "$"), rule)
+            for path, rule in rules.items() if "{" in path
+        ]
+
+    def match(self, path: str) -> Optional[CacheRule]:
+        rule = self.rules.get(path)
+        if rule is not None:
+            return rule
+        for pattern, rule in self.patterns:
+            if pattern.match(path):
+                return rule
+        return None
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        rule = self.match(scope["path"])
+        if rule is None or _has_bypass_param(scope, rule):
+            await self.app(scope, receive, send)
+            return
+
+        key = cache_key(scope)
+        entry = self.cache.get(key)
+        if entry is not None:
+            await _send_cached(scope, send, self.cache, key, entry, b"HIT")
+            return
+
+        versions = self.cache.tag_versions(rule.tags)
+        ttl = rule.ttl or self.cache.ttl
+        shared_key = None
+        if get_cache_backend().available:
+            shared_key, payload = await run_in_threadpool(_shared_lookup, key, rule.tags)
+            if payload is not None:
+                entry = decode_cached_response(payload, rule.tags, time.monotonic() + ttl)
+                self.cache.set(key, entry, versions)
+                self.cache.record_shared_hit()
+                await _send_cached(scope, send, self.cache, key, entry, b"HIT-SHARED")
+                return
+
+        start_message = {}
+        chunks = []
+        passthrough = False
+
+        async def capture(message):
+            nonlocal passthrough
+            if passthrough:
+                await send(message)
+                return
+            # 압축 여부를 본문 크기로 정해야 하므로 응답 시작을 본문이 끝날 때까지 미룸
+            if message["type"] == "http.response.start":
+                start_message.update(message)
+                return
+            if message["type"] != "http.response.body":
+                # 본문 대신 파일을 보내는 확장 메시지 등은 캐시하지 않고 응답 시작과 함께 그대로 전달
+                passthrough = True
+                if start_message:
+                    await send(start_message)
+                await send(message)
+                return
+
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(chunks)
+            if start_message["status"] != 200:
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            entry = CachedResponse(
+                status=200,
+                headers=list(start_message.get("headers", [])),
+                body=body,
+                tags=rule.tags,
+                expires_at=time.monotonic() + ttl,
+            )
+            self.cache.set(key, entry, versions)
+            await _send_cached(scope, send, self.cache, key, entry, b"MISS")
+            if shared_key is not None:
+                await run_in_threadpool(
+                    get_cache_backend().set, shared_key, encode_cached_response(entry), ttl
+                )
+
+        await self.app(scope, receive, capture)
+
+
+async def _send_cached(scope, send, cache: ResponseCache, key: str, entry: CachedResponse, marker: bytes):
+    validator = Validator.from_headers(entry.headers)
+    if validator is not None and validator.is_not_modified(Request(scope)):
+        headers = [
+            (name, value) for name, value in entry.headers
+            if name.lower() in (b"etag", b"last-modified", b"cache-control")
+        ]
+        await send({
+            "type": "http.response.start",
+            "status": 304,
+            "headers": headers + [(b"x-cache", marker)],
+        })
+        await send({"type": "http.response.body", "body": b""})
+        return
+
+    headers, body = entry.headers, entry.body
+    if is_compressible(headers, len(body)):
+        encoding = request_encoding(scope)
+        if encoding is not None:
+            body = cache.encoded_body(key, entry, encoding)
+        headers = encoded_headers(headers, encoding, len(body))
+
+    await send({
+        "type": "http.response.start",
+        "status": entry.status,
+        "headers": headers + [(b"x-cache", marker)],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+def _has_bypass_param(scope, rule: CacheRule) -> bool:
+    if not rule.bypass:
+        return False
+    query = parse_qsl(scope.get("query_string", b"").decode("latin-1"))
+    return any(name in rule.bypass and value.lower() not in ("", "0", "false") for name, value in query)
+
+
+def _shared_lookup(key: str, tags: Sequence[str]) -> Tuple[Optional[str], Optional[bytes]]:
+    """L2 조회 - (저장에 쓸 버전 키, 저장된 응답) 반환"""
+    backend = get_cache_backend()
+    shared_versions = backend.tag_versions(tags)
+    if shared_versions is None:
+        return None, None
+    shared_key = versioned_key("resp", key, shared_versions)
+    return shared_key, backend.get(shared_key)
+
+
+def encode_cached_response(entry: CachedResponse) -> bytes:
+    """L2 저장 형식: 헤더 JSON 한 줄 + 본문 바이트"""
+    meta = {
+        "status": entry.status,
+        "headers": [[k.decode("latin-1"), v.decode("latin-1")] for k, v in entry.headers],
+    }
+    return json.dumps(meta).encode() + b"\n" + entry.body
+
+
+def decode_cached_response(payload: bytes, tags: Sequence[str], expires_at: float) -> CachedResponse:
+    meta, body = payload.split(b"\n", 1)
+    meta = json.loads(meta)
+    return CachedResponse(
+        status=meta["status"],
+        headers=[(k.encode("latin-1"), v.encode("latin-1")) for k, v in meta["headers"]],
+        body=body,
+        tags=tags,
+        expires_at=expires_at,
+    )
+
+
+def cache_key(scope) -> str:
+    """경로 + 정렬된 쿼리 문자열"""
+    query = parse_qsl(scope.get("query_string", b"").decode("latin-1"), keep_blank_values=True)
+    return f"{scope['path']}?{urlencode(sorted(query))}"
+
+
+def invalidate_local(tables: Optional[Sequence[str]]):
+    """이 워커의 L1 캐시 무효화 (tables가 None이면 전체)"""
+    invalidate_principals(tables)
+    if tables is None:
+        totals.clear()
+        response_cache.clear()
+        return
+    for table in tables:
+        totals.invalidate(table)
+    response_cache.invalidate_tags(*tables)
+
+
+def invalidate_tables(*tables: str):
+    """테이블 쓰기 후 호출 - totals 캐시와 응답 캐시를 함께 무효화
+
+    공유 캐시를 사용 중이면 태그 버전을 올리고 다른 워커에도 알립니다.
+    """
+    invalidate_local(tables)
+    get_cache_backend().invalidate_tags(tables)
+
+
+# 전역 응답 캐시 인스턴스
+response_cache = ResponseCache(
+    ttl=settings.RESPONSE_CACHE_TTL,
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+)
+
+# 캐시할 공개 조회 경로와 의존 테이블
+# (공지사항 상세는 조회수를 기록해야 하므로 제외)
+RESPONSE_CACHE_RULES = {
+    "/api/counselors/": CacheRule(tags=["counselors"]),
+    "/api/counselors/online": CacheRule(tags=["counselors"]),
+    "/api/counselors/{counselor_id}": CacheRule(tags=["counselors"]),
+    "/api/reviews/approved": CacheRule(tags=["reviews", "counselors", "users"]),
+    "/api/reviews/{review_id}": CacheRule(tags=["reviews", "counselors", "users"]),
+    "/api/notices/published": CacheRule(tags=["notices"]),
+    "/api/search": CacheRule(tags=["notices", "counselors", "reviews"]),
+    "/api/admin/stats": CacheRule(tags=["counselors", "consultations", "reviews", "notices", "stat_counters"]),
+}
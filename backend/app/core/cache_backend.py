@@ -0,0 +1,219 @@
+"""
+워커 간 공유 캐시 백엔드 (Redis L2)
+
+각 워커의 메모리 캐시(L1) 뒤에 Redis(L2)를 두어 여러 uvicorn 워커가 같은 결과를
+공유합니다. 무효화는 두 가지 방식으로 전파됩니다.
+
+- 버전 키: 테이블(태그)별 버전을 Redis에 두고 L2 키에 포함시키므로,
+  무효화(INCR) 이후에는 이전 버전으로 저장된 값이 더 이상 조회되지 않습니다.
+- pub/sub: 다른 워커의 L1을 즉시 비우도록 무효화된 태그를 채널로 알립니다.
+
+redis 패키지가 없거나 REDIS_URL이 비어 있거나 서버에 연결할 수 없으면
+LocalCacheBackend(L1 전용)로 동작하며, 요청 처리에는 영향을 주지 않습니다.
+"""
+import json
+import os
+import threading
+import time
+import uuid
+from typing import Callable, Iterable, Optional, Sequence, Tuple
+from ..config import settings
+
+try:
+    import redis
+except ImportError:  # 선택적 의존성
+    redis = None
+
+
+class CacheBackend:
+    """공유 캐시 공통 인터페이스 (기본 구현은 아무것도 공유하지 않음)"""
+
+    name = "local"
+
+    @property
+    def available(self) -> bool:
+        return False
+
+    def get(self, key: str) -> Optional[bytes]:
+        return None
+
+    def set(self, key: str, value: bytes, ttl: float):
+        pass
+
+    def tag_versions(self, tags: Sequence[str]) -> Optional[Tuple[int, ...]]:
+        """태그별 공유 버전 (사용할 수 없으면 None)"""
+        return None
+
+    def invalidate_tags(self, tags: Sequence[str]):
+        pass
+
+    def subscribe(self, callback: Callable[[Optional[Sequence[str]]], None]):
+        pass
+
+    def close(self):
+        pass
+
+
+class LocalCacheBackend(CacheBackend):
+    """L1 전용 (Redis 미사용)"""
+
+
+class RedisCacheBackend(CacheBackend):
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str, socket_timeout: float, retry_interval: float):
+        self.prefix = prefix
+        self.retry_interval = retry_interval
+        self.client = redis.Redis.from_url(
+            url,
+            socket_timeout=socket_timeout,
+            socket_connect_timeout=socket_timeout,
+            health_check_interval=30,
+        )
+        self.channel = f"{prefix}invalidate"
+        # 자기 자신이 보낸 무효화 메시지는 무시하기 위한 워커 식별자
+        self.origin = f"{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._down_until = 0.0
+        self._listener: Optional[threading.Thread] = None
+        self._pubsub = None
+        self._stop = threading.Event()
+
+    @property
+    def available(self) -> bool:
+        return time.monotonic() >= self._down_until
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self._call(lambda: self.client.get(self.prefix + key))
+
+    def set(self, key: str, value: bytes, ttl: float):
+        self._call(lambda: self.client.set(self.prefix + key, value, px=int(ttl * 1000)))
+
+    def tag_versions(self, tags: Sequence[str]) -> Optional[Tuple[int, ...]]:
+        if not tags:
+            return ()
+        values = self._call(lambda: self.client.mget([self._tag_key(tag) for tag in tags]))
+        if values is None:
+            return None
+        return tuple(int(value or 0) for value in values)
+
+    def invalidate_tags(self, tags: Sequence[str]):
+        def bump():
+            pipe = self.client.pipeline(transaction=False)
+            for tag in tags:
+                pipe.incr(self._tag_key(tag))
+            pipe.publish(self.channel, json.dumps({"origin": self.origin, "tags": list(tags)}))
+            pipe.execute()
+            return True
+
+        self._call(bump)
+
+    def subscribe(self, callback: Callable[[Optional[Sequence[str]]], None]):
+        """다른 워커의 무효화 메시지를 받아 callback(tags) 호출 (백그라운드 스레드)"""
+        if self._listener is not None:
+            return
+        self._stop.clear()
+        self._listener = threading.Thread(
+            target=self._listen, args=(callback,), name="cache-invalidation", daemon=True
+        )
+        self._listener.start()
+
+    def close(self):
+        self._stop.set()
+        if self._pubsub is not None:
+            try:
+                self._pubsub.close()
+            except Exception:
+                pass
+        if self._listener is not None:
+            self._listener.join(timeout=2)
+            self._listener = None
+        self.client.close()
+
+    def _listen(self, callback: Callable[[Optional[Sequence[str]]], None]):
+        disconnected = False
+        while not self._stop.is_set():
+            try:
+                self._pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                self._pubsub.subscribe(self.channel)
+                if disconnected:
+                    # 구독이 끊긴 동안 놓친 무효화가 있을 수 있으므로 L1 전체를 비움
+                    callback(None)
+                    disconnected = False
+                while not self._stop.is_set():
+                    message = self._pubsub.get_message(timeout=1.0)
+                    if message is None:
+                        continue
+                    payload = json.loads(message["data"])
+                    if payload.get("origin") != self.origin:
+                        callback(payload.get("tags", []))
+            except Exception as e:
+                if self._stop.is_set():
+                    break
+                if not disconnected:
+                    print(f"⚠️ 캐시 무효화 구독 끊김 (재연결 대기): {e}")
+                disconnected = True
+                self._stop.wait(self.retry_interval)
+
+    def _call(self, operation):
+        """Redis 호출 - 실패하면 retry_interval 동안 L1 전용으로 동작"""
+        if not self.available:
+            return None
+        try:
+            return operation()
+        except redis.RedisError as e:
+            self._down_until = time.monotonic() + self.retry_interval
+            print(f"⚠️ Redis 캐시 사용 불가 - {self.retry_interval:.0f}초 동안 메모리 캐시만 사용: {e}")
+            return None
+
+    def _tag_key(self, tag: str) -> str:
+        return f"{self.prefix}tag:{tag}"
+
+
+def versioned_key(namespace: str, key: str, versions: Iterable[int]) -> str:
+    """태그 버전을 포함한 L2 키 (무효화되면 키 자체가 달라짐)"""
+    return f"{namespace}:{'.'.join(str(v) for v in versions)}:{key}"
+
+
+def create_cache_backend() -> CacheBackend:
+    """설정에 따라 공유 캐시 백엔드 생성"""
+    if not settings.REDIS_URL:
+        return LocalCacheBackend()
+    if redis is None:
+        print("⚠️ redis 패키지가 없어 메모리 캐시만 사용합니다.")
+        return LocalCacheBackend()
+
+    backend = RedisCacheBackend(
+        settings.REDIS_URL,
+        prefix=settings.REDIS_CACHE_PREFIX,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+        retry_interval=settings.REDIS_RETRY_INTERVAL,
+    )
+    if backend._call(backend.client.ping) is None:
+        return backend  # 연결 실패 - retry_interval 이후 다시 시도
+    print(f"✅ Redis 공유 캐시 사용: {settings.REDIS_URL}")
+    return backend
+
+
+# 전역 공유 캐시 백엔드 (startup에서 생성, get_cache_backend()로 조회)
+_backend: CacheBackend = LocalCacheBackend()
+
+
+def get_cache_backend() -> CacheBackend:
+    return _backend
+
+
+def init_cache_backend(on_invalidate: Callable[[Optional[Sequence[str]]], None]) -> CacheBackend:
+    """공유 캐시 백엔드를 만들고 다른 워커의 무효화 구독 시작
+
+    on_invalidate는 무효화된 태그 목록(구독이 끊겼던 경우 None)을 받습니다.
+    """
+    global _backend
+    _backend = create_cache_backend()
+    _backend.subscribe(on_invalidate)
+    return _backend
+
+
+def close_cache_backend():
+    global _backend
+    _backend.close()
+    _backend = LocalCacheBackend()
@@ -0,0 +1,173 @@
+"""
+응답 압축 (gzip / brotli / zstd)
+
+Accept-Encoding으로 인코딩을 고르고, 최소 크기 이상인 텍스트/JSON 응답만 압축합니다.
+brotli, zstd는 해당 패키지가 설치된 경우에만 사용하며 gzip은 항상 사용할 수 있습니다.
+응답 캐시에 등록된 경로는 캐시가 압축본을 직접 보관하므로(cache 참고)
+이미 Content-Encoding이 붙은 응답은 다시 압축하지 않습니다.
+"""
+import gzip
+from typing import Callable, Dict, List, Optional, Tuple
+from ..config import settings
+
+try:
+    import brotli
+except ImportError:  # 선택적 의존성
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # 선택적 의존성
+    zstandard = None
+
+Headers = List[Tuple[bytes, bytes]]
+
+# 압축할 Content-Type (접두사)
+COMPRESSIBLE_TYPES = (b"application/json", b"text/", b"application/javascript", b"image/svg+xml")
+
+
+def _build_encoders() -> Dict[str, Callable[[bytes], bytes]]:
+    """사용 가능한 인코더 (선호 순서)"""
+    encoders = {}
+    if brotli is not None:
+        encoders["br"] = lambda data: brotli.compress(data, quality=settings.COMPRESSION_BROTLI_QUALITY)
+    if zstandard is not None:
+        compressor = zstandard.ZstdCompressor(level=settings.COMPRESSION_ZSTD_LEVEL)
+        encoders["zstd"] = compressor.compress
+    encoders["gzip"] = lambda data: gzip.compress(data, compresslevel=settings.COMPRESSION_GZIP_LEVEL, mtime=0)
+    return encoders
+
+
+ENCODERS = _build_encoders()
+
+
+def parse_accept_encoding(accept_encoding: Optional[str]) -> Dict[str, float]:
+    """Accept-Encoding 헤더 -> {인코딩: q 값}"""
+    accepted = {}
+    for item in (accept_encoding or "").split(","):
+        name, _, params = item.strip().partition(";")
+        if not name:
+            continue
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip().lower()] = quality
+    return accepted
+
+
+def negotiate(accept_encoding: Optional[str], available: Optional[List[str]] = None) -> Optional[str]:
+    """Accept-Encoding에서 q 값이 가장 높은 사용 가능 인코딩 (같으면 선호 순서)
+
+    available을 주면 ENCODERS 대신 그 목록(선호 순서) 중에서 고릅니다.
+    """
+    if not accept_encoding:
+        return None
+
+    accepted = parse_accept_encoding(accept_encoding)
+    best, best_quality = None, 0.0
+    for name in (ENCODERS if available is None else available):
+        quality = accepted.get(name, accepted.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = name, quality
+    return best
+
+
+def request_encoding(scope) -> Optional[str]:
+    for name, value in scope.get("headers", []):
+        if name == b"accept-encoding":
+            return negotiate(value.decode("latin-1"))
+    return None
+
+
+def is_compressible(headers: Headers, size: int) -> bool:
+    """최소 크기 이상이고 아직 인코딩되지 않은 텍스트/JSON 응답인지 (부분 응답 제외)"""
+    return size >= settings.COMPRESSION_MIN_SIZE and is_compressible_type(headers)
+
+
+def is_compressible_type(headers: Headers) -> bool:
+    """아직 인코딩되지 않은 텍스트/JSON 응답인지 (부분 응답 제외, 크기는 보지 않음)"""
+    content_type = b""
+    for name, value in headers:
+        name = name.lower()
+        if name in (b"content-encoding", b"content-range"):
+            return False
+        if name == b"content-type":
+            content_type = value.lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+
+def compress(data: bytes, encoding: str) -> bytes:
+    return ENCODERS[encoding](data)
+
+
+def encoded_headers(headers: Headers, encoding: Optional[str], size: int) -> Headers:
+    """압축 대상 응답 헤더 정리 (Content-Length 재계산, Content-Encoding/Vary 추가)"""
+    result = [
+        (name, value) for name, value in headers
+        if name.lower() not in (b"content-length", b"vary")
+    ]
+    vary = [value for name, value in headers if name.lower() == b"vary"]
+    if not any(b"accept-encoding" in value.lower() for value in vary):
+        vary.append(b"Accept-Encoding")
+    result.append((b"vary", b", ".join(vary)))
+    if encoding is not None:
+        result.append((b"content-encoding", encoding.encode("latin-1")))
+    result.append((b"content-length", str(size).encode("latin-1")))
+    return result
+
+
+class CompressionMiddleware:
+    """응답 본문을 한 번에 보내는 응답을 압축하는 ASGI 미들웨어
+
+    압축 대상이 아닌 Content-Type, 스트리밍 응답(more_body), 본문 대신 파일을 보내는
+    서버 확장(http.response.pathsend / zerocopysend)은 버퍼링하지 않고 그대로 전달합니다.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = request_encoding(scope)
+        start_message = None
+        passthrough = False
+
+        async def compress_send(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                if not is_compressible_type(message.get("headers", [])):
+                    passthrough = True
+                    await send(message)
+                    return
+                start_message = message
+                return
+
+            body = message.get("body", b"")
+            if message["type"] != "http.response.body" or message.get("more_body", False):
+                # 미뤄 둔 응답 시작을 먼저 보내야 다른 종류의 메시지가 순서대로 전달됨
+                passthrough = True
+                if start_message is not None:
+                    await send(start_message)
+                await send(message)
+                return
+
+            headers = list(start_message.get("headers", []))
+            if is_compressible(headers, len(body)):
+                if encoding is not None:
+                    body = compress(body, encoding)
+                headers = encoded_headers(headers, encoding, len(body))
+                start_message = {**start_message, "headers": headers}
+            await send(start_message)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, compress_send)
@@ -0,0 +1,139 @@
+"""
+HTTP 조건부 요청 처리 (ETag / Last-Modified / 304)
+
+목록은 조회 조건에 맞는 행의 max(updated_at)과 테이블 쓰기 세대로 검증자(validator)를 만들고,
+페이지 조회와 직렬화 전에 요청 헤더와 비교합니다. 목록 응답의 total은 totals 캐시에서 가져옵니다.
+"""
+import hashlib
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional, Sequence
+from fastapi import Request, Response
+from sqlalchemy import DateTime, Select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from starlette.concurrency import run_in_threadpool
+from .cache_backend import get_cache_backend
+from .totals import totals
+
+# 경로별 Cache-Control 정책
+CACHE_CONTROL_LIST = "public, max-age=30, stale-while-revalidate=60"
+CACHE_CONTROL_DETAIL = "public, max-age=60, stale-while-revalidate=300"
+# 조회수를 기록해야 하므로 매번 서버에 재검증
+CACHE_CONTROL_REVALIDATE = "public, no-cache"
+
+# 공유 캐시가 없을 때 재시작한 프로세스의 세대(0부터 다시 시작)가 이전 ETag와 겹치지 않도록 구분
+PROCESS_EPOCH = uuid.uuid4().hex[:8]
+
+
+@dataclass
+class Validator:
+    etag: str
+    last_modified: Optional[datetime]
+
+    def headers(self, cache_control: str) -> dict:
+        headers = {"ETag": self.etag, "Cache-Control": cache_control}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+    def is_not_modified(self, request: Request) -> bool:
+        """If-None-Match(우선) 또는 If-Modified-Since 기준으로 변경 여부 판단"""
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            if if_none_match.strip() == "*":
+                return True
+            # 약한 비교 (W/ 접두사 무시)
+            candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            return self.etag.removeprefix("W/") in candidates
+
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since and self.last_modified is not None:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+            except (TypeError, ValueError):
+                return False
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            return self.last_modified <= since
+        return False
+
+    def not_modified_response(self, cache_control: str) -> Response:
+        return Response(status_code=304, headers=self.headers(cache_control))
+
+    def apply(self, response: Response, cache_control: str):
+        response.headers.update(self.headers(cache_control))
+
+    @classmethod
+    def from_headers(cls, headers) -> Optional["Validator"]:
+        """저장된 응답 헤더(ASGI 형식)에서 검증자 복원 (응답 캐시 적중 시 304 판단용)"""
+        values = {name.lower(): value.decode("latin-1") for name, value in headers}
+        etag = values.get(b"etag")
+        if etag is None:
+            return None
+        last_modified = values.get(b"last-modified")
+        return cls(
+            etag=etag,
+            last_modified=parsedate_to_datetime(last_modified) if last_modified else None,
+        )
+
+
+def make_validator(request: Request, last_modified: Optional[datetime], *parts) -> Validator:
+    """요청 URL과 버전 정보(parts)로 약한 ETag 생성
+
+    응답 본문이 압축 등으로 바이트 단위로 달라질 수 있으므로 약한(W/) ETag를 사용합니다.
+    """
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)  # SQLite CURRENT_TIMESTAMP는 UTC
+        last_modified = last_modified.replace(microsecond=0)
+
+    seed = repr((request.url.path, sorted(request.query_params.multi_items()), last_modified, parts))
+    digest = hashlib.blake2b(seed.encode(), digest_size=12).hexdigest()
+    return Validator(etag=f'W/"{digest}"', last_modified=last_modified)
+
+
+def row_timestamp(model):
+    """행의 마지막 변경 시각 식 (수정된 적 없으면 생성 시각)"""
+    return func.coalesce(model.updated_at, model.created_at, type_=DateTime)
+
+
+async def table_versions(tables: Sequence[str]) -> tuple:
+    """테이블 쓰기 세대 - 공유 캐시를 쓰면 워커 공통 태그 버전, 아니면 이 프로세스의 totals 세대
+
+    invalidate_tables가 쓰기마다 올리는 값이므로 같은 초 안의 수정이나 개수가 같은 삭제+추가도 구분됩니다.
+    """
+    if not tables:
+        return ()
+    backend = get_cache_backend()
+    if backend.available:
+        versions = await run_in_threadpool(backend.tag_versions, list(tables))
+        if versions is not None:
+            return ("shared", *versions)
+    return (PROCESS_EPOCH, *(totals.generation(table) for table in tables))
+
+
+async def list_validator_async(
+    db: AsyncSession,
+    request: Request,
+    statement: Select,
+    timestamps: Sequence,
+    tables: Sequence[str] = ()
+) -> Validator:
+    """목록 쿼리(필터 적용, 페이지 적용 전)의 max(timestamps)와 tables의 쓰기 세대로 검증자 생성
+
+    timestamps는 마지막 변경 시각 식 목록으로, JOIN한 테이블의 시각도 포함할 수 있습니다.
+    행이 삭제되면 max(updated_at)이 오히려 과거로 돌아갈 수 있으므로 목록에는 Last-Modified를
+    두지 않고(If-Modified-Since로는 304를 주지 않음) ETag로만 판단합니다.
+    시각은 초 단위라 같은 초 안의 수정이나 삭제를 구분하지 못하므로, 쓰기마다 올라가는 세대를 함께 넣습니다.
+    (행 수는 세지 않음 - 목록 total은 totals 캐시가 담당)
+    """
+    # 세대는 집계 전에 읽음 (집계 뒤에 읽으면 그 사이 커밋된 쓰기의 세대가 이전 데이터와 묶일 수 있음)
+    versions = await table_versions(tables)
+    stamp_statement = statement.with_only_columns(
+        *(func.max(column, type_=DateTime) for column in timestamps),
+        maintain_column_froms=True,
+    ).order_by(None)
+    values = tuple((await db.execute(stamp_statement)).one())
+    return make_validator(request, None, *values, versions)
@@ -0,0 +1,98 @@
+"""
+내용 주소(content-addressed) 파일 저장소
+
+파일 이름을 내용의 SHA-256으로 정하므로 같은 사진을 여러 번 올려도 파일은 하나만 남고,
+URL이 가리키는 내용이 절대 바뀌지 않아 정적 파일을 immutable로 오래 캐시할 수 있습니다.
+어떤 행이 파일을 참조하는지는 stored_files.ref_count(트리거 관리)로 추적하며,
+참조가 없는 파일은 gc_uploads.py로 정리합니다.
+실제 파일은 저장소 백엔드(core.storage - 로컬 디스크 또는 S3 호환 버킷)의 "<prefix>/" 아래에 둡니다.
+"""
+import os
+import re
+from typing import Iterator, Optional, Tuple
+from ..config import settings
+from .storage import StorageObject, get_storage
+
+# 내용 주소 파일 이름 (SHA-256 hex + 확장자)
+DIGEST_NAME = re.compile(r"^(?P<digest>[0-9a-f]{64})\.(?P<ext>[a-z0-9]+)$")
+
+# 변환본 키 접두사 ("<prefix>/variants/<원본 이름>/...")
+VARIANTS_DIR = "variants"
+
+# 내용이 바뀌지 않는 객체의 캐시 정책 (버킷에서 직접 내려줄 때 객체 메타데이터로 저장)
+CACHE_CONTROL_IMMUTABLE = f"public, max-age={settings.STATIC_IMMUTABLE_MAX_AGE}, immutable"
+
+
+class ContentStore:
+    def __init__(self, prefix: str):
+        self.prefix = prefix.strip("/")
+
+    @property
+    def storage(self):
+        return get_storage()
+
+    def filename(self, digest: str, extension: str) -> str:
+        return f"{digest}.{extension}"
+
+    def key(self, filename: str) -> str:
+        return f"{self.prefix}/{filename}"
+
+    def variants_prefix(self, filename: str) -> str:
+        """원본 파일의 변환본 키 접두사"""
+        return f"{self.prefix}/{VARIANTS_DIR}/{filename.rsplit('.', 1)[0]}/"
+
+    def url(self, filename: str) -> str:
+        return self.storage.url(self.key(filename))
+
+    @property
+    def url_prefix(self) -> str:
+        return self.storage.url(self.prefix)
+
+    def filename_from_url(self, url: Optional[str]) -> Optional[str]:
+        """이 저장소의 URL이면 파일 이름, 아니면 None"""
+        url_prefix = self.url_prefix
+        if not url or not url.startswith(url_prefix + "/"):
+            return None
+        name = url[len(url_prefix) + 1:]
+        if not name or "/" in name or name.startswith("."):
+            return None
+        return name
+
+    def spool_directory(self) -> str:
+        """업로드 임시 파일을 만들 디렉터리"""
+        return self.storage.spool_directory(self.key(".upload"))
+
+    def commit(self, temp_path: str, digest: str, extension: str, content_type: str) -> Tuple[str, bool]:
+        """임시 파일을 내용 주소 이름으로 확정 - (파일 이름, 새로 저장했는지)
+
+        같은 내용이 이미 있으면 임시 파일을 버리고 기존 파일을 재사용합니다.
+        (GC는 stored_files.last_uploaded_at으로 재업로드 시각을 판단합니다.)
+        """
+        filename = self.filename(digest, extension)
+        key = self.key(filename)
+        if self.storage.exists(key):
+            os.unlink(temp_path)
+            return filename, False
+        self.storage.store_file(temp_path, key, content_type, CACHE_CONTROL_IMMUTABLE)
+        return filename, True
+
+    def delete(self, filename: str) -> bool:
+        """원본과 변환본 삭제"""
+        self.storage.delete_prefix(self.variants_prefix(filename))
+        return self.storage.delete(self.key(filename))
+
+    def iter_files(self) -> Iterator[StorageObject]:
+        """저장소의 원본 파일 목록 (임시 파일/변환본 제외)"""
+        for obj in self.storage.iter_objects(self.prefix + "/"):
+            if not obj.key.rsplit("/", 1)[-1].startswith("."):
+                yield obj
+
+    def iter_variant_sources(self) -> Iterator[str]:
+        """변환본이 있는 원본 이름(확장자 제외) 목록"""
+        seen = set()
+        root = f"{self.prefix}/{VARIANTS_DIR}/"
+        for obj in self.storage.iter_objects(root, recursive=True):
+            stem = obj.key[len(root):].split("/", 1)[0]
+            if stem not in seen:
+                seen.add(stem)
+                yield stem
@@ -0,0 +1,236 @@
+"""
+업로드 이미지 변환 파이프라인
+
+업로드된 원본을 그대로 내려주면 상담사 카드 목록 한 페이지에 수 MB를 받게 되므로,
+업로드가 끝난 뒤 별도 프로세스 풀에서 크기별(기본 64/256/768px) WebP/AVIF 변환본을 만들어
+저장소(core.storage)의 "<prefix>/variants/{이름}/"에 올리고 manifest.json을 함께 기록합니다.
+변환본은 EXIF를 제거하고 방향(Orientation)만 픽셀에 반영해 저장합니다. 변환은 요청 경로 밖에서
+실행되므로 업로드 응답은 변환 완료를 기다리지 않습니다. 완료된 manifest는 on_done으로 넘겨
+stored_files에 기록하므로, 목록 조회 때 저장소를 다시 확인하지 않습니다.
+"""
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Iterable, List, Optional
+from ..config import settings
+from .content_store import CACHE_CONTROL_IMMUTABLE, VARIANTS_DIR
+from .storage import get_storage
+
+MANIFEST_NAME = "manifest.json"
+
+# 변환 대상 원본 확장자
+SOURCE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp"}
+
+# 형식별 Pillow 저장 옵션과 Content-Type
+FORMAT_OPTIONS = {
+    "webp": {"format": "WEBP", "method": 4},
+    "avif": {"format": "AVIF", "speed": 6},
+}
+FORMAT_CONTENT_TYPES = {"webp": "image/webp", "avif": "image/avif"}
+
+
+def variant_prefix(key: str) -> str:
+    """원본 키의 변환본 키 접두사 ("a/b.jpg" -> "a/variants/b/")"""
+    directory, _, name = key.rpartition("/")
+    return f"{directory}/{VARIANTS_DIR}/{name.rsplit('.', 1)[0]}/"
+
+
+def supported_formats(formats: Iterable[str]) -> List[str]:
+    """설치된 Pillow가 저장할 수 있는 형식만 (AVIF는 Pillow 11.2+ 또는 플러그인 필요)"""
+    from PIL import features
+
+    return [fmt for fmt in formats if fmt in FORMAT_OPTIONS and features.check(fmt)]
+
+
+def _store(storage, key: str, content_type: str, write: Callable) -> int:
+    """임시 파일에 쓴 뒤 저장소에 올리고 크기 반환 (로컬 저장소는 원자적 이름 변경)"""
+    fd, temp_path = tempfile.mkstemp(dir=storage.spool_directory(key), prefix=".variant-", suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            write(handle)
+        size = os.path.getsize(temp_path)
+        storage.store_file(temp_path, key, content_type, CACHE_CONTROL_IMMUTABLE)
+        return size
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def process_image(source_key: str, sizes: List[int], formats: List[str], quality: int, max_pixels: int) -> dict:
+    """원본 하나의 변환본과 manifest 생성 (작업자 프로세스에서 실행, 저장소 연결은 프로세스마다 생성)
+
+    manifest는 모든 변환본을 올린 뒤 마지막에 기록하므로, manifest가 있으면 변환본도 모두 있습니다.
+    """
+    from PIL import Image, ImageOps
+
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    storage = get_storage()
+    prefix = variant_prefix(source_key)
+    base = source_key.rpartition("/")[0] + "/"
+
+    # 원격 저장소면 원본을 임시 파일로 내려받아 처리
+    source_path = storage.local_path(source_key)
+    download = None
+    if source_path is None:
+        fd, download = tempfile.mkstemp(prefix=".source-")
+        os.close(fd)
+        storage.download_file(source_key, download)
+        source_path = download
+
+    try:
+        with Image.open(source_path) as image:
+            original_size = image.size
+            # JPEG는 필요한 크기 근처까지 축소 디코딩 (전체 해상도로 풀지 않음)
+            image.draft("RGB", (max(sizes), max(sizes)))
+            # 방향 정보를 픽셀에 반영한 새 이미지 (EXIF 등 메타데이터는 옮기지 않음)
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ("RGBA", "LA", "PA") or (image.mode == "P" and "transparency" in image.info)
+            image = image.convert("RGBA" if has_alpha else "RGB")
+            image.info.clear()
+
+            variants = []
+            for size in sorted(sizes):
+                resized = image.copy()
+                resized.thumbnail((size, size), Image.Resampling.LANCZOS, reducing_gap=3.0)
+                for fmt in formats:
+                    key = f"{prefix}{size}.{fmt}"
+                    options = FORMAT_OPTIONS[fmt]
+                    written = _store(
+                        storage, key, FORMAT_CONTENT_TYPES[fmt],
+                        lambda handle: resized.save(handle, quality=quality, **options),
+                    )
+                    variants.append({
+                        "size": size,
+                        "format": fmt,
+                        "width": resized.width,
+                        "height": resized.height,
+                        "file": key[len(base):],
+                        "bytes": written,
+                    })
+        source_bytes = os.path.getsize(source_path)
+    finally:
+        if download is not None:
+            os.unlink(download)
+
+    manifest = {
+        "source": source_key[len(base):],
+        "width": original_size[0],
+        "height": original_size[1],
+        "bytes": source_bytes,
+        "variants": variants,
+    }
+    _store(
+        storage, prefix + MANIFEST_NAME, "application/json",
+        lambda handle: handle.write(json.dumps(manifest, ensure_ascii=False).encode("utf-8")),
+    )
+    return manifest
+
+
+def pick_variant(manifest: dict, size: int, fmt: str = "webp") -> Optional[dict]:
+    """size 이상인 변환본 중 가장 작은 것 (없으면 가장 큰 것)"""
+    candidates = sorted(
+        (variant for variant in manifest["variants"] if variant["format"] == fmt),
+        key=lambda variant: variant["size"],
+    )
+    for variant in candidates:
+        if variant["size"] >= size:
+            return variant
+    return candidates[-1] if candidates else None
+
+
+class ImagePipeline:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self.workers = 0
+        self.formats: List[str] = []
+        self.completed = 0
+        self.failed = 0
+
+    def start(self):
+        """작업자 풀 생성 (프로세스는 첫 작업 때 생성됨)"""
+        with self._lock:
+            if self._executor is not None:
+                return
+            self.workers = settings.IMAGE_PIPELINE_WORKERS or 1
+            self.formats = supported_formats(settings.IMAGE_VARIANT_FORMATS)
+            if settings.IMAGE_PIPELINE_EXECUTOR == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="image")
+            else:
+                # 앱 스레드를 복제하지 않도록 spawn으로 시작
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            print(f"🖼️ 이미지 변환 풀 시작 ({settings.IMAGE_PIPELINE_EXECUTOR}, 작업자 {self.workers}개, 형식 {', '.join(self.formats) or '없음'})")
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "executor": settings.IMAGE_PIPELINE_EXECUTOR,
+                "workers": self.workers,
+                "formats": self.formats,
+                "pending": self._pending,
+                "completed": self.completed,
+                "failed": self.failed,
+            }
+
+    def submit(self, source_key: str, on_done: Optional[Callable[[str, dict], None]] = None) -> Optional[Future]:
+        """변환 작업 등록 (완료를 기다리지 않음) - on_done은 성공 시 풀 관리 스레드에서 호출"""
+        self.start()
+        with self._lock:
+            executor = self._executor
+            if executor is None or not self.formats:
+                return None
+            self._pending += 1
+        try:
+            future = executor.submit(
+                process_image,
+                source_key,
+                list(settings.IMAGE_VARIANT_SIZES),
+                self.formats,
+                settings.IMAGE_VARIANT_QUALITY,
+                settings.IMAGE_MAX_PIXELS,
+            )
+        except RuntimeError:  # 종료 중인 풀
+            with self._lock:
+                self._pending -= 1
+            return None
+        future.add_done_callback(lambda done: self._finished(source_key, done, on_done))
+        return future
+
+    def _finished(self, source_key: str, future: Future, on_done):
+        error = None if future.cancelled() else future.exception()
+        with self._lock:
+            self._pending -= 1
+            if future.cancelled() or error is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+        if future.cancelled():
+            return
+        if error is not None:
+            print(f"⚠️ 이미지 변환 실패 ({source_key}): {error}")
+            return
+        if on_done is not None:
+            try:
+                on_done(source_key, future.result())
+            except Exception as e:
+                print(f"⚠️ 이미지 변환 후처리 실패 ({source_key}): {e}")
+
+
+# 전역 이미지 변환 파이프라인
+image_pipeline = ImagePipeline()
@@ -0,0 +1,156 @@
+"""
+목록 조회 페이지네이션 (skip/limit + 커서 기반 keyset)
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Sequence, Tuple
+from fastapi import HTTPException, status
+from sqlalchemy import DateTime, Select, String, and_, literal_column, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+
+# (컬럼, 내림차순 여부) 목록. 마지막 컬럼은 반드시 고유해야 함 (보통 id)
+SortKey = Sequence[Tuple[Any, bool]]
+
+
+def encode_cursor(values: List[Any]) -> str:
+    """정렬 키 값을 불투명한 커서 문자열로 인코딩"""
+    raw = json.dumps([_to_cursor_value(v) for v in values], ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """커서 문자열을 정렬 키 값 목록으로 디코딩"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (ValueError, UnicodeError):
+        values = None
+
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="잘못된 커서입니다."
+        )
+    return values
+
+
+def keyset_condition(sort_key: SortKey, values: List[Any]):
+    """(a, b, id) 다음 행을 고르는 조건식 (a < x) OR (a = x AND b < y) OR ..."""
+    # Boolean 컬럼은 True/False와 대소 비교가 불가하므로 0/1로 비교
+    values = [int(v) if isinstance(v, bool) else v for v in values]
+    clauses = []
+    for i, (column, descending) in enumerate(sort_key):
+        equals = [_comparable(col) == values[j] for j, (col, _) in enumerate(sort_key[:i])]
+        target = _comparable(column)
+        step = target < values[i] if descending else target > values[i]
+        clauses.append(and_(*equals, step))
+    return or_(*clauses)
+
+
+def page_statement(query, sort_key: SortKey, skip: int, limit: int, cursor: Optional[str] = None):
+    """정렬/커서/skip 조건을 적용한 페이지 쿼리 (Query와 select() 모두 지원)
+
+    다음 페이지 존재 여부 확인을 위해 limit보다 한 행 더 조회합니다.
+    """
+    # 커서 조건과 같은 식으로 정렬해야 경계에서 행이 빠지거나 중복되지 않음
+    query = query.order_by(*[
+        _comparable(col).desc() if descending else _comparable(col).asc() for col, descending in sort_key
+    ])
+
+    if cursor:
+        values = decode_cursor(cursor, len(sort_key))
+        query = query.filter(keyset_condition(sort_key, values))
+    elif skip:
+        query = query.offset(skip)
+
+    return query.limit(limit + 1)
+
+
+def split_page(items: list, sort_key: SortKey, limit: int) -> Tuple[list, Optional[str]]:
+    """limit + 1개 조회 결과를 한 페이지와 다음 페이지 커서로 분리"""
+    if len(items) <= limit:
+        return items, None
+
+    items = items[:limit]
+    last = items[-1]
+    return items, encode_cursor([getattr(last, col.key) for col, _ in sort_key])
+
+
+def paginate(
+    query: Query,
+    sort_key: SortKey,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[list, Optional[str]]:
+    """정렬 키로 정렬한 한 페이지와 다음 페이지 커서 반환
+
+    커서가 주어지면 skip은 무시하고 마지막으로 본 행 이후부터 조회하므로
+    깊은 페이지도 첫 페이지와 같은 비용으로 조회됩니다.
+    """
+    items = page_statement(query, sort_key, skip, limit, cursor).all()
+    return split_page(items, sort_key, limit)
+
+
+async def paginate_async(
+    db: AsyncSession,
+    statement: Select,
+    sort_key: SortKey,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None
+) -> Tuple[list, Optional[str]]:
+    """paginate의 AsyncSession 버전 (select() 문 사용)
+
+    엔티티 하나를 조회하면 ORM 객체, 여러 컬럼(projection)을 조회하면 Row 목록을 반환합니다.
+    """
+    result = await db.execute(page_statement(statement, sort_key, skip, limit, cursor))
+    if len(statement.column_descriptions) == 1:
+        items = list(result.scalars().all())
+    else:
+        items = list(result.all())
+    return split_page(items, sort_key, limit)
+
+
+# SQLite DateTime 텍스트를 마이크로초까지 고정 폭으로 맞춘 형식 (커서 값도 같은 형식)
+SORTABLE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def sortable_datetime_sql(column_name: str) -> str:
+    """DateTime 컬럼을 'YYYY-MM-DD HH:MM:SS.ffffff'로 맞추는 SQL 식
+
+    SQLite는 DateTime을 텍스트로 저장하는데, func.now() 기본값은 초 단위("... 10:00:00")이고
+    Python datetime으로 쓴 값은 마이크로초까지("... 10:00:00.000000") 저장되어 문자열 비교 결과가
+    시각 순서와 어긋납니다. 소수 부분을 6자리로 채워 형식을 통일합니다.
+    같은 식으로 만든 표현식 색인(models.notice)을 정렬에 그대로 사용할 수 있도록 상수만 씁니다.
+    """
+    return (
+        f"(substr({column_name}, 1, 19) || '.' || "
+        f"substr(substr({column_name}, 21) || '000000', 1, 6))"
+    )
+
+
+def sortable_datetime(column):
+    """정렬/커서 비교용 DateTime 식 (테이블 이름으로 한정)"""
+    column = column.expression
+    return literal_column(sortable_datetime_sql(f"{column.table.name}.{column.name}"), String)
+
+
+def _to_cursor_value(value: Any) -> Any:
+    if isinstance(value, datetime):
+        # sortable_datetime과 같은 형식으로 직렬화 (문자열로 비교)
+        if value.tzinfo is not None:
+            value = value.replace(tzinfo=None)
+        return value.strftime(SORTABLE_DATETIME_FORMAT)
+    if hasattr(value, "value"):
+        return value.value
+    return value
+
+
+def _comparable(column):
+    # SQLite는 DateTime을 텍스트로 저장하므로 형식을 맞춘 뒤 커서 값과 문자열로 비교
+    if isinstance(column.type, DateTime):
+        return sortable_datetime(column)
+    return column
@@ -0,0 +1,109 @@
+"""
+비밀번호 해싱 전용 작업자 풀
+
+bcrypt 해싱/검증은 요청 하나에 수백 ms씩 CPU를 쓰므로, 요청 스레드풀에서 실행하면
+로그인이 몰릴 때 다른 API까지 스레드를 기다리게 됩니다. 해싱은 별도 프로세스 풀에서 실행하고,
+대기 중인 작업이 상한을 넘으면 기다리게 하지 않고 바로 503으로 거절합니다.
+"""
+import asyncio
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Optional, Tuple
+from fastapi import HTTPException, status
+from ..config import settings
+from .security import get_password_hash, verify_and_update_password
+
+
+class PasswordPool:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor: Optional[Executor] = None
+        self._pending = 0
+        self.workers = 0
+        self.max_pending = 0
+        self.completed = 0
+        self.rejected = 0
+
+    def start(self):
+        """설정에 따라 작업자 풀 생성 (작업자 프로세스는 첫 작업 때 필요한 만큼 생성됨)"""
+        with self._lock:
+            if self._executor is not None:
+                return
+            self.workers = settings.PASSWORD_HASH_WORKERS or os.cpu_count() or 1
+            self.max_pending = settings.PASSWORD_HASH_MAX_PENDING or self.workers * 4
+            if settings.PASSWORD_HASH_EXECUTOR == "thread":
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password")
+            else:
+                # 앱 스레드(조회수 반영, 캐시 구독 등)를 복제하지 않도록 spawn으로 시작
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            print(f"🔐 비밀번호 해싱 풀 시작 ({settings.PASSWORD_HASH_EXECUTOR}, 작업자 {self.workers}개, 대기 상한 {self.max_pending})")
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "executor": settings.PASSWORD_HASH_EXECUTOR,
+                "workers": self.workers,
+                "max_pending": self.max_pending,
+                "pending": self._pending,
+                "completed": self.completed,
+                "rejected": self.rejected,
+            }
+
+    async def run(self, fn: Callable, *args):
+        """작업자 풀에서 fn 실행 - 대기 작업이 상한이면 503 (Retry-After)"""
+        self.start()
+        with self._lock:
+            if self._pending >= self.max_pending:
+                self.rejected += 1
+                raise HTTPException(
+                    status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                    detail="로그인 요청이 많아 잠시 후 다시 시도해 주세요.",
+                    headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER)},
+                )
+            self._pending += 1
+            executor = self._executor
+
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # 작업자 프로세스가 비정상 종료된 경우 다음 요청에서 풀을 새로 만듦
+            print("⚠️ 비밀번호 해싱 작업자 프로세스 오류 - 풀 재시작")
+            with self._lock:
+                if self._executor is executor:
+                    self._executor = None
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="일시적인 오류입니다. 잠시 후 다시 시도해 주세요.",
+                headers={"Retry-After": str(settings.PASSWORD_HASH_RETRY_AFTER)},
+            )
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+        with self._lock:
+            self.completed += 1
+        return result
+
+    async def hash(self, password: str) -> str:
+        return await self.run(get_password_hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """(검증 결과, 비용이 바뀐 경우 새 해시)"""
+        return await self.run(verify_and_update_password, plain_password, hashed_password)
+
+
+# 전역 비밀번호 해싱 풀
+password_pool = PasswordPool()
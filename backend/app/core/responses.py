@@ -0,0 +1,52 @@
+"""
+빠른 JSON 응답 (orjson)
+
+앱 기본 응답 클래스는 FastAPI의 ORJSONResponse입니다 (main.py의 default_response_class).
+DB에서 읽은 행은 이미 응답 스키마와 같은 형태이므로, 목록 응답은 ORM 객체를 만들거나
+Pydantic으로 다시 검증하지 않고 컬럼 projection 결과를 dict로 바꿔 바로 직렬화합니다.
+"""
+from typing import Any, Callable, Optional, Sequence
+import orjson
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+
+def dumps(content: Any) -> bytes:
+    """JSON 바이트 직렬화 (datetime/Enum은 orjson이 직접 처리, NDJSON 스트리밍용)"""
+    return orjson.dumps(content)
+
+
+def schema_columns(model, schema: type[BaseModel]) -> list:
+    """응답 스키마 필드에 해당하는 테이블 컬럼 목록 (select(*columns) projection용)"""
+    table_columns = model.__table__.columns
+    return [table_columns[name] for name in schema.model_fields if name in table_columns]
+
+
+def list_response(
+    key: str,
+    rows: Sequence,
+    total: Optional[int],
+    skip: int,
+    limit: int,
+    next_cursor: Optional[str],
+    headers: Optional[dict] = None,
+    extend: Optional[Callable[[dict], None]] = None
+) -> ORJSONResponse:
+    """projection Row 목록으로 *List 스키마와 같은 모양의 응답 생성 (재검증 없음)
+
+    extend는 컬럼이 아닌 파생 필드를 항목 dict에 채워 넣는 함수입니다.
+    """
+    items = [row._asdict() for row in rows]
+    if extend is not None:
+        for item in items:
+            extend(item)
+    return ORJSONResponse(
+        {
+            key: items,
+            "total": total,
+            "page": skip // limit + 1,
+            "size": limit,
+            "next_cursor": next_cursor,
+        },
+        headers=headers,
+    )
@@ -0,0 +1,367 @@
+"""
+업로드 정적 파일 서빙
+
+StaticFiles는 요청마다 스레드풀에서 stat/open/read를 하므로, 작은 이미지가 많은 목록 화면에서는
+파일 I/O보다 스레드 왕복 비용이 더 큽니다. 여기서는 stat 결과와 작은 파일 본문을 메모리 LRU에
+보관해 캐시 적중 시 이벤트 루프에서 바로 응답하고, 큰 파일은 서버가 지원하면
+zero-copy(sendfile) 확장으로, 아니면 스레드풀에서 청크 단위로 보냅니다.
+
+- 내용 주소(SHA-256) 파일과 변환본은 Cache-Control: immutable, 원본은 다이제스트를 강한 ETag로 사용
+- If-None-Match / If-Modified-Since 304, 단일 Range(If-Range 포함) 206/416
+- 같은 이름의 .br / .gz 파일이 있으면 Accept-Encoding에 따라 미리 압축된 파일 전송
+"""
+import mimetypes
+import os
+import re
+import stat
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Dict, List, Optional, Tuple
+import anyio
+from ..config import settings
+from .compression import negotiate
+
+# 내용 주소 도입 전 파일 등 이름이 내용을 보장하지 않는 파일의 캐시 정책
+CACHE_CONTROL_STATIC = "public, max-age=300"
+
+# {digest}.{ext} 원본 또는 variants/{digest}/ 아래 변환본
+CONTENT_ADDRESSED_PATH = re.compile(
+    r"(?:^|/)(?:(?P<digest>[0-9a-f]{64})\.[a-z0-9]+|variants/[0-9a-f]{64}/[^/]+)$"
+)
+
+# 미리 압축된 파일 확장자 (선호 순서)
+PRECOMPRESSED = {"br": ".br", "gzip": ".gz"}
+
+CHUNK_SIZE = 64 * 1024
+
+mimetypes.add_type("image/webp", ".webp")
+mimetypes.add_type("image/avif", ".avif")
+
+
+@dataclass
+class _Representation:
+    """파일 하나의 전송 형태 (원본 또는 미리 압축된 형제 파일)"""
+    path: str
+    size: int
+    etag: str
+    encoding: Optional[str] = None
+    body: Optional[bytes] = None  # 작은 파일이면 본문을 메모리에 보관
+
+
+@dataclass
+class _Entry:
+    identity: _Representation
+    mtime: float
+    last_modified: str
+    content_type: str
+    cache_control: str
+    encoded: Dict[str, _Representation] = field(default_factory=dict)
+    checked_at: float = 0.0
+
+    @property
+    def cached_bytes(self) -> int:
+        return sum(len(rep.body) for rep in (self.identity, *self.encoded.values()) if rep.body is not None)
+
+
+def _route_path(scope) -> str:
+    """마운트 경로를 뺀 요청 경로"""
+    path, root_path = scope["path"], scope.get("root_path", "")
+    if root_path and path.startswith(root_path) and path[len(root_path):len(root_path) + 1] in ("", "/"):
+        return path[len(root_path):]
+    return path
+
+
+def _etag(st: os.stat_result, digest: Optional[str], suffix: str = "") -> str:
+    if digest:
+        return f'"{digest}{suffix}"'
+    return f'"{st.st_size:x}-{st.st_mtime_ns:x}{suffix}"'
+
+
+def _parse_range(value: str, size: int) -> Optional[Tuple[int, int]]:
+    """단일 bytes 범위 -> (start, end 포함)
+
+    여러 범위이거나 해석할 수 없으면 None(범위를 무시하고 전체 전송), 파일 밖 범위면 ValueError(416).
+    """
+    unit, _, spec = value.partition("=")
+    start_text, dash, end_text = spec.strip().partition("-")
+    if (
+        unit.strip().lower() != "bytes" or "," in spec or not dash
+        or not (start_text.isdigit() or start_text == "")
+        or not (end_text.isdigit() or end_text == "")
+        or start_text == end_text == ""
+    ):
+        return None
+    if start_text == "":
+        length = int(end_text)
+        if length == 0:
+            raise ValueError("빈 범위")
+        return max(size - length, 0), size - 1
+    start = int(start_text)
+    if end_text and int(end_text) < start:
+        return None
+    if start >= size:
+        raise ValueError("범위 밖")
+    end = int(end_text) if end_text else size - 1
+    return start, min(end, size - 1)
+
+
+def _etag_matches(header: str, etag: str, weak: bool = True) -> bool:
+    if header.strip() == "*":
+        return True
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if weak:
+            candidate = candidate.removeprefix("W/")
+        if candidate == etag:
+            return True
+    return False
+
+
+class StaticFileServer:
+    """디렉터리 하나를 서빙하는 ASGI 앱 (Mount에 StaticFiles 대신 사용)"""
+
+    def __init__(self, directory: str):
+        self.directory = os.path.realpath(directory)
+        self._entries: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def snapshot(self) -> dict:
+        return {
+            "entries": len(self._entries),
+            "cached_bytes": self._cached_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def clear(self):
+        self._entries.clear()
+        self._cached_bytes = 0
+
+    # --- 파일 조회 (캐시) ---
+
+    def _resolve(self, route_path: str) -> Optional[str]:
+        """요청 경로 -> 디렉터리 안의 실제 경로 (숨김 파일/상위 경로/디렉터리 밖 링크 거절)"""
+        parts = [part for part in route_path.split("/") if part]
+        if not parts or any(part.startswith(".") or "\\" in part or "\0" in part for part in parts):
+            return None
+        path = os.path.realpath(os.path.join(self.directory, *parts))
+        if os.path.commonpath([path, self.directory]) != self.directory:
+            return None
+        return path
+
+    def _load(self, path: str, key: str, previous: Optional[_Entry]) -> Optional[_Entry]:
+        """stat 후 캐시 항목 생성 (스레드풀에서 실행) - 바뀌지 않았으면 기존 본문 재사용"""
+        try:
+            st = os.stat(path)
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        if not stat.S_ISREG(st.st_mode):
+            return None
+        if previous is not None and previous.mtime == st.st_mtime and previous.identity.size == st.st_size:
+            return previous
+
+        match = CONTENT_ADDRESSED_PATH.search(key)
+        digest = match.group("digest") if match else None
+        small = settings.STATIC_SMALL_FILE_MAX_SIZE
+
+        def representation(file_path: str, file_stat: os.stat_result, encoding: Optional[str]) -> _Representation:
+            body = None
+            if file_stat.st_size <= small:
+                with open(file_path, "rb") as handle:
+                    body = handle.read()
+            suffix = f"-{encoding}" if encoding else ""
+            return _Representation(file_path, file_stat.st_size, _etag(st, digest, suffix), encoding, body)
+
+        content_type, _ = mimetypes.guess_type(path)
+        if content_type is None:
+            content_type = "application/octet-stream"
+        elif content_type.startswith("text/") or content_type in ("application/json", "application/javascript", "image/svg+xml"):
+            content_type += "; charset=utf-8"
+
+        encoded = {}
+        for encoding, extension in PRECOMPRESSED.items():
+            try:
+                sibling = os.stat(path + extension)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+            # 원본보다 오래된 압축본은 내용이 다를 수 있으므로 사용하지 않음
+            if stat.S_ISREG(sibling.st_mode) and sibling.st_mtime >= st.st_mtime:
+                encoded[encoding] = representation(path + extension, sibling, encoding)
+
+        return _Entry(
+            identity=representation(path, st, None),
+            mtime=st.st_mtime,
+            last_modified=formatdate(st.st_mtime, usegmt=True),
+            content_type=content_type,
+            cache_control=(
+                f"public, max-age={settings.STATIC_IMMUTABLE_MAX_AGE}, immutable" if match else CACHE_CONTROL_STATIC
+            ),
+            encoded=encoded,
+        )
+
+    async def _lookup(self, key: str) -> Optional[_Entry]:
+        now = time.monotonic()
+        entry = self._entries.get(key)
+        if entry is not None and now - entry.checked_at < settings.STATIC_STAT_CACHE_TTL:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+        self.misses += 1
+        path = self._resolve(key)
+        if path is None:
+            return None
+        loaded = await anyio.to_thread.run_sync(self._load, path, key, entry)
+        self._forget(key)
+        if loaded is None:
+            return None
+        loaded.checked_at = now
+        self._entries[key] = loaded
+        self._cached_bytes += loaded.cached_bytes
+        while self._entries and (
+            len(self._entries) > settings.STATIC_STAT_CACHE_ENTRIES
+            or self._cached_bytes > settings.STATIC_MEMORY_CACHE_BYTES
+        ):
+            self._forget(next(iter(self._entries)))
+        return loaded
+
+    def _forget(self, key: str):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._cached_bytes -= entry.cached_bytes
+
+    # --- 응답 ---
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return
+        method = scope["method"]
+        if method not in ("GET", "HEAD"):
+            await self._plain(send, 405, b"Method Not Allowed", [(b"allow", b"GET, HEAD")])
+            return
+
+        entry = await self._lookup(_route_path(scope))
+        if entry is None:
+            await self._plain(send, 404, b"Not Found")
+            return
+
+        request_headers = {name: value.decode("latin-1") for name, value in scope.get("headers", [])}
+        range_header = request_headers.get(b"range")
+
+        # 부분 요청은 원본 기준으로만 처리 (압축본의 바이트 범위는 의미가 다름)
+        rep = entry.identity
+        if entry.encoded and range_header is None:
+            encoding = negotiate(request_headers.get(b"accept-encoding"), list(entry.encoded))
+            if encoding is not None:
+                rep = entry.encoded[encoding]
+
+        headers = [
+            (b"etag", rep.etag.encode("latin-1")),
+            (b"last-modified", entry.last_modified.encode("latin-1")),
+            (b"cache-control", entry.cache_control.encode("latin-1")),
+        ]
+        if entry.encoded:
+            headers.append((b"vary", b"Accept-Encoding"))
+
+        if self._not_modified(request_headers, rep, entry):
+            await send({"type": "http.response.start", "status": 304, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        headers.append((b"content-type", entry.content_type.encode("latin-1")))
+        headers.append((b"accept-ranges", b"bytes"))
+        if rep.encoding:
+            headers.append((b"content-encoding", rep.encoding.encode("latin-1")))
+
+        status_code, start, end = 200, 0, rep.size - 1
+        if range_header is not None and rep.size > 0 and self._range_applies(request_headers, rep, entry):
+            try:
+                byte_range = _parse_range(range_header, rep.size)
+            except ValueError:
+                await self._plain(send, 416, b"Range Not Satisfiable", [
+                    (b"content-range", f"bytes */{rep.size}".encode("latin-1")),
+                ])
+                return
+            if byte_range is not None:
+                status_code, (start, end) = 206, byte_range
+                headers.append((b"content-range", f"bytes {start}-{end}/{rep.size}".encode("latin-1")))
+
+        length = end - start + 1
+        headers.append((b"content-length", str(length).encode("latin-1")))
+        await send({"type": "http.response.start", "status": status_code, "headers": headers})
+
+        if method == "HEAD" or length == 0:
+            await send({"type": "http.response.body", "body": b""})
+        elif rep.body is not None:
+            await send({"type": "http.response.body", "body": rep.body[start:end + 1]})
+        else:
+            await self._send_file(scope, send, rep.path, start, length, full=status_code == 200)
+
+    @staticmethod
+    def _not_modified(request_headers: dict, rep: _Representation, entry: _Entry) -> bool:
+        if_none_match = request_headers.get(b"if-none-match")
+        if if_none_match is not None:
+            return _etag_matches(if_none_match, rep.etag)
+        if_modified_since = request_headers.get(b"if-modified-since")
+        if if_modified_since:
+            try:
+                return int(entry.mtime) <= parsedate_to_datetime(if_modified_since).timestamp()
+            except (TypeError, ValueError):
+                return False
+        return False
+
+    @staticmethod
+    def _range_applies(request_headers: dict, rep: _Representation, entry: _Entry) -> bool:
+        """If-Range가 현재 파일과 맞지 않으면 범위를 무시하고 전체 전송"""
+        if_range = request_headers.get(b"if-range")
+        if if_range is None:
+            return True
+        if if_range.startswith('"'):
+            return _etag_matches(if_range, rep.etag, weak=False)
+        return if_range == entry.last_modified
+
+    @staticmethod
+    async def _plain(send, status_code: int, body: bytes, headers: Optional[List[Tuple[bytes, bytes]]] = None):
+        await send({
+            "type": "http.response.start",
+            "status": status_code,
+            "headers": [
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", str(len(body)).encode("latin-1")),
+                *(headers or []),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
+
+    @staticmethod
+    async def _send_file(scope, send, path: str, start: int, length: int, full: bool):
+        """서버 확장(zero-copy/pathsend)이 있으면 사용하고, 없으면 스레드풀에서 청크 단위로 읽어 전송"""
+        extensions = scope.get("extensions") or {}
+        if "http.response.zerocopysend" in extensions:
+            with open(path, "rb") as handle:
+                await send({
+                    "type": "http.response.zerocopysend",
+                    "file": handle,
+                    "offset": start,
+                    "count": length,
+                })
+            return
+        if full and "http.response.pathsend" in extensions:
+            await send({"type": "http.response.pathsend", "path": path})
+            return
+
+        async with await anyio.open_file(path, "rb") as handle:
+            await handle.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = await handle.read(min(CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                await send({"type": "http.response.body", "body": chunk, "more_body": remaining > 0})
+            if remaining > 0:  # 전송 중 파일이 줄어든 경우에도 응답은 끝냄
+                await send({"type": "http.response.body", "body": b""})
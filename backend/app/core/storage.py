@@ -0,0 +1,335 @@
+"""
+업로드 파일 저장소 백엔드 (로컬 디스크 / S3 호환 버킷)
+
+업로드를 각 서버의 uploads/ 디렉터리에 두면 서버를 여러 대로 늘렸을 때 다른 서버에서
+파일을 찾을 수 없으므로, 저장 위치를 백엔드로 분리합니다. 키는 "profile_images/<sha256>.jpg"
+같은 상대 경로이고, 응답에 쓰는 URL은 백엔드가 만듭니다.
+
+- local: settings.UPLOAD_DIR 아래에 저장하고 /uploads 경로로 제공 (개발/단일 서버, 로컬 대체 구현)
+- s3: S3 호환 버킷(AWS S3, MinIO 등)에 저장. 클라이언트는 프로세스당 하나를 만들어 스레드 간에
+  공유하고(연결 풀), 파일은 PUT 한 번으로 보냅니다. 브라우저가 API 서버를 거치지 않고
+  버킷에 직접 올릴 수 있도록 서명된(presigned) 업로드 URL을 발급합니다.
+
+boto3는 STORAGE_BACKEND=s3일 때만 필요합니다.
+"""
+import os
+import shutil
+from abc import ABC, abstractmethod
+import tempfile
+import threading
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Iterator, Optional
+from urllib.parse import quote
+from ..config import settings
+
+try:
+    import boto3
+    from botocore.config import Config as BotoConfig
+    from botocore.exceptions import ClientError
+except ImportError:  # 선택적 의존성
+    boto3 = None
+
+
+@dataclass
+class StorageObject:
+    key: str
+    size: int
+    modified: datetime  # UTC
+
+
+class StorageBackend(ABC):
+    """업로드 저장소 공통 인터페이스 (필수 메서드가 빠진 백엔드는 생성할 때 TypeError)"""
+
+    name = "base"
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        ...
+
+    @abstractmethod
+    def head(self, key: str) -> Optional[StorageObject]:
+        ...
+
+    def exists(self, key: str) -> bool:
+        return self.head(key) is not None
+
+    @abstractmethod
+    def store_file(self, local_path: str, key: str, content_type: str, cache_control: Optional[str] = None):
+        """로컬 임시 파일을 key로 저장 (임시 파일은 옮겨지거나 삭제됨)"""
+
+    def local_path(self, key: str) -> Optional[str]:
+        """key를 바로 열 수 있는 로컬 경로 (원격 저장소면 None)"""
+        return None
+
+    @abstractmethod
+    def download_file(self, key: str, local_path: str):
+        ...
+
+    @abstractmethod
+    def read_range(self, key: str, start: int, length: int) -> bytes:
+        ...
+
+    @abstractmethod
+    def delete(self, key: str) -> bool:
+        ...
+
+    @abstractmethod
+    def delete_prefix(self, prefix: str) -> int:
+        """prefix("<디렉터리>/") 아래 객체 모두 삭제"""
+
+    @abstractmethod
+    def iter_objects(self, prefix: str, recursive: bool = False) -> Iterator[StorageObject]:
+        """prefix("<디렉터리>/") 아래 객체 목록 (recursive=False면 바로 아래만)"""
+
+    def spool_directory(self, key: str) -> str:
+        """key로 저장할 임시 파일을 만들 디렉터리 (로컬이면 같은 파일시스템이라 이름 변경만으로 저장)"""
+        return tempfile.gettempdir()
+
+    def presign_upload(
+        self, key: str, content_type: str, size: int, checksum_sha256: str, cache_control: Optional[str] = None
+    ) -> Optional[dict]:
+        """클라이언트가 직접 올릴 서명된 업로드 요청 (지원하지 않으면 None)"""
+        return None
+
+    def close(self):
+        pass
+
+
+class LocalStorageBackend(StorageBackend):
+    name = "local"
+
+    def __init__(self, root: str, url_prefix: str):
+        self.root = os.path.abspath(root)
+        self.url_prefix = url_prefix.rstrip("/")
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if os.path.commonpath([path, self.root]) != self.root:
+            raise ValueError(f"저장소 밖 경로입니다: {key}")
+        return path
+
+    def url(self, key: str) -> str:
+        return f"{self.url_prefix}/{quote(key)}"
+
+    def head(self, key: str) -> Optional[StorageObject]:
+        try:
+            st = os.stat(self._path(key))
+        except (FileNotFoundError, NotADirectoryError):
+            return None
+        return StorageObject(key, st.st_size, datetime.fromtimestamp(st.st_mtime, timezone.utc))
+
+    def store_file(self, local_path: str, key: str, content_type: str, cache_control: Optional[str] = None):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(local_path, path)
+
+    def local_path(self, key: str) -> Optional[str]:
+        return self._path(key)
+
+    def download_file(self, key: str, local_path: str):
+        shutil.copyfile(self._path(key), local_path)
+
+    def read_range(self, key: str, start: int, length: int) -> bytes:
+        with open(self._path(key), "rb") as handle:
+            handle.seek(start)
+            return handle.read(length)
+
+    def delete(self, key: str) -> bool:
+        try:
+            os.unlink(self._path(key))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        directory = self._path(prefix)
+        count = sum(len(files) for _, _, files in os.walk(directory))
+        shutil.rmtree(directory, ignore_errors=True)
+        return count
+
+    def iter_objects(self, prefix: str, recursive: bool = False) -> Iterator[StorageObject]:
+        directory = self._path(prefix)
+        if not os.path.isdir(directory):
+            return
+        for current, directories, files in os.walk(directory):
+            relative = os.path.relpath(current, self.root).replace(os.sep, "/")
+            for name in files:
+                if name.startswith("."):  # 업로드/변환 중인 임시 파일
+                    continue
+                st = os.stat(os.path.join(current, name))
+                yield StorageObject(
+                    f"{relative}/{name}", st.st_size, datetime.fromtimestamp(st.st_mtime, timezone.utc)
+                )
+            if not recursive:
+                break
+
+    def spool_directory(self, key: str) -> str:
+        directory = os.path.dirname(self._path(key))
+        os.makedirs(directory, exist_ok=True)
+        return directory
+
+
+class S3StorageBackend(StorageBackend):
+    name = "s3"
+
+    def __init__(
+        self,
+        bucket: str,
+        region: str,
+        endpoint_url: Optional[str] = None,
+        access_key_id: Optional[str] = None,
+        secret_access_key: Optional[str] = None,
+        public_url: Optional[str] = None,
+        max_pool_connections: int = 32,
+        presign_expires: int = 300,
+    ):
+        self.bucket = bucket
+        self.presign_expires = presign_expires
+        # 클라이언트 하나를 프로세스 안의 모든 스레드가 공유 (botocore 연결 풀 재사용)
+        self.client = boto3.session.Session().client(
+            "s3",
+            region_name=region,
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            config=BotoConfig(
+                max_pool_connections=max_pool_connections,
+                retries={"max_attempts": 3, "mode": "standard"},
+                signature_version="s3v4",
+                # MinIO 등 사용자 지정 엔드포인트는 경로 방식 주소
+                s3={"addressing_style": "path" if endpoint_url else "auto"},
+                # 서명된 URL에 SDK 기본 체크섬 파라미터가 붙지 않도록 필요할 때만 계산
+                request_checksum_calculation="when_required",
+                response_checksum_validation="when_required",
+            ),
+        )
+        if public_url:
+            self.base_url = public_url.rstrip("/")
+        elif endpoint_url:
+            self.base_url = f"{endpoint_url.rstrip('/')}/{bucket}"
+        else:
+            self.base_url = f"https://{bucket}.s3.{region}.amazonaws.com"
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{quote(key)}"
+
+    def head(self, key: str) -> Optional[StorageObject]:
+        try:
+            response = self.client.head_object(Bucket=self.bucket, Key=key)
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+        return StorageObject(key, response["ContentLength"], response["LastModified"])
+
+    def store_file(self, local_path: str, key: str, content_type: str, cache_control: Optional[str] = None):
+        """PUT 한 번으로 업로드
+
+        업로드 크기 상한(5MB)이 S3 멀티파트의 최소 파트 크기와 같아 파트로 나눌 이득이 없으므로
+        전송 관리자(s3transfer)의 스레드와 파트 분할 없이 바로 보냅니다.
+        """
+        extra = {"ContentType": content_type}
+        if cache_control:
+            extra["CacheControl"] = cache_control
+        try:
+            with open(local_path, "rb") as handle:
+                self.client.put_object(
+                    Bucket=self.bucket, Key=key, Body=handle, ContentLength=os.fstat(handle.fileno()).st_size, **extra
+                )
+        finally:
+            os.unlink(local_path)
+
+    def download_file(self, key: str, local_path: str):
+        self.client.download_file(self.bucket, key, local_path)
+
+    def read_range(self, key: str, start: int, length: int) -> bytes:
+        response = self.client.get_object(Bucket=self.bucket, Key=key, Range=f"bytes={start}-{start + length - 1}")
+        with response["Body"] as body:
+            return body.read()
+
+    def delete(self, key: str) -> bool:
+        if self.head(key) is None:
+            return False
+        self.client.delete_object(Bucket=self.bucket, Key=key)
+        return True
+
+    def delete_prefix(self, prefix: str) -> int:
+        keys = [obj.key for obj in self.iter_objects(prefix, recursive=True)]
+        for start in range(0, len(keys), 1000):  # DeleteObjects 한 번에 최대 1000개
+            self.client.delete_objects(
+                Bucket=self.bucket,
+                Delete={"Objects": [{"Key": key} for key in keys[start:start + 1000]], "Quiet": True},
+            )
+        return len(keys)
+
+    def iter_objects(self, prefix: str, recursive: bool = False) -> Iterator[StorageObject]:
+        options = {"Bucket": self.bucket, "Prefix": prefix}
+        if not recursive:
+            options["Delimiter"] = "/"
+        for page in self.client.get_paginator("list_objects_v2").paginate(**options):
+            for item in page.get("Contents", []):
+                yield StorageObject(item["Key"], item["Size"], item["LastModified"])
+
+    def presign_upload(
+        self, key: str, content_type: str, size: int, checksum_sha256: str, cache_control: Optional[str] = None
+    ) -> Optional[dict]:
+        """서명된 PUT 요청 - 크기/형식/SHA-256이 서명에 포함되어 다른 내용은 버킷이 거절"""
+        params = {
+            "Bucket": self.bucket,
+            "Key": key,
+            "ContentType": content_type,
+            "ContentLength": size,
+            "ChecksumSHA256": checksum_sha256,
+        }
+        headers = {"Content-Type": content_type, "x-amz-checksum-sha256": checksum_sha256}
+        if cache_control:
+            params["CacheControl"] = cache_control
+            headers["Cache-Control"] = cache_control
+        url = self.client.generate_presigned_url("put_object", Params=params, ExpiresIn=self.presign_expires)
+        return {"method": "PUT", "url": url, "headers": headers, "expires_in": self.presign_expires}
+
+    def close(self):
+        self.client.close()
+
+
+def create_storage() -> StorageBackend:
+    """설정에 따라 저장소 백엔드 생성"""
+    if settings.STORAGE_BACKEND == "s3":
+        if boto3 is None:
+            raise RuntimeError("STORAGE_BACKEND=s3에는 boto3 패키지가 필요합니다.")
+        if not settings.AWS_S3_BUCKET:
+            raise RuntimeError("STORAGE_BACKEND=s3에는 AWS_S3_BUCKET 설정이 필요합니다.")
+        return S3StorageBackend(
+            bucket=settings.AWS_S3_BUCKET,
+            region=settings.AWS_REGION,
+            endpoint_url=settings.AWS_S3_ENDPOINT_URL,
+            access_key_id=settings.AWS_ACCESS_KEY_ID,
+            secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+            public_url=settings.AWS_S3_PUBLIC_URL,
+            max_pool_connections=settings.AWS_S3_MAX_POOL_CONNECTIONS,
+            presign_expires=settings.AWS_S3_PRESIGN_EXPIRES,
+        )
+    return LocalStorageBackend(settings.UPLOAD_DIR, settings.STORAGE_LOCAL_URL)
+
+
+# 전역 저장소 백엔드 (처음 사용할 때 생성, 이미지 변환 작업자 프로세스는 각자 생성)
+_storage: Optional[StorageBackend] = None
+_storage_lock = threading.Lock()
+
+
+def get_storage() -> StorageBackend:
+    global _storage
+    if _storage is None:
+        with _storage_lock:
+            if _storage is None:
+                _storage = create_storage()
+    return _storage
+
+
+def close_storage():
+    global _storage
+    with _storage_lock:
+        storage, _storage = _storage, None
+    if storage is not None:
+        storage.close()
@@ -0,0 +1,162 @@
+"""
+목록 조회 전체 개수(total) 캐시
+
+(테이블, 필터 조합)별로 COUNT(*) 결과를 저장하고, 라우터의 쓰기 작업이
+테이블 세대(generation)를 올려 캐시를 무효화합니다.
+공유 캐시(L2)를 사용 중이면 워커 메모리에 없는 개수를 다른 워커가 계산한 값에서 가져옵니다.
+"""
+import enum
+import threading
+import time
+from typing import Dict, Hashable, Optional, Tuple
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Query
+from starlette.concurrency import run_in_threadpool
+from ..config import settings
+from .cache_backend import get_cache_backend, versioned_key
+
+
+class TotalMode(str, enum.Enum):
+    EXACT = "exact"  # 항상 COUNT(*) 실행
+    ESTIMATE = "estimate"  # 무효화된 값이라도 허용 시간 내라면 그대로 사용
+    NONE = "none"  # 개수 계산 생략
+
+
+class TotalsCache:
+    def __init__(self, ttl: float, estimate_ttl: float, max_entries: int = 1024):
+        self.ttl = ttl
+        self.estimate_ttl = estimate_ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._generations: Dict[str, int] = {}
+        # key -> (개수, 세대, 저장 시각)
+        self._entries: Dict[Tuple[str, Hashable], Tuple[int, int, float]] = {}
+
+    def count(
+        self,
+        query: Query,
+        table: str,
+        filters: dict,
+        mode: Optional[TotalMode] = None
+    ) -> Optional[int]:
+        """캐시 정책에 따라 query의 전체 개수 반환
+
+        mode를 지정하지 않으면 쓰기로 무효화되지 않은 캐시 값만 사용합니다.
+        """
+        if mode == TotalMode.NONE:
+            return None
+
+        key = self._key(table, filters)
+        if mode != TotalMode.EXACT:
+            cached = self._lookup(key, table, allow_stale=mode == TotalMode.ESTIMATE)
+            if cached is not None:
+                return cached
+
+        generation = self._generation(table)
+        shared_key, shared_total = self._shared_lookup(key, table, mode)
+        if shared_total is not None:
+            self._store(key, shared_total, generation)
+            return shared_total
+
+        total = query.order_by(None).count()
+        self._store(key, total, generation)
+        self._shared_store(shared_key, total)
+        return total
+
+    async def count_async(
+        self,
+        db: AsyncSession,
+        statement: Select,
+        table: str,
+        filters: dict,
+        mode: Optional[TotalMode] = None
+    ) -> Optional[int]:
+        """count의 AsyncSession 버전 (select() 문 사용)"""
+        if mode == TotalMode.NONE:
+            return None
+
+        key = self._key(table, filters)
+        if mode != TotalMode.EXACT:
+            cached = self._lookup(key, table, allow_stale=mode == TotalMode.ESTIMATE)
+            if cached is not None:
+                return cached
+
+        generation = self._generation(table)
+        shared_key, shared_total = None, None
+        if get_cache_backend().available:
+            shared_key, shared_total = await run_in_threadpool(self._shared_lookup, key, table, mode)
+        if shared_total is not None:
+            self._store(key, shared_total, generation)
+            return shared_total
+
+        count_statement = select(func.count()).select_from(statement.order_by(None).subquery())
+        total = (await db.execute(count_statement)).scalar_one()
+        self._store(key, total, generation)
+        if shared_key is not None:
+            await run_in_threadpool(self._shared_store, shared_key, total)
+        return total
+
+    def invalidate(self, table: str):
+        """테이블 쓰기 후 호출 - 해당 테이블의 캐시된 개수를 무효화"""
+        with self._lock:
+            self._generations[table] = self._generations.get(table, 0) + 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def generation(self, table: str) -> int:
+        """테이블의 현재 세대 (이 프로세스에서 무효화될 때마다 증가)"""
+        return self._generation(table)
+
+    @staticmethod
+    def _key(table: str, filters: dict):
+        return (table, tuple(sorted(filters.items())))
+
+    def _generation(self, table: str) -> int:
+        with self._lock:
+            return self._generations.get(table, 0)
+
+    def _lookup(self, key, table: str, allow_stale: bool) -> Optional[int]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+
+            total, generation, stored_at = entry
+            age = time.monotonic() - stored_at
+            if allow_stale:
+                return total if age < self.estimate_ttl else None
+            if generation == self._generations.get(table, 0) and age < self.ttl:
+                return total
+            return None
+
+    def _shared_lookup(self, key, table: str, mode: Optional[TotalMode]):
+        """L2 조회 - (저장에 쓸 버전 키, 저장된 개수) 반환 (exact 모드는 저장만 함)"""
+        backend = get_cache_backend()
+        if not backend.available:
+            return None, None
+        versions = backend.tag_versions([table])
+        if versions is None:
+            return None, None
+        shared_key = versioned_key("totals", repr(key), versions)
+        if mode == TotalMode.EXACT:
+            return shared_key, None
+        value = backend.get(shared_key)
+        return shared_key, int(value) if value is not None else None
+
+    def _shared_store(self, shared_key: Optional[str], total: int):
+        if shared_key is not None:
+            get_cache_backend().set(shared_key, str(total).encode(), self.ttl)
+
+    def _store(self, key, total: int, generation: int):
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # 가장 먼저 저장된 항목 제거
+                self._entries.pop(next(iter(self._entries)))
+            self._entries[key] = (total, generation, time.monotonic())
+
+
+# 전역 totals 캐시 인스턴스
+totals = TotalsCache(ttl=settings.TOTALS_CACHE_TTL, estimate_ttl=settings.TOTALS_ESTIMATE_TTL)
@@ -0,0 +1,233 @@
+"""
+스트리밍 파일 업로드
+
+UploadFile을 쓰면 요청 본문 전체가 임시 파일로 스풀링된 뒤에야 크기를 확인할 수 있으므로,
+multipart 본문을 직접 청크 단위로 파싱하면서 크기 제한을 넘는 즉시 읽기를 중단합니다.
+파일 형식은 클라이언트가 보낸 Content-Type이 아니라 파일 앞부분의 시그니처(magic bytes)로 판별하고,
+임시 파일에 쓰면서 SHA-256을 계산하고, 완료되면 내용 주소 키로 저장소에 확정합니다
+(같은 내용이 이미 있으면 기존 파일 재사용). 로컬 저장소는 같은 디렉터리에서 원자적으로 이름만 바꾸고,
+S3 저장소는 크기 제한을 통과한 임시 파일을 버킷에 올립니다.
+디스크 쓰기, 해시 계산, 저장소 전송은 스레드풀에서 실행해 이벤트 루프를 막지 않습니다.
+"""
+import hashlib
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Dict, Optional
+from fastapi import HTTPException, Request, status
+from starlette.concurrency import run_in_threadpool
+from .content_store import ContentStore
+
+try:
+    from python_multipart.multipart import MultipartParser, parse_options_header
+except ImportError:  # python-multipart 0.0.13 미만
+    from multipart.multipart import MultipartParser, parse_options_header
+
+# 파일 외 multipart 경계/헤더 등에 허용할 여유 크기
+MULTIPART_OVERHEAD = 64 * 1024
+
+# 형식 판별에 필요한 앞부분 길이
+SNIFF_LENGTH = 12
+
+# 이미지 형식 -> 저장 확장자
+IMAGE_EXTENSIONS = {
+    "image/jpeg": "jpg",
+    "image/png": "png",
+    "image/webp": "webp",
+}
+
+
+def sniff_image_type(head: bytes) -> Optional[str]:
+    """파일 시그니처로 이미지 형식 판별"""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "image/jpeg"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "image/png"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return None
+
+
+@dataclass
+class StoredUpload:
+    filename: str
+    key: str  # 저장소 키 ("<prefix>/<filename>")
+    size: int
+    content_type: str
+    digest: str
+    created: bool  # False면 같은 내용의 기존 파일을 재사용
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def _too_large(max_size: int) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"파일 크기가 너무 큽니다. {max_size // (1024 * 1024)}MB 이하만 허용됩니다.",
+    )
+
+
+class _PartCollector:
+    """MultipartParser 콜백을 받아 대상 필드의 파일 데이터만 모음 (write 한 번 동안의 이벤트)"""
+
+    def __init__(self, field_name: str):
+        self.field_name = field_name
+        self.found = False
+        self.in_target = False
+        self.finished = False
+        self.data: list = []
+        self._headers: Dict[bytes, bytes] = {}
+        self._field = b""
+        self._value = b""
+
+    def callbacks(self) -> dict:
+        return {
+            "on_part_begin": self._on_part_begin,
+            "on_header_field": self._on_header_field,
+            "on_header_value": self._on_header_value,
+            "on_header_end": self._on_header_end,
+            "on_headers_finished": self._on_headers_finished,
+            "on_part_data": self._on_part_data,
+            "on_part_end": self._on_part_end,
+        }
+
+    def _on_part_begin(self):
+        self._headers = {}
+
+    def _on_header_field(self, data: bytes, start: int, end: int):
+        self._field += data[start:end]
+
+    def _on_header_value(self, data: bytes, start: int, end: int):
+        self._value += data[start:end]
+
+    def _on_header_end(self):
+        self._headers[self._field.lower()] = self._value
+        self._field, self._value = b"", b""
+
+    def _on_headers_finished(self):
+        _, options = parse_options_header(self._headers.get(b"content-disposition", b""))
+        name = options.get(b"name", b"").decode("utf-8", "replace")
+        # 같은 필드의 두 번째 파일은 무시
+        self.in_target = name == self.field_name and b"filename" in options and not self.found
+        if self.in_target:
+            self.found = True
+
+    def _on_part_data(self, data: bytes, start: int, end: int):
+        if self.in_target:
+            self.data.append(data[start:end])
+
+    def _on_part_end(self):
+        if self.in_target:
+            self.finished = True
+        self.in_target = False
+
+    def take(self) -> bytes:
+        chunk = b"".join(self.data)
+        self.data.clear()
+        return chunk
+
+
+def _discard(handle, temp_path: str):
+    handle.close()
+    try:
+        os.unlink(temp_path)
+    except FileNotFoundError:
+        pass
+
+
+def _write_chunk(handle, hasher, data: bytes):
+    hasher.update(data)
+    handle.write(data)
+
+
+def _commit(handle, temp_path: str, store: ContentStore, digest: str, extension: str, content_type: str):
+    """버퍼를 디스크에 반영한 뒤 내용 주소 키로 저장소에 확정"""
+    handle.flush()
+    os.fsync(handle.fileno())
+    handle.close()
+    return store.commit(temp_path, digest, extension, content_type)
+
+
+def _spool(store: ContentStore):
+    fd, temp_path = tempfile.mkstemp(dir=store.spool_directory(), prefix=".upload-", suffix=".part")
+    return os.fdopen(fd, "wb"), temp_path
+
+
+async def receive_image_upload(
+    request: Request,
+    store: ContentStore,
+    max_size: int,
+    field_name: str = "file",
+    allowed_types: Optional[Dict[str, str]] = None,
+) -> StoredUpload:
+    """multipart 요청 본문에서 이미지 파일 하나를 스트리밍으로 받아 store에 저장"""
+    allowed_types = allowed_types or IMAGE_EXTENSIONS
+
+    content_type, params = parse_options_header(request.headers.get("content-type", ""))
+    boundary = params.get(b"boundary")
+    if content_type != b"multipart/form-data" or not boundary:
+        raise _bad_request("multipart/form-data 형식으로 업로드해야 합니다.")
+
+    # 본문을 읽기 전에 선언된 길이로 먼저 거절
+    content_length = request.headers.get("content-length")
+    if content_length and content_length.isdigit() and int(content_length) > max_size + MULTIPART_OVERHEAD:
+        raise _too_large(max_size)
+
+    collector = _PartCollector(field_name)
+    parser = MultipartParser(boundary, collector.callbacks())
+    handle, temp_path = await run_in_threadpool(_spool, store)
+    hasher = hashlib.sha256()
+
+    head = b""
+    detected: Optional[str] = None
+    size = 0
+    try:
+        body_size = 0
+        async for chunk in request.stream():
+            body_size += len(chunk)
+            if body_size > max_size + MULTIPART_OVERHEAD:
+                raise _too_large(max_size)
+            parser.write(chunk)
+
+            data = collector.take()
+            if not data:
+                continue
+            size += len(data)
+            if size > max_size:
+                raise _too_large(max_size)
+
+            if detected is None:
+                head += data[:SNIFF_LENGTH]
+                if len(head) >= SNIFF_LENGTH or collector.finished:
+                    detected = sniff_image_type(head)
+                    if detected not in allowed_types:
+                        raise _bad_request("지원되지 않는 파일 형식입니다. JPG, PNG, WebP만 허용됩니다.")
+            await run_in_threadpool(_write_chunk, handle, hasher, data)
+        parser.finalize()
+
+        if not collector.found or size == 0:
+            raise _bad_request("업로드할 파일이 없습니다.")
+        if detected is None:
+            detected = sniff_image_type(head)
+            if detected not in allowed_types:
+                raise _bad_request("지원되지 않는 파일 형식입니다. JPG, PNG, WebP만 허용됩니다.")
+
+        digest = hasher.hexdigest()
+        filename, created = await run_in_threadpool(
+            _commit, handle, temp_path, store, digest, allowed_types[detected], detected
+        )
+    except BaseException:
+        # 취소된 경우에도 확실히 정리되도록 동기로 처리 (close/unlink는 짧은 시스템 호출)
+        _discard(handle, temp_path)
+        raise
+
+    return StoredUpload(
+        filename=filename,
+        key=store.key(filename),
+        size=size,
+        content_type=detected,
+        digest=digest,
+        created=created,
+    )
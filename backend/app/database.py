@@ -1,35 +1,147 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from .config import settings
 import os
 
 # 로컬 SQLite 사용
-DATABASE_URL = "sqlite:///./suwon_healing.db"
+DATABASE_URL = settings.DATABASE_FALLBACK_URL
 
-# 데이터베이스 엔진 생성
-engine = create_engine(
-    DATABASE_URL,
-    pool_pre_ping=True,
-    pool_recycle=300,
-    echo=settings.DEBUG,
-    connect_args={"check_same_thread": False}  # SQLite용
-)
+
+def sqlite_pragmas(read_only: bool = False) -> dict:
+    """연결마다 적용할 SQLite PRAGMA 목록"""
+    pragmas = {
+        "journal_mode": settings.SQLITE_JOURNAL_MODE,
+        "synchronous": settings.SQLITE_SYNCHRONOUS,
+        "busy_timeout": settings.SQLITE_BUSY_TIMEOUT,
+        "cache_size": settings.SQLITE_CACHE_SIZE,
+        "mmap_size": settings.SQLITE_MMAP_SIZE,
+        "temp_store": settings.SQLITE_TEMP_STORE,
+    }
+    if read_only:
+        # 저널 모드 변경은 쓰기 작업이므로 쓰기 엔진에서만 설정
+        del pragmas["journal_mode"]
+        pragmas["query_only"] = "ON"
+    return pragmas
+
+
+def sqlite_read_only_url(url: str) -> str:
+    """SQLite 파일 URL을 읽기 전용(mode=ro) URI 연결 URL로 변환"""
+    database = make_url(url).database
+    if not database or database == ":memory:" or database.startswith("file:"):
+        return url
+    return f"sqlite:///file:{database}?mode=ro&uri=true"
+
+
+def apply_sqlite_pragmas(engine, pragmas: dict):
+    """새 DBAPI 연결이 만들어질 때마다 PRAGMA 적용"""
+    @event.listens_for(engine, "connect")
+    def _set_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+
+def _sqlite_pool_options(url: str, read_only: bool) -> dict:
+    """SQLite 파일 DB용 QueuePool 설정 (메모리 DB는 SQLAlchemy 기본 풀 유지)"""
+    if url in ("sqlite://", "sqlite:///:memory:"):
+        return {}
+    return dict(
+        pool_size=settings.DATABASE_READ_POOL_SIZE if read_only else settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+    )
+
+
+def create_database_engine(url: str = DATABASE_URL, read_only: bool = False, **kwargs):
+    """설정 기반 엔진 생성 (SQLite면 PRAGMA/풀 프로파일 적용)"""
+    if not url.startswith("sqlite"):
+        return create_engine(
+            url,
+            pool_pre_ping=True,
+            pool_recycle=300,
+            echo=settings.DEBUG,
+            **kwargs
+        )
+
+    options = dict(
+        echo=settings.DEBUG,
+        connect_args={"check_same_thread": False},  # SQLite용
+        **_sqlite_pool_options(url, read_only)
+    )
+    options.update(kwargs)
+    sqlite_engine = create_engine(sqlite_read_only_url(url) if read_only else url, **options)
+    apply_sqlite_pragmas(sqlite_engine, sqlite_pragmas(read_only))
+    return sqlite_engine
+
+
+def async_database_url(url: str) -> str:
+    """동기 드라이버 URL을 비동기 드라이버 URL로 변환 (SQLite -> aiosqlite)"""
+    parsed = make_url(url)
+    if parsed.drivername == "sqlite":
+        return parsed.set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+    return url
+
+
+def create_async_database_engine(url: str = DATABASE_URL, read_only: bool = False, **kwargs):
+    """비동기 엔진 생성 (aiosqlite, 동기 엔진과 같은 PRAGMA/풀 프로파일 적용)"""
+    if not url.startswith("sqlite"):
+        return create_async_engine(async_database_url(url), pool_pre_ping=True, echo=settings.DEBUG, **kwargs)
+
+    options = dict(echo=settings.DEBUG, **_sqlite_pool_options(url, read_only))
+    options.update(kwargs)
+    async_url = async_database_url(sqlite_read_only_url(url) if read_only else url)
+    async_engine = create_async_engine(async_url, **options)
+    apply_sqlite_pragmas(async_engine.sync_engine, sqlite_pragmas(read_only))
+    return async_engine
+
+
+# 데이터베이스 엔진 생성 (쓰기용)
+engine = create_database_engine()
+
+# 읽기 전용 엔진 (복제본 URL이 있으면 복제본, 없으면 같은 파일을 읽기 전용으로 연결)
+read_engine = create_database_engine(settings.DATABASE_READ_URL or DATABASE_URL, read_only=True)
 
 # 세션 팩토리 생성
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+
+# 비동기 읽기 전용 엔진 (스레드풀을 쓰지 않는 조회 API용)
+async_read_engine = create_async_database_engine(settings.DATABASE_READ_URL or DATABASE_URL, read_only=True)
+AsyncReadSessionLocal = async_sessionmaker(async_read_engine, class_=AsyncSession, expire_on_commit=False)
 
 # Base 클래스 생성
 Base = declarative_base()
 
-def get_db():
-    """데이터베이스 세션 의존성"""
+def get_write_db():
+    """쓰기용 데이터베이스 세션 의존성"""
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
 
+# 기존 라우터 호환용 (쓰기 엔진 사용)
+get_db = get_write_db
+
+def get_read_db():
+    """읽기 전용 데이터베이스 세션 의존성 (조회 API용)"""
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+async def get_async_db():
+    """비동기 읽기 전용 데이터베이스 세션 의존성"""
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
 def create_tables():
     """데이터베이스 테이블 생성"""
     print("🔄 로컬 SQLite 테이블 생성")
@@ -1,29 +1,45 @@
+from typing import Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from .database import get_db
-from .core.security import verify_token, get_current_user_id
+from .core.auth_cache import Principal, cached_token_payload, principal_cache
 from .models.user import User
 
 security = HTTPBearer()
 
 
+def _load_principal(db: Session, user_id: int) -> Optional[Principal]:
+    """사용자 권한 정보 (캐시에 없을 때만 조회)"""
+    principal = principal_cache.get(user_id)
+    if principal is not None:
+        return principal
+
+    generation = principal_cache.generation
+    row = db.query(User.id, User.is_active, User.is_admin).filter(User.id == user_id).first()
+    if row is None:
+        return None
+    principal = Principal(id=row.id, is_active=bool(row.is_active), is_admin=bool(row.is_admin))
+    principal_cache.put(user_id, principal, generation)
+    return principal
+
+
 def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
-) -> User:
-    """현재 인증된 사용자 반환"""
-    token = credentials.credentials
-    user_id = get_current_user_id(token)
-    
-    if user_id is None:
+) -> Principal:
+    """현재 인증된 사용자 반환 (토큰 검증 결과와 권한 정보는 짧은 시간 캐시)"""
+    payload = cached_token_payload(credentials.credentials)
+    try:
+        user_id = int(payload["sub"])
+    except (TypeError, KeyError, ValueError):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
     
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _load_principal(db, user_id)
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -40,16 +56,16 @@ def get_current_user(
     return user
 
 
-def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_active_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     """현재 활성화된 사용자 반환"""
     return current_user
 
 
-def get_current_admin_user(current_user: User = Depends(get_current_user)) -> User:
+def get_current_admin_user(current_user: Principal = Depends(get_current_user)) -> Principal:
     """현재 관리자 사용자 반환"""
     if not current_user.is_admin:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
         )
-    return current_user 
\ No newline at end of file
+    return current_user 
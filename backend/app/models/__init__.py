@@ -3,6 +3,9 @@ from .counselor import Counselor
 from .consultation import Consultation, ConsultationType, ConsultationStatus, UrgencyLevel
 from .review import Review
 from .notice import Notice, NoticeType, NoticeStatus
+from .stat_counter import StatCounter
+from .stored_file import StoredFile
+from .search import SEARCH_INDEXES
 
 __all__ = [
     "User",
@@ -14,5 +17,8 @@ __all__ = [
     "Review",
     "Notice",
     "NoticeType",
-    "NoticeStatus"
+    "NoticeStatus",
+    "StatCounter",
+    "StoredFile",
+    "SEARCH_INDEXES"
 ]
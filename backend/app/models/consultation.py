@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -62,5 +62,18 @@ class Consultation(Base):
     counselor = relationship("Counselor", back_populates="consultations")
     reviews = relationship("Review", back_populates="consultation")
     
+    __table_args__ = (
+        # 내 상담 신청 목록 (사용자 + 상태 필터)
+        Index("ix_consultations_user_status", "user_id", "status"),
+        # 내 상담 신청 목록 (상태 필터 없이 id 순 - 색인 끝의 rowid 순서를 그대로 사용)
+        Index("ix_consultations_user_id", "user_id"),
+        # 관리자 목록 (상태 필터, 같은 상태 안에서는 id 순)
+        Index("ix_consultations_status", "status"),
+        # 관리자 JOIN 목록 (최신순 created_at DESC, id DESC - 상태 필터 유무별)
+        Index("ix_consultations_status_created", "status", "created_at", "id"),
+        Index("ix_consultations_created", "created_at", "id"),
+        Index("ix_consultations_counselor_id", "counselor_id"),
+    )
+    
     def __repr__(self):
         return f"<Consultation(id={self.id}, title='{self.title}', status='{self.status}')>" 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Float, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -28,5 +28,10 @@ class Counselor(Base):
     consultations = relationship("Consultation", back_populates="counselor")
     reviews = relationship("Review", back_populates="counselor")
     
+    __table_args__ = (
+        # 온라인 상담사 목록 (온라인 + 활성 필터)
+        Index("ix_counselors_online_active", "is_online", "is_active"),
+    )
+    
     def __repr__(self):
         return f"<Counselor(id={self.id}, name='{self.name}', email='{self.email}')>" 
\ No newline at end of file
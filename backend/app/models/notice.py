@@ -1,8 +1,9 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Enum, Index, and_, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
 from ..database import Base
+from ..core.pagination import sortable_datetime_sql
 
 
 class NoticeType(str, enum.Enum):
@@ -47,5 +48,20 @@ class Notice(Base):
     # 관계 설정
     author = relationship("User", back_populates="notices")
     
+    # 목록 정렬/커서 비교에 쓰는 created_at 식과 같은 표현식으로 색인 (core.pagination.sortable_datetime)
+    __table_args__ = (
+        # 관리자 목록 (상태/활성 필터 + 고정/최신순 정렬)
+        Index(
+            "ix_notices_status_active_pinned_created",
+            "status", "is_active", "is_pinned", text(sortable_datetime_sql("created_at")),
+        ),
+        # 공개 목록 (발행+활성 행만 고정/최신순으로 색인, updated_at은 목록 검증자 집계용)
+        Index(
+            "ix_notices_published",
+            "is_pinned", text(sortable_datetime_sql("created_at")), "id", "updated_at",
+            sqlite_where=and_(status == NoticeStatus.PUBLISHED, is_active == True),
+        ),
+    )
+    
     def __repr__(self):
         return f"<Notice(id={self.id}, title='{self.title}', type='{self.notice_type}')>" 
\ No newline at end of file
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, Float, Index, and_, event
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from ..database import Base
@@ -33,5 +33,63 @@ class Review(Base):
     counselor = relationship("Counselor", back_populates="reviews")
     consultation = relationship("Consultation", back_populates="reviews")
     
+    __table_args__ = (
+        # 상담사별 후기 목록/평점 재계산 (승인/활성 필터)
+        Index("ix_reviews_counselor_approved_active", "counselor_id", "is_approved", "is_active"),
+        # 공개 후기 목록 (승인+활성 행만 id 순으로 색인)
+        Index("ix_reviews_public", "id", sqlite_where=and_(is_approved == True, is_active == True)),
+        Index("ix_reviews_user_id", "user_id"),
+    )
+    
     def __repr__(self):
-        return f"<Review(id={self.id}, rating={self.rating}, title='{self.title}')>" 
\ No newline at end of file
+        return f"<Review(id={self.id}, rating={self.rating}, title='{self.title}')>" 
+
+# 승인되고 활성화된 후기만 상담사 평점에 반영
+_COUNTS = "{row}.is_approved AND {row}.is_active"
+
+
+def _add_rating(row: str) -> str:
+    """후기 한 건을 상담사의 평균/개수에 더하는 UPDATE (rating * total_reviews를 누적 합으로 사용)
+
+    updated_at도 갱신해 상담사 응답의 ETag/Last-Modified가 바뀌도록 합니다.
+    """
+    return (
+        f"UPDATE counselors SET "
+        f"rating = (COALESCE(rating, 0) * COALESCE(total_reviews, 0) + {row}.rating) / (COALESCE(total_reviews, 0) + 1.0), "
+        f"total_reviews = COALESCE(total_reviews, 0) + 1, "
+        f"updated_at = CURRENT_TIMESTAMP "
+        f"WHERE id = {row}.counselor_id AND {_COUNTS.format(row=row)};"
+    )
+
+
+def _remove_rating(row: str) -> str:
+    """후기 한 건을 상담사의 평균/개수에서 빼는 UPDATE"""
+    return (
+        f"UPDATE counselors SET "
+        f"rating = CASE WHEN total_reviews <= 1 THEN 0 "
+        f"ELSE (rating * total_reviews - {row}.rating) / (total_reviews - 1.0) END, "
+        f"total_reviews = MAX(total_reviews - 1, 0), "
+        f"updated_at = CURRENT_TIMESTAMP "
+        f"WHERE id = {row}.counselor_id AND {_COUNTS.format(row=row)};"
+    )
+
+
+RATING_TRIGGER_STATEMENTS = [
+    f"CREATE TRIGGER IF NOT EXISTS review_rating_insert AFTER INSERT ON reviews "
+    f"BEGIN {_add_rating('NEW')} END",
+    f"CREATE TRIGGER IF NOT EXISTS review_rating_delete AFTER DELETE ON reviews "
+    f"BEGIN {_remove_rating('OLD')} END",
+    # 별점/상담사/승인/활성 상태가 바뀌면 이전 값을 빼고 새 값을 더함
+    f"CREATE TRIGGER IF NOT EXISTS review_rating_update "
+    f"AFTER UPDATE OF rating, counselor_id, is_approved, is_active ON reviews "
+    f"BEGIN {_remove_rating('OLD')} {_add_rating('NEW')} END",
+]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_rating_triggers(target, connection, **kw):
+    """create_all 이후 상담사 평점 증분 집계 트리거 생성 (SQLite 전용)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in RATING_TRIGGER_STATEMENTS:
+        connection.exec_driver_sql(statement)
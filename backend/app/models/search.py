@@ -0,0 +1,75 @@
+from sqlalchemy import column, event, table
+from ..database import Base
+
+# 전문 검색 대상 (원본 테이블 -> 검색 컬럼)
+SEARCH_INDEXES = {
+    "notices": ["title", "content"],
+    "counselors": ["name", "specialization", "bio"],
+    "reviews": ["title", "content"],
+}
+
+
+def fts_table_name(source: str) -> str:
+    return f"{source}_fts"
+
+
+# FTS5 가상 테이블 (쿼리 작성용 경량 테이블 객체, rowid는 원본 id)
+FTS_TABLES = {
+    source: table(fts_table_name(source), column("rowid"), *(column(name) for name in columns))
+    for source, columns in SEARCH_INDEXES.items()
+}
+
+
+def fts_table(source: str):
+    return FTS_TABLES[source]
+
+
+def search_index_statements(source: str) -> list:
+    """FTS5 가상 테이블과 동기화 트리거 생성문 목록
+
+    원본 테이블을 content로 쓰는 external content 테이블이라 본문을 중복 저장하지 않습니다.
+    한국어는 띄어쓰기 단위 토큰화가 맞지 않으므로 trigram 토크나이저로 부분 문자열을 색인합니다.
+    """
+    fts = fts_table_name(source)
+    columns = SEARCH_INDEXES[source]
+    names = ", ".join(columns)
+    new_values = ", ".join(f"NEW.{name}" for name in columns)
+    old_values = ", ".join(f"OLD.{name}" for name in columns)
+    insert = f"INSERT INTO {fts} (rowid, {names}) VALUES (NEW.id, {new_values});"
+    delete = f"INSERT INTO {fts} ({fts}, rowid, {names}) VALUES ('delete', OLD.id, {old_values});"
+    return [
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5("
+        f"{names}, content='{source}', content_rowid='id', tokenize='trigram')",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_insert AFTER INSERT ON {source} BEGIN {insert} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_delete AFTER DELETE ON {source} BEGIN {delete} END",
+        f"CREATE TRIGGER IF NOT EXISTS {fts}_update AFTER UPDATE OF {names} ON {source} "
+        f"BEGIN {delete} {insert} END",
+    ]
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_search_indexes(target, connection, **kw):
+    """create_all 이후 전문 검색 테이블/트리거 생성 (SQLite 전용)
+
+    검색 테이블이 새로 생긴 경우 기존 데이터로 색인을 채웁니다.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    for source in SEARCH_INDEXES:
+        fts = fts_table_name(source)
+        exists = connection.exec_driver_sql(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts,)
+        ).first()
+        for statement in search_index_statements(source):
+            connection.exec_driver_sql(statement)
+        if not exists:
+            connection.exec_driver_sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+
+
+@event.listens_for(Base.metadata, "after_drop")
+def _drop_search_indexes(target, connection, **kw):
+    """drop_all 이후 전문 검색 테이블 삭제 (원본이 없어진 색인이 남지 않도록)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for source in SEARCH_INDEXES:
+        connection.exec_driver_sql(f"DROP TABLE IF EXISTS {fts_table_name(source)}")
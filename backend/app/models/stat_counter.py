@@ -0,0 +1,77 @@
+from sqlalchemy import Column, Integer, String, event
+from ..database import Base
+
+
+class StatCounter(Base):
+    """관리자 통계용 카운터 (트리거로 증감 관리)"""
+    __tablename__ = "stat_counters"
+
+    name = Column(String(100), primary_key=True)  # 예: "consultations", "consultations:status:PENDING"
+    value = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<StatCounter(name='{self.name}', value={self.value})>"
+
+
+# 테이블별 카운터 이름 식 ({row}는 NEW/OLD 또는 재계산 시 테이블 이름으로 치환)
+STAT_DIMENSIONS = {
+    "counselors": [
+        "'counselors'",
+        "'counselors:' || CASE WHEN {row}.is_active THEN 'active' ELSE 'inactive' END",
+    ],
+    "consultations": [
+        "'consultations'",
+        "'consultations:status:' || COALESCE({row}.status, 'NONE')",
+    ],
+    "reviews": [
+        "'reviews'",
+        "'reviews:' || CASE WHEN {row}.is_approved THEN 'approved' ELSE 'pending' END",
+    ],
+    "notices": [
+        "'notices'",
+        "'notices:status:' || COALESCE({row}.status, 'NONE')",
+    ],
+}
+
+
+def _bump(expression: str, row: str, delta: int) -> str:
+    return (
+        f"INSERT INTO stat_counters (name, value) VALUES ({expression.format(row=row)}, {delta}) "
+        f"ON CONFLICT(name) DO UPDATE SET value = value + ({delta});"
+    )
+
+
+def stat_trigger_statements() -> list:
+    """카운터를 증감하는 SQLite 트리거 생성문 목록"""
+    statements = []
+    for table, expressions in STAT_DIMENSIONS.items():
+        inserts = " ".join(_bump(e, "NEW", 1) for e in expressions)
+        deletes = " ".join(_bump(e, "OLD", -1) for e in expressions)
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS stat_{table}_insert AFTER INSERT ON {table} "
+            f"BEGIN {inserts} END"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS stat_{table}_delete AFTER DELETE ON {table} "
+            f"BEGIN {deletes} END"
+        )
+        # 상수가 아닌 카운터(상태별)는 값이 바뀔 때만 이동
+        for i, expression in enumerate(expressions):
+            if "{row}" not in expression:
+                continue
+            old, new = expression.format(row="OLD"), expression.format(row="NEW")
+            statements.append(
+                f"CREATE TRIGGER IF NOT EXISTS stat_{table}_update_{i} AFTER UPDATE ON {table} "
+                f"WHEN ({old}) IS NOT ({new}) "
+                f"BEGIN {_bump(expression, 'OLD', -1)} {_bump(expression, 'NEW', 1)} END"
+            )
+    return statements
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_stat_triggers(target, connection, **kw):
+    """create_all 이후 카운터 트리거 생성 (SQLite 전용)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in stat_trigger_statements():
+        connection.exec_driver_sql(statement)
@@ -0,0 +1,60 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, event
+from sqlalchemy.sql import func
+from ..database import Base
+
+
+class StoredFile(Base):
+    """내용 주소(SHA-256)로 저장된 업로드 파일 (참조 수는 트리거로 관리)"""
+    __tablename__ = "stored_files"
+
+    digest = Column(String(64), primary_key=True)  # 파일 내용의 SHA-256 (hex)
+    url = Column(String(500), unique=True, nullable=False)  # 응답/참조 컬럼에 저장되는 URL
+    size = Column(Integer, nullable=False)
+    content_type = Column(String(100), nullable=False)
+    ref_count = Column(Integer, nullable=False, default=0)  # 이 URL을 가리키는 행 수
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_uploaded_at = Column(DateTime(timezone=True), server_default=func.now())  # 같은 내용이 다시 올라온 시각
+    variants = Column(Text, nullable=True)  # 이미지 변환본 manifest (JSON, 변환 전이면 NULL)
+
+    def __repr__(self):
+        return f"<StoredFile(digest='{self.digest}', ref_count={self.ref_count})>"
+
+
+# 업로드 파일 URL을 저장하는 컬럼 (테이블 -> 컬럼)
+FILE_REFERENCES = {
+    "counselors": "profile_image",
+    "reviews": "image_url",
+}
+
+
+def _ref(row: str, column: str, delta: int) -> str:
+    return f"UPDATE stored_files SET ref_count = ref_count + ({delta}) WHERE url = {row}.{column};"
+
+
+def file_reference_trigger_statements() -> list:
+    """참조 컬럼 값이 바뀔 때 stored_files.ref_count를 증감하는 SQLite 트리거 생성문 목록"""
+    statements = []
+    for table, column in FILE_REFERENCES.items():
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS file_refs_{table}_insert AFTER INSERT ON {table} "
+            f"WHEN NEW.{column} IS NOT NULL BEGIN {_ref('NEW', column, 1)} END"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS file_refs_{table}_delete AFTER DELETE ON {table} "
+            f"WHEN OLD.{column} IS NOT NULL BEGIN {_ref('OLD', column, -1)} END"
+        )
+        statements.append(
+            f"CREATE TRIGGER IF NOT EXISTS file_refs_{table}_update AFTER UPDATE OF {column} ON {table} "
+            f"WHEN OLD.{column} IS NOT NEW.{column} "
+            f"BEGIN {_ref('OLD', column, -1)} {_ref('NEW', column, 1)} END"
+        )
+    return statements
+
+
+@event.listens_for(Base.metadata, "after_create")
+def _create_file_reference_triggers(target, connection, **kw):
+    """create_all 이후 파일 참조 수 트리거 생성 (SQLite 전용)"""
+    if connection.dialect.name != "sqlite":
+        return
+    for statement in file_reference_trigger_statements():
+        connection.exec_driver_sql(statement)
@@ -1,3 +1,3 @@
-from . import user, consultation, counselor, review, notice
+from . import user, consultation, counselor, review, notice, search, upload
 
-__all__ = ["user", "consultation", "counselor", "review", "notice"]
+__all__ = ["user", "consultation", "counselor", "review", "notice", "search", "upload"]
@@ -55,6 +55,7 @@ class Consultation(ConsultationInDB):
 
 class ConsultationList(BaseModel):
     consultations: list[Consultation]
-    total: int
+    total: Optional[int]  # total=none이면 None
     page: int
-    size: int 
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None) 
\ No newline at end of file
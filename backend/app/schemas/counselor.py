@@ -50,8 +50,13 @@ class Counselor(CounselorInDB):
     pass
 
 
+class CounselorListItem(Counselor):
+    profile_thumbnail: Optional[str] = None  # 목록용 작은 변환본 URL (변환 전이면 None)
+
+
 class CounselorList(BaseModel):
-    counselors: list[Counselor]
-    total: int
+    counselors: list[CounselorListItem]
+    total: Optional[int]  # total=none이면 None
     page: int
-    size: int 
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None) 
\ No newline at end of file
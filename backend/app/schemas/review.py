@@ -49,6 +49,7 @@ class Review(ReviewInDB):
 
 class ReviewList(BaseModel):
     reviews: list[Review]
-    total: int
+    total: Optional[int]  # total=none이면 None
     page: int
-    size: int 
\ No newline at end of file
+    size: int
+    next_cursor: Optional[str] = None  # 다음 페이지 커서 (마지막 페이지면 None) 
\ No newline at end of file
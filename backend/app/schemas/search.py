@@ -0,0 +1,14 @@
+from pydantic import BaseModel
+from typing import Dict
+
+
+class SearchHit(BaseModel):
+    id: int
+    title: str
+    snippet: str  # 검색어를 <mark>로 감싼 본문 일부 (나머지는 HTML 이스케이프됨)
+    score: float  # 클수록 관련도 높음 (3글자 미만 검색어만 있으면 0)
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: Dict[str, list[SearchHit]]  # 검색 대상(notices/counselors/reviews)별 결과
@@ -0,0 +1,29 @@
+from pydantic import BaseModel, Field
+from typing import Dict, Optional
+
+
+class UploadPresignRequest(BaseModel):
+    """브라우저가 버킷에 직접 올리기 전에 보내는 파일 정보 (SHA-256은 hex)"""
+    sha256: str = Field(..., pattern=r"^[0-9a-f]{64}$")
+    size: int = Field(..., gt=0)
+    content_type: str
+
+
+class UploadPresignResponse(BaseModel):
+    exists: bool  # 같은 내용이 이미 저장되어 있으면 업로드 없이 image_url 사용
+    image_url: str
+    method: Optional[str] = None
+    upload_url: Optional[str] = None
+    headers: Dict[str, str] = {}
+    expires_in: Optional[int] = None
+
+
+class UploadCompleteRequest(BaseModel):
+    sha256: str = Field(..., pattern=r"^[0-9a-f]{64}$")
+    content_type: str
+
+
+class UploadResponse(BaseModel):
+    message: str
+    image_url: str
+    filename: str
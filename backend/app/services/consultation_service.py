@@ -0,0 +1,116 @@
+"""
+상담 신청 관련 비즈니스 로직
+"""
+from typing import Iterator, Optional
+from sqlalchemy.orm import Session, Query
+from ..core.responses import dumps
+from ..core.totals import totals, TotalMode
+from ..models.consultation import Consultation, ConsultationStatus, ConsultationType
+from ..models.user import User
+from ..models.counselor import Counselor
+
+# 스트리밍 시 한 번에 가져올 행 수
+ADMIN_FEED_BATCH_SIZE = 200
+
+
+def build_admin_consultation_query(
+    db: Session,
+    status: Optional[ConsultationStatus] = None,
+    consultation_type: Optional[ConsultationType] = None,
+    counselor_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+) -> Query:
+    """관리자용 상담 신청 목록 쿼리 (사용자/상담사 정보를 한 번의 JOIN으로 조회)"""
+    query = (
+        db.query(
+            Consultation.id,
+            Consultation.title,
+            Consultation.consultation_type,
+            Consultation.status,
+            Consultation.urgency_level,
+            Consultation.preferred_date,
+            Consultation.preferred_time,
+            Consultation.contact_name,
+            Consultation.contact_phone,
+            Consultation.contact_email,
+            Consultation.notes,
+            Consultation.created_at,
+            User.full_name.label("user_name"),
+            User.phone.label("user_phone"),
+            User.email.label("user_email"),
+            Counselor.name.label("counselor_name"),
+            Counselor.specialization.label("counselor_specialization"),
+            Counselor.phone.label("counselor_phone"),
+            Counselor.email.label("counselor_email"),
+        )
+        .outerjoin(User, User.id == Consultation.user_id)
+        .outerjoin(Counselor, Counselor.id == Consultation.counselor_id)
+    )
+    return _apply_admin_filters(query, status, consultation_type, counselor_id, user_id)
+
+
+def count_admin_consultations(
+    db: Session,
+    status: Optional[ConsultationStatus] = None,
+    consultation_type: Optional[ConsultationType] = None,
+    counselor_id: Optional[int] = None,
+    user_id: Optional[int] = None,
+    total_mode: Optional[TotalMode] = None,
+) -> Optional[int]:
+    """관리자용 상담 신청 수 조회 (JOIN 없이 필터만 적용, totals 캐시 사용)"""
+    query = _apply_admin_filters(db.query(Consultation), status, consultation_type, counselor_id, user_id)
+    filters = {
+        "status": status,
+        "consultation_type": consultation_type,
+        "counselor_id": counselor_id,
+        "user_id": user_id,
+    }
+    return totals.count(query, Consultation.__tablename__, filters, total_mode)
+
+
+def _apply_admin_filters(query, status, consultation_type, counselor_id, user_id):
+    if status:
+        query = query.filter(Consultation.status == status)
+
+    if consultation_type:
+        query = query.filter(Consultation.consultation_type == consultation_type)
+
+    if counselor_id:
+        query = query.filter(Consultation.counselor_id == counselor_id)
+
+    if user_id:
+        query = query.filter(Consultation.user_id == user_id)
+
+    return query
+
+
+def serialize_admin_consultation(row) -> dict:
+    """JOIN 결과 한 행을 관리자 대시보드 응답 형태로 변환"""
+    return {
+        "id": row.id,
+        "title": row.title,
+        "user_name": row.user_name or row.contact_name or "알 수 없음",
+        "user_phone": row.user_phone or row.contact_phone,
+        "user_email": row.user_email or row.contact_email,
+        "counselor_name": row.counselor_name or "알 수 없음",
+        "counselor_specialization": row.counselor_specialization,
+        "counselor_phone": row.counselor_phone,
+        "counselor_email": row.counselor_email,
+        "consultation_date": str(row.preferred_date) if row.preferred_date else None,
+        "consultation_time": row.preferred_time,
+        "consultation_type": _enum_value(row.consultation_type),
+        "urgency_level": _enum_value(row.urgency_level),
+        "status": _enum_value(row.status),
+        "notes": row.notes,
+        "created_at": str(row.created_at),
+    }
+
+
+def iter_admin_consultations_ndjson(query: Query) -> Iterator[bytes]:
+    """관리자용 상담 신청 목록을 NDJSON 한 줄씩 생성"""
+    for row in query.yield_per(ADMIN_FEED_BATCH_SIZE):
+        yield dumps(serialize_admin_consultation(row)) + b"\n"
+
+
+def _enum_value(value):
+    return value.value if hasattr(value, "value") else value
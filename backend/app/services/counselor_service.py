@@ -0,0 +1,84 @@
+"""
+상담사 관련 비즈니스 로직
+"""
+import json
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import text, update
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..core.cache import invalidate_tables
+from ..core.image_pipeline import pick_variant
+from ..database import SessionLocal
+from ..models.counselor import Counselor
+from . import file_service
+from .file_service import profile_image_store
+
+
+def reconcile_counselor_ratings(db: Session) -> int:
+    """모든 상담사의 평점/후기 수를 후기 테이블에서 다시 계산하고, 값이 달랐던 상담사 수 반환
+
+    평점은 트리거로 증분 갱신되므로 평소에는 필요 없지만,
+    트리거 도입 전 데이터나 누적 오차를 보정할 때 사용합니다.
+    값이 같은 상담사는 갱신하지 않으므로 updated_at(목록/상세 ETag)이 바뀌지 않습니다.
+    평점은 증분 계산의 부동소수점 오차를 무시하도록 소수 9자리에서 비교합니다.
+    """
+    result = db.execute(text("""
+        UPDATE counselors
+        SET rating = agg.avg_rating, total_reviews = agg.review_count, updated_at = CURRENT_TIMESTAMP
+        FROM (
+            SELECT counselors.id AS counselor_id,
+                   COALESCE(AVG(reviews.rating), 0) AS avg_rating,
+                   COUNT(reviews.id) AS review_count
+            FROM counselors
+            LEFT JOIN reviews
+                ON reviews.counselor_id = counselors.id AND reviews.is_approved AND reviews.is_active
+            GROUP BY counselors.id
+        ) AS agg
+        WHERE counselors.id = agg.counselor_id
+          AND (
+              counselors.total_reviews IS NOT agg.review_count
+              OR ROUND(counselors.rating, 9) IS NOT ROUND(agg.avg_rating, 9)
+          )
+    """))
+    db.commit()
+    return result.rowcount
+
+
+def profile_thumbnail_url(profile_image: Optional[str], variants: Optional[str]) -> Optional[str]:
+    """목록 응답용 작은 프로필 변환본 URL (변환 전이거나 외부 이미지면 None)
+
+    variants는 stored_files에 기록된 manifest(JSON)로, 목록 조회에서 함께 JOIN해 가져옵니다.
+    """
+    if not variants or profile_image_store.filename_from_url(profile_image) is None:
+        return None
+    variant = pick_variant(json.loads(variants), settings.IMAGE_THUMBNAIL_SIZE)
+    return profile_image_store.url(variant["file"]) if variant else None
+
+
+def add_profile_thumbnail(item: dict):
+    """목록 항목 dict에 profile_thumbnail 채우기 (list_response extend용)"""
+    item["profile_thumbnail"] = profile_thumbnail_url(item.get("profile_image"), item.pop("profile_variants", None))
+
+
+def on_profile_variants_ready(source_key: str, manifest: dict):
+    """변환본이 생기면 manifest를 기록하고 해당 이미지를 쓰는 상담사의 변경 시각을 갱신
+
+    목록의 ETag/응답 캐시는 상담사 변경 시각으로 검증하므로, 변환 완료 전에 저장된
+    목록이 원본만 가리킨 채 304로 계속 재사용되지 않도록 합니다.
+    직전 수정과 같은 초에 끝날 수 있어 초 단위인 CURRENT_TIMESTAMP 대신 마이크로초까지 기록합니다.
+    """
+    filename = source_key.rsplit("/", 1)[-1]
+    db = SessionLocal()
+    try:
+        file_service.record_variants(db, profile_image_store, filename, manifest)
+        result = db.execute(
+            update(Counselor)
+            .where(Counselor.profile_image == profile_image_store.url(filename))
+            .values(updated_at=datetime.utcnow())
+        )
+        db.commit()
+    finally:
+        db.close()
+    if result.rowcount:
+        invalidate_tables(Counselor.__tablename__)
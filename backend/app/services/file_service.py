@@ -0,0 +1,202 @@
+"""
+업로드 파일 관련 비즈니스 로직 (내용 주소 저장소 등록/참조 수 보정/변환본 기록/정리)
+"""
+import json
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+from sqlalchemy import delete, func, select, text, update
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from ..core.content_store import ContentStore, DIGEST_NAME
+from ..core.image_pipeline import image_pipeline
+from ..core.uploads import IMAGE_EXTENSIONS, SNIFF_LENGTH, StoredUpload, sniff_image_type
+from ..models.stored_file import StoredFile, FILE_REFERENCES
+
+# 프로필 이미지 저장소
+profile_image_store = ContentStore("profile_images")
+
+# 정리(GC) 대상 저장소 목록
+UPLOAD_STORES = [profile_image_store]
+
+
+def register_upload(db: Session, store: ContentStore, stored: StoredUpload) -> bool:
+    """업로드 파일을 stored_files에 등록하고 변환본이 이미 있는지 반환
+    (같은 내용이 있으면 재업로드 시각만 갱신)
+
+    새 행의 참조 수는 이미 같은 URL을 가리키는 행이 있을 수 있으므로 참조 컬럼에서 계산합니다.
+    """
+    url = store.url(stored.filename)
+    statement = insert(StoredFile).values(
+        digest=stored.digest,
+        url=url,
+        size=stored.size,
+        content_type=stored.content_type,
+        ref_count=_reference_count(url),
+    )
+    variants = db.execute(
+        statement.on_conflict_do_update(
+            index_elements=[StoredFile.digest],
+            set_={"last_uploaded_at": func.now()},
+        ).returning(StoredFile.variants)
+    ).scalar_one()
+    db.commit()
+    return variants is not None
+
+
+def find_upload(db: Session, digest: str) -> Optional[StoredFile]:
+    return db.get(StoredFile, digest)
+
+
+def record_variants(db: Session, store: ContentStore, filename: str, manifest: dict) -> int:
+    """변환 완료된 manifest를 stored_files에 기록 (목록 조회 때 저장소를 확인하지 않도록)"""
+    result = db.execute(
+        update(StoredFile)
+        .where(StoredFile.url == store.url(filename))
+        .values(variants=json.dumps(manifest, ensure_ascii=False))
+    )
+    db.commit()
+    return result.rowcount
+
+
+def backfill_variants(db: Session, store: ContentStore, on_done: Callable[[str, dict], None]) -> int:
+    """변환본이 기록되지 않은 등록 이미지를 변환 대기열에 추가"""
+    urls = db.execute(
+        select(StoredFile.url)
+        .where(StoredFile.variants.is_(None), StoredFile.content_type.in_(list(IMAGE_EXTENSIONS)))
+    ).scalars()
+    count = 0
+    for url in urls:
+        filename = store.filename_from_url(url)
+        if filename and image_pipeline.submit(store.key(filename), on_done) is not None:
+            count += 1
+    return count
+
+
+def register_existing_files(db: Session, store: ContentStore) -> int:
+    """stored_files에 없는 기존 내용 주소 파일 등록 (저장소 도입 전/DB 초기화 후 업로드)
+
+    이름이 SHA-256 형식인 파일만 대상으로 하며, 형식은 앞부분 시그니처로 다시 판별합니다.
+    """
+    registered = set(db.execute(select(StoredFile.url)).scalars())
+    count = 0
+    for obj in store.iter_files():
+        filename = obj.key.rsplit("/", 1)[-1]
+        match = DIGEST_NAME.match(filename)
+        if match is None or store.url(filename) in registered:
+            continue
+        content_type = sniff_image_type(store.storage.read_range(obj.key, 0, SNIFF_LENGTH))
+        if content_type is None:
+            continue
+        db.execute(insert(StoredFile).values(
+            digest=match["digest"],
+            url=store.url(filename),
+            size=obj.size,
+            content_type=content_type,
+            ref_count=_reference_count(store.url(filename)),
+        ).on_conflict_do_nothing())
+        count += 1
+    db.commit()
+    return count
+
+
+def _reference_count(url):
+    """참조 컬럼 전체에서 url을 가리키는 행 수 (스칼라 서브쿼리)"""
+    counts = [
+        f"(SELECT COUNT(*) FROM {table} WHERE {column} = :ref_url)"
+        for table, column in FILE_REFERENCES.items()
+    ]
+    return text(" + ".join(counts)).bindparams(ref_url=url)
+
+
+def _referenced_urls(db: Session) -> set:
+    statement = " UNION ".join(
+        f"SELECT {column} FROM {table} WHERE {column} IS NOT NULL"
+        for table, column in FILE_REFERENCES.items()
+    )
+    return set(db.execute(text(statement)).scalars())
+
+
+def reconcile_file_references(db: Session) -> int:
+    """참조 수를 참조 컬럼에서 다시 계산하고 값이 바뀐 파일 수 반환 (트리거 도입 전 데이터 보정용)"""
+    counts = " + ".join(
+        f"(SELECT COUNT(*) FROM {table} WHERE {column} = stored_files.url)"
+        for table, column in FILE_REFERENCES.items()
+    )
+    result = db.execute(text(
+        f"UPDATE stored_files SET ref_count = {counts} WHERE ref_count IS NOT ({counts})"
+    ))
+    db.commit()
+    return result.rowcount
+
+
+@dataclass
+class GarbageReport:
+    files: List[str] = field(default_factory=list)  # 삭제한 (또는 삭제할) 파일 키
+    variants: List[str] = field(default_factory=list)  # 삭제한 변환본 키 접두사
+    bytes: int = 0
+
+
+def _remove(store: ContentStore, filename: str, report: GarbageReport, dry_run: bool):
+    """원본과 변환본 삭제 (dry_run이면 보고만)"""
+    report.variants.append(store.variants_prefix(filename))
+    if not dry_run:
+        store.delete(filename)
+
+
+def collect_garbage(db: Session, grace: timedelta, dry_run: bool = False) -> GarbageReport:
+    """참조가 없는 업로드 파일과 변환본 정리
+
+    업로드 후 상담사 정보를 저장하기 전까지는 참조가 0이므로, 마지막 업로드 후 grace가
+    지나지 않은 파일은 남겨 둡니다. stored_files에 없는 파일(내용 주소 도입 전 업로드 등)은
+    어떤 참조 컬럼도 가리키지 않을 때만 삭제합니다. 저장소 백엔드(로컬/S3)와 관계없이 동작합니다.
+    """
+    report = GarbageReport()
+    cutoff = datetime.utcnow() - grace
+
+    # 1) 참조 수가 0인 등록 파일 - 행 삭제에 성공한 경우에만 파일 삭제 (그 사이 참조가 생긴 경우 보호)
+    orphans = db.execute(
+        select(StoredFile.digest, StoredFile.url, StoredFile.size)
+        .where(StoredFile.ref_count <= 0, StoredFile.last_uploaded_at < cutoff)
+    ).all()
+    for digest, url, size in orphans:
+        store = next((store for store in UPLOAD_STORES if store.filename_from_url(url)), None)
+        if store is None:
+            continue
+        if not dry_run:
+            deleted = db.execute(
+                delete(StoredFile).where(StoredFile.digest == digest, StoredFile.ref_count <= 0)
+            ).rowcount
+            db.commit()
+            if not deleted:
+                continue
+        filename = store.filename_from_url(url)
+        report.files.append(store.key(filename))
+        report.bytes += size
+        _remove(store, filename, report, dry_run)
+
+    # 2) 등록되지 않았고 참조도 없는 파일
+    registered = set(db.execute(select(StoredFile.url)).scalars())
+    referenced = _referenced_urls(db)
+    aware_cutoff = cutoff.replace(tzinfo=timezone.utc)
+    for store in UPLOAD_STORES:
+        sources = set()
+        for obj in store.iter_files():
+            filename = obj.key.rsplit("/", 1)[-1]
+            url = store.url(filename)
+            if url in registered or url in referenced or obj.modified >= aware_cutoff:
+                sources.add(filename.rsplit(".", 1)[0])
+                continue
+            report.files.append(obj.key)
+            report.bytes += obj.size
+            _remove(store, filename, report, dry_run)
+
+        # 3) 원본이 없어진 변환본
+        for stem in store.iter_variant_sources():
+            prefix = store.variants_prefix(stem + ".")
+            if stem not in sources and prefix not in report.variants:
+                report.variants.append(prefix)
+                if not dry_run:
+                    store.storage.delete_prefix(prefix)
+
+    return report
@@ -0,0 +1,91 @@
+"""
+공지사항 관련 비즈니스 로직
+"""
+import threading
+from collections import Counter
+from typing import Optional
+from sqlalchemy import update
+from ..config import settings
+from ..database import SessionLocal
+from ..models.notice import Notice
+
+
+class NoticeViewCounter:
+    """공지사항 조회수 write-behind 버퍼
+
+    조회 시에는 메모리에만 누적하고, 주기적으로 공지사항마다
+    UPDATE notices SET view_count = view_count + ? 한 번으로 반영합니다.
+    조회수는 내용 변경이 아니므로 updated_at(onupdate)은 그대로 둡니다
+    (ETag/Last-Modified와 수정순 정렬이 조회 때마다 바뀌지 않도록).
+    """
+
+    def __init__(self, flush_interval: float):
+        self.flush_interval = flush_interval
+        self._pending: Counter = Counter()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def record(self, notice_id: int) -> int:
+        """조회 1회 기록 후 아직 반영되지 않은 조회수 반환"""
+        with self._lock:
+            self._pending[notice_id] += 1
+            return self._pending[notice_id]
+
+    def pending(self, notice_id: int) -> int:
+        with self._lock:
+            return self._pending.get(notice_id, 0)
+
+    def flush(self) -> int:
+        """누적된 조회수를 데이터베이스에 반영하고 반영한 공지사항 수 반환"""
+        with self._lock:
+            batch, self._pending = self._pending, Counter()
+
+        if not batch:
+            return 0
+
+        db = SessionLocal()
+        try:
+            for notice_id, count in batch.items():
+                db.execute(
+                    update(Notice)
+                    .where(Notice.id == notice_id)
+                    .values(view_count=Notice.view_count + count, updated_at=Notice.updated_at)
+                    .execution_options(synchronize_session=False)
+                )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            # 반영 실패 시 다음 주기에 다시 시도
+            with self._lock:
+                self._pending.update(batch)
+            print(f"⚠️ 조회수 반영 실패: {e}")
+            return 0
+        finally:
+            db.close()
+
+        return len(batch)
+
+    def start(self):
+        """주기적 반영 스레드 시작"""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="notice-view-counter", daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """반영 스레드 종료 후 남은 조회수 반영"""
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    def _run(self):
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+
+# 전역 조회수 버퍼 인스턴스
+notice_view_counter = NoticeViewCounter(flush_interval=settings.NOTICE_VIEW_FLUSH_INTERVAL)
@@ -0,0 +1,36 @@
+"""
+후기 관련 비즈니스 로직
+"""
+from sqlalchemy import Select, String, case, func, select
+from ..models.review import Review
+from ..models.user import User
+from ..models.counselor import Counselor
+from ..schemas.review import Review as ReviewSchema
+from ..core.responses import schema_columns
+
+
+def masked_author_name():
+    """작성자 이름 익명 처리 SQL 식 (예: "홍길동" -> "홍**", 익명 후기는 "익명")"""
+    return case(
+        (Review.is_anonymous == True, "익명"),
+        (User.id.is_(None), "익명"),
+        (func.coalesce(User.full_name, "") == "", None),
+        else_=func.substr(User.full_name, 1, 1, type_=String).concat("**")
+    )
+
+
+def public_review_statement() -> Select:
+    """공개 후기 응답에 필요한 컬럼만 조회하는 projection 쿼리
+
+    작성자 익명 처리와 상담사 이름을 JOIN 한 번으로 함께 계산하므로
+    행마다 관계를 지연 로딩하거나 파이썬에서 가공할 필요가 없습니다.
+    """
+    return (
+        select(
+            *schema_columns(Review, ReviewSchema),
+            masked_author_name().label("author_name"),
+            Counselor.name.label("counselor_name"),
+        )
+        .outerjoin(User, User.id == Review.user_id)
+        .outerjoin(Counselor, Counselor.id == Review.counselor_id)
+    )
@@ -0,0 +1,158 @@
+"""
+전문 검색 관련 비즈니스 로직 (SQLite FTS5 trigram)
+
+trigram 색인은 3글자 이상 검색어만 MATCH로 찾을 수 있으므로, 더 짧은 검색어(예: "상담")는
+원본 테이블 컬럼에 LIKE 조건으로 찾습니다. 순위(bm25)는 MATCH 검색어가 있을 때만 계산합니다.
+"""
+import html
+import re
+from dataclasses import dataclass
+from typing import List, Sequence
+from sqlalchemy import Select, func, literal, literal_column, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..models.counselor import Counselor
+from ..models.notice import Notice, NoticeStatus
+from ..models.review import Review
+from ..models.search import SEARCH_INDEXES, fts_table, fts_table_name
+
+# trigram 토크나이저가 색인하는 최소 길이
+MIN_MATCH_LENGTH = 3
+MAX_TERMS = 8
+SNIPPET_LENGTH = 80
+
+
+@dataclass
+class SearchTarget:
+    model: type
+    title: object
+    body: object
+    conditions: Sequence  # 공개 조회 조건
+
+
+SEARCH_TARGETS = {
+    "notices": SearchTarget(
+        Notice, Notice.title, Notice.content,
+        [Notice.status == NoticeStatus.PUBLISHED, Notice.is_active == True]
+    ),
+    "counselors": SearchTarget(
+        Counselor, Counselor.name, func.coalesce(Counselor.specialization, "") + " " + func.coalesce(Counselor.bio, ""),
+        [Counselor.is_active == True]
+    ),
+    "reviews": SearchTarget(
+        Review, Review.title, Review.content,
+        [Review.is_approved == True, Review.is_active == True]
+    ),
+}
+
+
+def parse_terms(q: str) -> List[str]:
+    """검색어를 공백 기준으로 나눔 (중복 제거, 최대 MAX_TERMS개)"""
+    terms = []
+    for term in q.split():
+        if term not in terms:
+            terms.append(term)
+    return terms[:MAX_TERMS]
+
+
+def _match_expression(terms: List[str]) -> str:
+    """FTS5 MATCH 식 - 각 검색어를 문자열로 인용해 연산자 해석을 막고 AND로 결합"""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in terms)
+
+
+def _like_pattern(term: str) -> str:
+    return "%" + term.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+
+
+def _split_terms(terms: List[str]):
+    long_terms = [term for term in terms if len(term) >= MIN_MATCH_LENGTH]
+    short_terms = [term for term in terms if len(term) < MIN_MATCH_LENGTH]
+    return long_terms, short_terms
+
+
+def _fts_match(source: str, long_terms: List[str]):
+    return literal_column(fts_table_name(source)).op("MATCH")(_match_expression(long_terms))
+
+
+def _short_term_conditions(source: str, short_terms: List[str]) -> list:
+    """짧은 검색어는 원본 테이블 컬럼에 LIKE (external content 검색 테이블을 스캔하면 원본을 다시 읽으므로)"""
+    columns = SEARCH_TARGETS[source].model.__table__.columns
+    conditions = []
+    for term in short_terms:
+        pattern = _like_pattern(term)
+        conditions.append(or_(*(columns[name].like(pattern, escape="\\") for name in SEARCH_INDEXES[source])))
+    return conditions
+
+
+def search_conditions(source: str, q: str) -> list:
+    """목록 API의 ?q= 필터 조건 (원본 테이블 기준, 목록의 정렬/커서 페이지네이션은 그대로 유지)"""
+    long_terms, short_terms = _split_terms(parse_terms(q))
+    conditions = []
+    if long_terms:
+        fts = fts_table(source)
+        matched = select(fts.c.rowid).where(_fts_match(source, long_terms))
+        conditions.append(SEARCH_TARGETS[source].model.id.in_(matched))
+    conditions.extend(_short_term_conditions(source, short_terms))
+    return conditions
+
+
+def search_statement(source: str, terms: List[str], limit: int) -> Select:
+    """관련도 순 검색 쿼리 (id, 제목, 본문, 점수)"""
+    target = SEARCH_TARGETS[source]
+    long_terms, short_terms = _split_terms(terms)
+    # bm25는 작을수록 관련도가 높으므로 부호를 바꿔 점수로 사용
+    score = -func.bm25(literal_column(fts_table_name(source))) if long_terms else literal(0.0)
+    statement = select(
+        target.model.id,
+        target.title.label("title"),
+        target.body.label("body"),
+        score.label("score"),
+    )
+    if long_terms:
+        fts = fts_table(source)
+        statement = statement.join(fts, fts.c.rowid == target.model.id).where(_fts_match(source, long_terms))
+    return (
+        statement
+        .where(*_short_term_conditions(source, short_terms), *target.conditions)
+        .order_by(score.desc(), target.model.id.desc())
+        .limit(limit)
+    )
+
+
+def highlight_snippet(text: str, terms: List[str], length: int = SNIPPET_LENGTH) -> str:
+    """첫 일치 위치 주변 본문을 잘라 검색어를 <mark>로 감쌈 (나머지 문자는 HTML 이스케이프)"""
+    text = text or ""
+    pattern = re.compile("|".join(re.escape(term) for term in sorted(terms, key=len, reverse=True)), re.IGNORECASE)
+    first = pattern.search(text)
+    start = max(0, first.start() - length // 4) if first else 0
+    end = min(len(text), start + length)
+    fragment = text[start:end]
+
+    parts, cursor = [], 0
+    for match in pattern.finditer(fragment):
+        parts.append(html.escape(fragment[cursor:match.start()]))
+        parts.append(f"<mark>{html.escape(match.group(0))}</mark>")
+        cursor = match.end()
+    parts.append(html.escape(fragment[cursor:]))
+
+    return ("…" if start > 0 else "") + "".join(parts) + ("…" if end < len(text) else "")
+
+
+async def search(db: AsyncSession, q: str, sources: Sequence[str], limit: int) -> dict:
+    """검색 대상별 관련도 순 결과"""
+    terms = parse_terms(q)
+    results = {}
+    for source in sources:
+        if not terms:
+            results[source] = []
+            continue
+        rows = (await db.execute(search_statement(source, terms, limit))).all()
+        results[source] = [
+            {
+                "id": row.id,
+                "title": row.title,
+                "snippet": highlight_snippet(row.body, terms),
+                "score": round(float(row.score), 4),
+            }
+            for row in rows
+        ]
+    return results
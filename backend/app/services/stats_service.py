@@ -0,0 +1,48 @@
+"""
+관리자 통계 관련 비즈니스 로직
+"""
+from sqlalchemy import delete, text
+from sqlalchemy.orm import Session
+from ..models.stat_counter import StatCounter, STAT_DIMENSIONS
+
+
+def rebuild_stat_counters(db: Session):
+    """카운터를 원본 테이블에서 다시 계산 (누적 오차 보정용)"""
+    db.execute(delete(StatCounter))
+    for table, expressions in STAT_DIMENSIONS.items():
+        for expression in expressions:
+            db.execute(text(
+                f"INSERT INTO stat_counters (name, value) "
+                f"SELECT {expression.format(row=table)}, COUNT(*) FROM {table} GROUP BY 1"
+            ))
+    db.commit()
+
+
+def ensure_stat_counters(db: Session):
+    """카운터가 비어 있으면 초기 계산 (기존 데이터베이스에 카운터 테이블이 새로 생긴 경우)"""
+    if db.query(StatCounter.name).first() is None:
+        rebuild_stat_counters(db)
+
+
+def get_admin_stats(db: Session) -> dict:
+    """카운터 테이블 한 번 조회로 관리자 대시보드 통계 구성"""
+    counters = dict(db.query(StatCounter.name, StatCounter.value).all())
+
+    def grouped(prefix: str) -> dict:
+        return {
+            name[len(prefix):]: value
+            for name, value in counters.items()
+            if name.startswith(prefix)
+        }
+
+    return {
+        "counselors": counters.get("counselors", 0),
+        "consultations": counters.get("consultations", 0),
+        "reviews": counters.get("reviews", 0),
+        "notices": counters.get("notices", 0),
+        "active_counselors": counters.get("counselors:active", 0),
+        "consultations_by_status": grouped("consultations:status:"),
+        "notices_by_status": grouped("notices:status:"),
+        "reviews_pending_approval": counters.get("reviews:pending", 0),
+        "reviews_approved": counters.get("reviews:approved", 0),
+    }
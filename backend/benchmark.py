@@ -0,0 +1,671 @@
+#!/usr/bin/env python3
+"""
+백엔드 성능 벤치마크 스크립트
+
+사용법:
+    python benchmark.py sqlite      # SQLite 엔진 프로파일 동시 읽기 처리량 비교
+    python benchmark.py serialize   # 목록 응답 직렬화 CPU 시간 비교 (ORM+Pydantic vs projection+orjson)
+    python benchmark.py compression # 공지사항 목록 응답 압축 전송 크기/지연 시간 비교
+    python benchmark.py search      # 공지사항 목록 검색(FTS5 trigram) vs LIKE 전체 스캔 비교
+    python benchmark.py plans       # 목록 라우터 쿼리의 EXPLAIN QUERY PLAN 점검 (전체 스캔/임시 정렬 검출)
+    python benchmark.py password    # 로그인 폭주 중 로그인 처리량과 목록 조회 지연 시간 비교 (작업자 풀 종류별)
+    python benchmark.py static      # 작은 이미지 다수 요청 시 StaticFiles vs StaticFileServer 처리량/지연 시간 비교
+"""
+import argparse
+import os
+import tempfile
+import threading
+import time
+from sqlalchemy import create_engine, select, update
+from sqlalchemy.orm import sessionmaker
+
+
+def _seed_notices(engine, count: int):
+    """벤치마크용 공지사항 데이터 생성"""
+    from app.database import Base
+    from app.models.user import User
+    from app.models.notice import Notice, NoticeStatus
+
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    author = User(email="bench@example.com", username="bench", full_name="벤치", hashed_password="x")
+    db.add(author)
+    db.flush()
+    db.add_all([
+        Notice(
+            author_id=author.id,
+            title=f"공지사항 {i}",
+            content="수원 힐링 상담센터 공지사항 본문입니다. " * 20,
+            status=NoticeStatus.PUBLISHED,
+            is_pinned=i % 50 == 0
+        )
+        for i in range(count)
+    ])
+    db.commit()
+    db.close()
+
+
+def _run_mixed_workload(engine, readers: int, duration: float) -> dict:
+    """읽기 스레드 여러 개와 쓰기 스레드 하나를 동시에 실행하고 처리량 측정"""
+    from app.models.notice import Notice, NoticeStatus
+
+    stop = threading.Event()
+    reads = [0] * readers
+    writes = [0]
+
+    def reader(index: int):
+        with engine.connect() as conn:
+            while not stop.is_set():
+                conn.execute(
+                    select(Notice.id, Notice.title)
+                    .where(Notice.status == NoticeStatus.PUBLISHED, Notice.is_active == True)
+                    .order_by(Notice.is_pinned.desc(), Notice.created_at.desc())
+                    .limit(20)
+                ).all()
+                conn.rollback()
+                reads[index] += 1
+
+    def writer():
+        while not stop.is_set():
+            with engine.begin() as conn:
+                conn.execute(
+                    update(Notice)
+                    .where(Notice.id == writes[0] % 100 + 1)
+                    .values(view_count=Notice.view_count + 1)
+                )
+                # 긴 쓰기 트랜잭션 흉내
+                time.sleep(0.005)
+            writes[0] += 1
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    threads.append(threading.Thread(target=writer))
+    for t in threads:
+        t.start()
+    time.sleep(duration)
+    stop.set()
+    for t in threads:
+        t.join()
+
+    return {"reads_per_sec": sum(reads) / duration, "writes_per_sec": writes[0] / duration}
+
+
+def bench_sqlite(args):
+    """기본 엔진(롤백 저널) vs 설정 기반 SQLite 프로파일(WAL 등) 비교"""
+    from app.database import create_database_engine
+
+    print(f"🔍 SQLite 동시 읽기 처리량 비교 (읽기 스레드 {args.readers}개, 쓰기 스레드 1개, {args.duration}초)")
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name in ("baseline", "profile"):
+            url = f"sqlite:///{os.path.join(tmp, name + '.db')}"
+            if name == "baseline":
+                engine = create_engine(url, connect_args={"check_same_thread": False})
+            else:
+                engine = create_database_engine(url, echo=False)
+
+            _seed_notices(engine, args.rows)
+            results[name] = _run_mixed_workload(engine, args.readers, args.duration)
+            engine.dispose()
+            print(f"  - {name}: 읽기 {results[name]['reads_per_sec']:.0f}/s, 쓰기 {results[name]['writes_per_sec']:.0f}/s")
+
+    gain = results["profile"]["reads_per_sec"] / max(results["baseline"]["reads_per_sec"], 1)
+    print(f"✅ 읽기 처리량 {gain:.2f}배")
+
+
+def _seed_list_data(engine, count: int):
+    """직렬화 벤치마크용 상담사/후기/공지사항 데이터 생성"""
+    from app.models.counselor import Counselor
+    from app.models.review import Review
+    from app.models.user import User
+
+    _seed_notices(engine, count)
+    Session = sessionmaker(bind=engine)
+    db = Session()
+    author = db.query(User).first()
+    counselors = [
+        Counselor(
+            name=f"상담사 {i}",
+            email=f"counselor{i}@example.com",
+            specialization="개인 상담, 가족 상담",
+            bio="상담사 소개입니다. " * 10,
+            is_online=i % 2 == 0
+        )
+        for i in range(count)
+    ]
+    db.add_all(counselors)
+    db.flush()
+    db.add_all([
+        Review(
+            user_id=author.id,
+            counselor_id=counselors[i % len(counselors)].id,
+            rating=i % 5 + 1,
+            title=f"후기 {i}",
+            content="상담 후기 본문입니다. " * 10,
+            is_approved=True
+        )
+        for i in range(count)
+    ])
+    db.commit()
+    db.close()
+
+
+def bench_serialize(args):
+    """목록 응답 1건을 만드는 CPU 시간 비교
+
+    - legacy: ORM 객체 조회 -> *List 스키마 검증 -> jsonable_encoder -> json
+    - fast: 스키마 컬럼 projection -> Row -> dict -> orjson (재검증 없음)
+    """
+    import json
+    from fastapi.encoders import jsonable_encoder
+    from app.database import create_database_engine
+    from app.core.responses import list_response, orjson, schema_columns
+    from app.models.counselor import Counselor
+    from app.models.notice import Notice
+    from app.schemas.counselor import Counselor as CounselorSchema, CounselorList
+    from app.schemas.notice import Notice as NoticeSchema, NoticeList
+    from app.schemas.review import ReviewList
+    from app.services.review_service import public_review_statement
+    from app.models.review import Review
+    from app.models.user import User
+
+    def legacy_reviews(db):
+        # 기존 방식: ORM 객체 + 행마다 작성자/상담사 관계 가공
+        rows = db.execute(
+            select(Review, User.full_name, Counselor.name)
+            .outerjoin(User, User.id == Review.user_id)
+            .outerjoin(Counselor, Counselor.id == Review.counselor_id)
+            .order_by(Review.id).limit(args.limit)
+        ).all()
+        reviews = []
+        for review, full_name, counselor_name in rows:
+            item = review.__dict__.copy()
+            item["author_name"] = "익명" if review.is_anonymous or not full_name else full_name[0] + "**"
+            item["counselor_name"] = counselor_name
+            reviews.append(item)
+        return ReviewList(reviews=reviews, total=None, page=1, size=args.limit)
+
+    cases = {
+        "counselors": (
+            lambda db: CounselorList(
+                counselors=db.scalars(select(Counselor).order_by(Counselor.id).limit(args.limit)).all(),
+                total=None, page=1, size=args.limit
+            ),
+            lambda db: db.execute(
+                select(*schema_columns(Counselor, CounselorSchema)).order_by(Counselor.id).limit(args.limit)
+            ).all(),
+        ),
+        "reviews": (
+            legacy_reviews,
+            lambda db: db.execute(public_review_statement().order_by(Review.id).limit(args.limit)).all(),
+        ),
+        "notices": (
+            lambda db: NoticeList(
+                notices=db.scalars(select(Notice).order_by(Notice.id).limit(args.limit)).all(),
+                total=None, page=1, size=args.limit
+            ),
+            lambda db: db.execute(
+                select(*schema_columns(Notice, NoticeSchema)).order_by(Notice.id).limit(args.limit)
+            ).all(),
+        ),
+    }
+
+    print(f"🔍 목록 응답 직렬화 CPU 시간 비교 (limit={args.limit}, {args.iterations}회, orjson={'사용' if orjson else '없음'})")
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_database_engine(f"sqlite:///{os.path.join(tmp, 'serialize.db')}", echo=False)
+        _seed_list_data(engine, max(args.limit, 100))
+        Session = sessionmaker(bind=engine)
+
+        for name, (legacy, fast) in cases.items():
+            timings = {}
+            for mode in ("legacy", "fast"):
+                db = Session()
+                started = time.process_time()
+                for _ in range(args.iterations):
+                    if mode == "legacy":
+                        body = json.dumps(jsonable_encoder(legacy(db)), ensure_ascii=False).encode("utf-8")
+                    else:
+                        body = list_response(name, fast(db), None, 0, args.limit, None).body
+                    db.expire_all()
+                timings[mode] = (time.process_time() - started) / args.iterations * 1000
+                db.close()
+            print(
+                f"  - {name}: legacy {timings['legacy']:.2f}ms, fast {timings['fast']:.2f}ms "
+                f"({timings['legacy'] / max(timings['fast'], 1e-9):.2f}배, 응답 {len(body)}B)"
+            )
+        engine.dispose()
+
+
+def _percentile(values: list, percent: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * percent / 100))]
+
+
+def bench_compression(args):
+    """/api/notices/published?limit=100 의 인코딩별 전송 크기와 p50/p95 지연 시간 비교
+
+    cold: 요청마다 응답 캐시를 비워 조회+직렬화+압축까지 포함
+    warm: 캐시에 보관된 (압축)본을 그대로 전송
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        # 앱 설정을 읽기 전에 임시 데이터베이스와 L1 전용 캐시로 지정
+        os.environ["DATABASE_FALLBACK_URL"] = f"sqlite:///{os.path.join(tmp, 'compression.db')}"
+        os.environ["REDIS_URL"] = ""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.database import engine
+        from app.core.cache import response_cache
+        from app.core.compression import ENCODERS
+        from app.config import settings
+
+        _seed_notices(engine, args.rows)
+        path = "/api/notices/published?limit=100"
+        encodings = ["identity", *ENCODERS]
+
+        print(f"🔍 {path} 압축 비교 ({args.iterations}회, 최소 크기 {settings.COMPRESSION_MIN_SIZE}B)")
+        with TestClient(app) as client:
+            for cache_state in ("cold", "warm"):
+                for encoding in encodings:
+                    headers = {"Accept-Encoding": encoding}
+                    timings = []
+                    size = 0
+                    for _ in range(args.iterations):
+                        if cache_state == "cold":
+                            response_cache.clear()
+                        started = time.perf_counter()
+                        response = client.get(path, headers=headers)
+                        timings.append((time.perf_counter() - started) * 1000)
+                        size = int(response.headers["content-length"])  # 압축된 전송 크기
+                    print(
+                        f"  - {cache_state:4} {encoding:8}: {size:>7}B, "
+                        f"p50 {_percentile(timings, 50):.2f}ms, p95 {_percentile(timings, 95):.2f}ms"
+                    )
+        engine.dispose()
+
+
+SEARCH_SYLLABLES = "가나다라마바사아자차카타파하상담치유가족부부우울불안청소년진로수면명상"
+
+
+def _search_vocabulary(size: int, rng) -> list:
+    """3~4음절 합성 단어 목록 (앞쪽 단어일수록 자주 쓰이도록 정렬된 순서 유지)"""
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choices(SEARCH_SYLLABLES, k=rng.choice((3, 4)))))
+    return sorted(words)
+
+
+def bench_search(args):
+    """공지사항 목록 ?q= 검색 지연 시간 비교 (LIKE 전체 스캔 vs FTS5 trigram MATCH)
+
+    목록 API와 같은 정렬/LIMIT에 COUNT(*)까지 포함해, 흔한 단어/드문 단어별 p50/p95를 측정합니다.
+    """
+    import random
+    from sqlalchemy import func, insert, or_
+    from app.database import create_database_engine
+    from app.models.notice import Notice, NoticeStatus
+    from app.models.search import fts_table_name
+    from app.services.search_service import search_conditions
+
+    rng = random.Random(17)
+    vocabulary = _search_vocabulary(args.vocabulary, rng)
+    weights = [1 / (rank + 1) for rank in range(len(vocabulary))]  # Zipf 분포
+    fts = fts_table_name("notices")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_database_engine(f"sqlite:///{os.path.join(tmp, 'search.db')}", echo=False)
+        _seed_notices(engine, 0)
+        # 원본만 채운 뒤 색인을 한 번에 재구축해 구축 시간을 따로 측정
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"DROP TRIGGER {fts}_insert")
+            conn.execute(insert(Notice), [
+                {
+                    "author_id": 1,
+                    "title": " ".join(rng.choices(vocabulary, weights, k=4)),
+                    "content": " ".join(rng.choices(vocabulary, weights, k=60)),
+                    "status": NoticeStatus.PUBLISHED,
+                }
+                for _ in range(args.rows)
+            ])
+        started = time.perf_counter()
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"INSERT INTO {fts} ({fts}) VALUES ('rebuild')")
+        print(f"🔍 공지사항 {args.rows}건 검색 비교 (단어 {len(vocabulary)}개, 색인 구축 {time.perf_counter() - started:.2f}초)")
+
+        def like_conditions(term: str) -> list:
+            pattern = f"%{term}%"
+            return [or_(Notice.title.like(pattern), Notice.content.like(pattern))]
+
+        def run(conn, conditions: list) -> int:
+            base = select(Notice.id, Notice.title).where(
+                Notice.status == NoticeStatus.PUBLISHED, Notice.is_active == True, *conditions
+            )
+            conn.execute(base.order_by(Notice.is_pinned.desc(), Notice.created_at.desc()).limit(args.limit)).all()
+            return conn.execute(select(func.count()).select_from(base.subquery())).scalar_one()
+
+        samples = {"흔한 단어": vocabulary[:5], "드문 단어": vocabulary[-5:]}
+        with engine.connect() as conn:
+            for label, terms in samples.items():
+                for name, build in (("like", like_conditions), ("fts", lambda term: search_conditions("notices", term))):
+                    timings = []
+                    matched = 0
+                    for i in range(args.iterations):
+                        started = time.perf_counter()
+                        matched = run(conn, build(terms[i % len(terms)]))
+                        timings.append((time.perf_counter() - started) * 1000)
+                    print(
+                        f"  - {label} {name:4}: "
+                        f"p50 {_percentile(timings, 50):.2f}ms, p95 {_percentile(timings, 95):.2f}ms (일치 {matched}건)"
+                    )
+        engine.dispose()
+
+
+# 필터가 있는 목록 라우터 (전체 스캔 없이 색인을 사용해야 하는 경로)
+PLAN_CHECK_PATHS = [
+    "/api/counselors/?is_online=true&is_active=true",
+    "/api/counselors/online",
+    "/api/reviews/approved",
+    "/api/reviews/approved?counselor_id=1",
+    "/api/reviews/?counselor_id=1&is_approved=true&is_active=true",
+    "/api/notices/published",
+    "/api/notices/?status=PUBLISHED&is_active=true",
+    "/api/consultations/",
+    "/api/consultations/?status=PENDING",
+    "/api/consultations/admin?status=PENDING",
+    "/api/admin/consultations?status=PENDING",
+    "/api/admin/consultations",
+]
+
+PLAN_CHECK_TABLES = ("consultations", "counselors", "notices", "reviews")
+PLAN_CHECK_USERS = 100
+
+
+def _plan_problems(plan: list):
+    """EXPLAIN QUERY PLAN 결과에서 (색인 없는 테이블 스캔, 정렬용 임시 B-tree) 검출"""
+    scans, sorts = [], []
+    for _, _, _, detail in plan:
+        words = detail.split()
+        if words[:1] == ["SCAN"] and len(words) >= 2 and words[1] in PLAN_CHECK_TABLES and "USING" not in words:
+            scans.append(detail)
+        if detail.startswith("USE TEMP B-TREE FOR ORDER BY"):
+            sorts.append(detail)
+    return scans, sorts
+
+
+def _seed_plan_data(engine, rows: int):
+    """실행 계획 점검용 데이터 생성 (tests/test_query_plans.py에서도 사용)"""
+    from app.models.consultation import Consultation, ConsultationStatus, ConsultationType
+    from app.models.notice import Notice, NoticeStatus
+    from app.models.review import Review
+    from app.models.user import User
+
+    _seed_list_data(engine, rows)
+    # 운영 데이터처럼 사용자/상태/승인 여부가 섞이도록 분포 조정 (모두 같은 값이면 스캔이 최선인 계획이 나옴)
+    with engine.begin() as conn:
+        conn.execute(update(User).values(is_admin=True))
+        conn.execute(User.__table__.insert(), [
+            {"email": f"user{i}@example.com", "username": f"user{i}", "full_name": f"사용자 {i}", "hashed_password": "x"}
+            for i in range(PLAN_CHECK_USERS)
+        ])
+        # 대부분 완료된 이력이고 처리 대기 중인 신청은 일부
+        statuses = [ConsultationStatus.COMPLETED] * 14 + [ConsultationStatus.CANCELLED] * 2 + [
+            ConsultationStatus.CONFIRMED, ConsultationStatus.CONFIRMED,
+            ConsultationStatus.REVIEWING, ConsultationStatus.PENDING,
+        ]
+        conn.execute(Consultation.__table__.insert(), [
+            {
+                "user_id": i % (PLAN_CHECK_USERS + 1) + 1,
+                "counselor_id": i % rows + 1,
+                "consultation_type": ConsultationType.INDIVIDUAL,
+                "status": statuses[i % len(statuses)],
+                "title": f"상담 {i}",
+                "description": "상담 신청 내용",
+                "contact_name": "벤치",
+                "contact_phone": "010-0000-0000",
+                "contact_email": "bench@example.com",
+            }
+            for i in range(rows)
+        ])
+        conn.execute(update(Review).where(Review.id % 3 == 0).values(is_approved=False))
+        conn.execute(update(Review).values(user_id=Review.id % (PLAN_CHECK_USERS + 1) + 1))
+        conn.execute(update(Notice).where(Notice.id % 4 == 0).values(status=NoticeStatus.DRAFT))
+        conn.exec_driver_sql("ANALYZE")
+
+
+def bench_plans(args):
+    """실제 라우터가 실행하는 SELECT를 가로채 EXPLAIN QUERY PLAN으로 색인 사용 여부 확인
+
+    색인 없이 테이블 전체를 스캔하는 쿼리가 하나라도 있으면 종료 코드 1을 반환합니다.
+    색인으로 좁힌 행을 다시 정렬하는 경우(임시 B-tree)는 경고로만 표시합니다.
+    """
+    from sqlalchemy import event
+
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_FALLBACK_URL"] = f"sqlite:///{os.path.join(tmp, 'plans.db')}"
+        os.environ["REDIS_URL"] = ""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.database import async_read_engine, engine, read_engine
+        from app.core.cache import response_cache
+        from app.core.security import create_access_token
+        from app.core.totals import totals
+
+        _seed_plan_data(engine, args.rows)
+
+        captured = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                captured.append((statement, parameters))
+
+        watched = (engine, read_engine, async_read_engine.sync_engine)
+        for watched_engine in watched:
+            event.listen(watched_engine, "before_cursor_execute", capture)
+
+        headers = {"Authorization": f"Bearer {create_access_token({'sub': '1'})}"}
+        failures = 0
+        print(f"🔍 목록 라우터 쿼리 실행 계획 점검 (행 {args.rows}개)")
+        with TestClient(app) as client:
+            for path in PLAN_CHECK_PATHS:
+                response_cache.clear()
+                totals.clear()
+                captured.clear()
+                response = client.get(path, headers=headers)
+                scans, sorts = [], []
+                with engine.connect() as conn:
+                    for statement, parameters in captured:
+                        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+                        plan_scans, plan_sorts = _plan_problems(plan)
+                        scans.extend(plan_scans)
+                        sorts.extend(plan_sorts)
+                if scans or response.status_code != 200:
+                    status = "❌"
+                    failures += 1
+                else:
+                    status = "⚠️" if sorts else "✅"
+                print(f"  {status} {path} ({response.status_code}, 쿼리 {len(captured)}개)")
+                for problem in scans + sorts:
+                    print(f"      - {problem}")
+
+        for watched_engine in watched:
+            event.remove(watched_engine, "before_cursor_execute", capture)
+        engine.dispose()
+    if failures:
+        raise SystemExit(1)
+
+
+def bench_password(args):
+    """로그인 요청이 몰리는 동안의 로그인 처리량과 공지사항 목록 조회 p50/p95
+
+    idle: 로그인 부하 없음 / thread, process: 해당 작업자 풀로 비밀번호 검증
+    (대기 상한을 넘은 로그인은 503으로 거절되며 거절 수도 함께 출력)
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        os.environ["DATABASE_FALLBACK_URL"] = f"sqlite:///{os.path.join(tmp, 'password.db')}"
+        os.environ["REDIS_URL"] = ""
+        from fastapi.testclient import TestClient
+        from app.main import app
+        from app.database import engine
+        from app.core.cache import response_cache
+        from app.core.password_pool import password_pool
+        from app.config import settings
+
+        _seed_notices(engine, 200)
+        credentials = {"email": "login@example.com", "password": "password123"}
+        print(f"🔍 로그인 {args.logins}개 동시 요청 중 목록 조회 지연 시간 ({args.duration}초, bcrypt 비용 {settings.BCRYPT_ROUNDS})")
+        with TestClient(app) as client:
+            client.post("/api/auth/register", json={**credentials, "username": "login", "full_name": "로그인"})
+            for mode in ("idle", "thread", "process"):
+                if mode != "idle":
+                    password_pool.shutdown()
+                    settings.PASSWORD_HASH_EXECUTOR = mode
+                    password_pool.start()
+
+                stop = threading.Event()
+                results = {"ok": 0, "rejected": 0}
+                timings = []
+
+                def login_loop():
+                    while not stop.is_set():
+                        response = client.post("/api/auth/login", json=credentials)
+                        if response.status_code == 200:
+                            results["ok"] += 1
+                        else:
+                            # 실제 클라이언트처럼 Retry-After만큼 기다렸다가 재시도
+                            results["rejected"] += 1
+                            stop.wait(float(response.headers.get("retry-after", 1)))
+
+                threads = [threading.Thread(target=login_loop) for _ in range(args.logins if mode != "idle" else 0)]
+                for thread in threads:
+                    thread.start()
+                started = time.perf_counter()
+                while time.perf_counter() - started < args.duration:
+                    response_cache.clear()
+                    request_started = time.perf_counter()
+                    client.get("/api/notices/published?limit=20")
+                    timings.append((time.perf_counter() - request_started) * 1000)
+                stop.set()
+                for thread in threads:
+                    thread.join()
+
+                print(
+                    f"  - {mode:7}: 로그인 {results['ok'] / args.duration:.1f}/s (거절 {results['rejected']}), "
+                    f"목록 p50 {_percentile(timings, 50):.2f}ms, p95 {_percentile(timings, 95):.2f}ms"
+                )
+        engine.dispose()
+
+
+def bench_static(args):
+    """상담사 카드 썸네일처럼 작은 이미지를 동시에 많이 요청할 때 StaticFiles와 StaticFileServer 비교
+
+    같은 파일 집합을 두 앱에 마운트하고, 미리 한 번씩 요청해 둔 뒤(warm) 무작위 파일을
+    동시 요청 수만큼 병렬로 요청합니다. revalidate는 If-None-Match로 304를 받는 경우입니다.
+    """
+    import asyncio
+    import random
+    import httpx
+    from PIL import Image
+    from starlette.applications import Starlette
+    from starlette.routing import Mount
+    from starlette.staticfiles import StaticFiles
+    from app.core.static import StaticFileServer
+
+    with tempfile.TemporaryDirectory() as tmp:
+        rng = random.Random(42)
+        names = []
+        for i in range(args.files):
+            name = f"{i:064x}.webp"
+            Image.effect_noise((64, 64), 40 + i % 20).convert("RGB").save(os.path.join(tmp, name), "WEBP", quality=80)
+            names.append(name)
+        sizes = [os.path.getsize(os.path.join(tmp, name)) for name in names]
+        print(
+            f"🔍 작은 이미지 {args.files}개 (평균 {sum(sizes) / len(sizes) / 1024:.1f}KB), "
+            f"요청 {args.requests}회, 동시 {args.concurrency}"
+        )
+
+        async def run(app, revalidate: bool) -> dict:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                etags = {}
+                for name in names:  # warm-up (캐시 적재 + ETag 수집)
+                    response = await client.get(f"/static/{name}")
+                    etags[name] = response.headers["etag"]
+
+                timings = []
+                queue = [rng.choice(names) for _ in range(args.requests)]
+
+                async def worker():
+                    while queue:
+                        name = queue.pop()
+                        headers = {"If-None-Match": etags[name]} if revalidate else {}
+                        started = time.perf_counter()
+                        response = await client.get(f"/static/{name}", headers=headers)
+                        timings.append((time.perf_counter() - started) * 1000)
+                        assert response.status_code == (304 if revalidate else 200)
+
+                started = time.perf_counter()
+                await asyncio.gather(*(worker() for _ in range(args.concurrency)))
+                elapsed = time.perf_counter() - started
+            return {"rps": len(timings) / elapsed, "p50": _percentile(timings, 50), "p95": _percentile(timings, 95)}
+
+        apps = {
+            "StaticFiles": Starlette(routes=[Mount("/static", StaticFiles(directory=tmp))]),
+            "StaticFileServer": Starlette(routes=[Mount("/static", StaticFileServer(tmp))]),
+        }
+        for revalidate in (False, True):
+            label = "revalidate" if revalidate else "full"
+            for name, app in apps.items():
+                result = asyncio.run(run(app, revalidate))
+                print(
+                    f"  - {label:10} {name:16}: {result['rps']:.0f} req/s, "
+                    f"p50 {result['p50']:.2f}ms, p95 {result['p95']:.2f}ms"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="백엔드 성능 벤치마크")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    sqlite_parser = subparsers.add_parser("sqlite", help="SQLite 엔진 프로파일 비교")
+    sqlite_parser.add_argument("--readers", type=int, default=8)
+    sqlite_parser.add_argument("--duration", type=float, default=5.0)
+    sqlite_parser.add_argument("--rows", type=int, default=5000)
+    sqlite_parser.set_defaults(func=bench_sqlite)
+
+    serialize_parser = subparsers.add_parser("serialize", help="목록 응답 직렬화 CPU 시간 비교")
+    serialize_parser.add_argument("--limit", type=int, default=100)
+    serialize_parser.add_argument("--iterations", type=int, default=200)
+    serialize_parser.set_defaults(func=bench_serialize)
+
+    compression_parser = subparsers.add_parser("compression", help="응답 압축 전송 크기/지연 시간 비교")
+    compression_parser.add_argument("--iterations", type=int, default=200)
+    compression_parser.add_argument("--rows", type=int, default=500)
+    compression_parser.set_defaults(func=bench_compression)
+
+    search_parser = subparsers.add_parser("search", help="공지사항 전문 검색 지연 시간 비교")
+    search_parser.add_argument("--rows", type=int, default=100000)
+    search_parser.add_argument("--limit", type=int, default=20)
+    search_parser.add_argument("--vocabulary", type=int, default=5000)
+    search_parser.add_argument("--iterations", type=int, default=20)
+    search_parser.set_defaults(func=bench_search)
+
+    plans_parser = subparsers.add_parser("plans", help="목록 라우터 쿼리 실행 계획 점검")
+    plans_parser.add_argument("--rows", type=int, default=2000)
+    plans_parser.set_defaults(func=bench_plans)
+
+    password_parser = subparsers.add_parser("password", help="로그인 폭주 중 처리량/조회 지연 시간 비교")
+    password_parser.add_argument("--logins", type=int, default=16)
+    password_parser.add_argument("--duration", type=float, default=5.0)
+    password_parser.set_defaults(func=bench_password)
+
+    static_parser = subparsers.add_parser("static", help="작은 이미지 정적 파일 서빙 처리량/지연 시간 비교")
+    static_parser.add_argument("--files", type=int, default=200)
+    static_parser.add_argument("--requests", type=int, default=5000)
+    static_parser.add_argument("--concurrency", type=int, default=32)
+    static_parser.set_defaults(func=bench_static)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+참조가 없는 업로드 파일 정리 스크립트
+
+상담사/후기 어디에서도 참조하지 않는 업로드 파일과 그 변환본을 삭제합니다.
+업로드 후 아직 저장되지 않았을 수 있는 최근 파일(UPLOAD_GC_GRACE_HOURS)은 남겨 둡니다.
+
+    python gc_uploads.py --dry-run      # 삭제 대상만 출력
+    python gc_uploads.py --reconcile    # 참조 수를 다시 계산한 뒤 정리
+"""
+import argparse
+from datetime import timedelta
+from app.config import settings
+from app.database import SessionLocal, create_tables
+from app.services import file_service
+
+
+def main():
+    parser = argparse.ArgumentParser(description="참조가 없는 업로드 파일 정리")
+    parser.add_argument("--dry-run", action="store_true", help="삭제하지 않고 대상만 출력")
+    parser.add_argument("--grace-hours", type=float, default=settings.UPLOAD_GC_GRACE_HOURS, help="최근 업로드 보호 시간")
+    parser.add_argument("--reconcile", action="store_true", help="정리 전에 참조 수를 참조 컬럼에서 다시 계산")
+    args = parser.parse_args()
+
+    create_tables()
+    db = SessionLocal()
+    try:
+        if args.reconcile:
+            changed = file_service.reconcile_file_references(db)
+            print(f"🔄 참조 수 보정: {changed}개 파일")
+
+        report = file_service.collect_garbage(db, timedelta(hours=args.grace_hours), dry_run=args.dry_run)
+    finally:
+        db.close()
+
+    action = "삭제 대상" if args.dry_run else "삭제"
+    for key in report.files:
+        print(f"  - {key}")
+    print(f"🗑️ {action}: 파일 {len(report.files)}개 ({report.bytes / 1024:.1f}KB), 변환본 {len(report.variants)}개 묶음")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+테스트 공통 설정
+
+앱 모듈은 import 시점에 설정과 엔진을 만들므로, 임시 디렉터리의 SQLite 파일과 로컬 저장소를 쓰도록
+환경 변수를 먼저 지정합니다. 테이블과 캐시는 테스트마다 새로 만듭니다.
+"""
+import os
+import tempfile
+
+TEST_DIR = tempfile.mkdtemp(prefix="swh-tests-")
+os.environ.update({
+    "DATABASE_FALLBACK_URL": f"sqlite:///{os.path.join(TEST_DIR, 'test.db')}",
+    "DATABASE_READ_URL": "",
+    "DEBUG": "false",
+    "REDIS_URL": "",
+    "STORAGE_BACKEND": "local",
+    "UPLOAD_DIR": os.path.join(TEST_DIR, "uploads"),
+    "PASSWORD_HASH_EXECUTOR": "thread",
+    "IMAGE_PIPELINE_EXECUTOR": "thread",
+    "BCRYPT_ROUNDS": "4",
+})
+
+import pytest
+from app.core.auth_cache import principal_cache, token_cache
+from app.core.cache import response_cache
+from app.core.security import create_access_token
+from app.core.totals import totals
+from app.database import Base, SessionLocal, engine
+import app.models  # noqa: F401 - 모든 모델을 메타데이터에 등록
+from app.models.user import User
+
+
+def reset_caches():
+    response_cache.clear()
+    totals.clear()
+    token_cache.clear()
+    principal_cache.clear()
+
+
+@pytest.fixture
+def db():
+    """빈 테이블(트리거/검색 색인 포함)과 쓰기 세션"""
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    reset_caches()
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def client(db):
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture
+def admin(db) -> User:
+    user = User(email="admin@example.com", username="admin", full_name="관리자", hashed_password="x", is_admin=True)
+    db.add(user)
+    db.commit()
+    return user
+
+
+@pytest.fixture
+def admin_headers(admin) -> dict:
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(admin.id)})}"}
+
+
+@pytest.fixture
+def user_headers(db) -> dict:
+    user = User(email="user@example.com", username="user", full_name="사용자", hashed_password="x")
+    db.add(user)
+    db.commit()
+    return {"Authorization": f"Bearer {create_access_token({'sub': str(user.id)})}"}
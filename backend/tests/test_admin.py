@@ -0,0 +1,96 @@
+import asyncio
+import time
+import httpx
+from sqlalchemy import event
+from app.database import engine
+
+SLOW_QUERY_SECONDS = 1.0
+
+
+def test_slow_admin_query_does_not_stall_health(db):
+    """관리자 API의 느린 동기 쿼리가 이벤트 루프를 막지 않음 (스레드풀에서 실행)"""
+    from app.main import app
+
+    def slow(conn, cursor, statement, parameters, context, executemany):
+        if "stat_counters" in statement:
+            time.sleep(SLOW_QUERY_SECONDS)
+
+    async def timed(client, path):
+        response = await client.get(path)
+        return response, time.perf_counter()
+
+    async def scenario():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            started = time.perf_counter()
+            admin = asyncio.create_task(timed(client, "/api/admin/stats"))
+            await asyncio.sleep(0.2)  # 관리자 요청이 느린 쿼리에 들어갈 때까지 대기
+            health, health_done = await timed(client, "/api/health")
+            (admin, admin_done) = await admin
+            return health, health_done - started, admin, admin_done - started
+
+    event.listen(engine, "before_cursor_execute", slow)
+    try:
+        health, health_elapsed, admin, admin_elapsed = asyncio.run(scenario())
+    finally:
+        event.remove(engine, "before_cursor_execute", slow)
+
+    assert admin.status_code == 200
+    assert health.status_code == 200
+    assert admin_elapsed >= SLOW_QUERY_SECONDS
+    assert health_elapsed < SLOW_QUERY_SECONDS / 2
+
+
+def test_stats_recompute_requires_admin_and_get_is_read_only(client, db, admin_headers, user_headers):
+    from app.models.stat_counter import StatCounter
+
+    # 카운터에 오차를 만든 뒤 GET은 그대로 읽기만 함
+    db.query(StatCounter).filter(StatCounter.name == "counselors").update({"value": 999})
+    db.commit()
+    assert client.get("/api/admin/stats", params={"recompute": "true"}).json()["counselors"] == 999
+    assert db.query(StatCounter.value).filter(StatCounter.name == "counselors").scalar() == 999
+
+    assert client.post("/api/admin/stats/recompute").status_code in (401, 403)
+    assert client.post("/api/admin/stats/recompute", headers=user_headers).status_code == 403
+
+    response = client.post("/api/admin/stats/recompute", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["counselors"] != 999
+    # 재계산 후 캐시된 GET 응답도 새 값
+    assert client.get("/api/admin/stats").json()["counselors"] == response.json()["counselors"]
+
+
+def test_admin_consultations_requires_admin_and_returns_all_by_default(client, db, admin, admin_headers, user_headers):
+    from app.models.consultation import Consultation, ConsultationType
+
+    db.add_all([
+        Consultation(
+            user_id=admin.id, consultation_type=ConsultationType.INDIVIDUAL, title=f"상담 {i}", description="내용",
+            contact_name="관리자", contact_phone="010-0000-0000", contact_email="admin@example.com",
+        )
+        for i in range(120)
+    ])
+    db.commit()
+    path = "/api/admin/consultations"
+
+    assert client.get(path).status_code in (401, 403)
+    assert client.get(path, headers=user_headers).status_code == 403
+    assert client.get(path, params={"stream": "true"}).status_code in (401, 403)
+
+    # 페이지 파라미터가 없으면 기존처럼 전체 반환
+    body = client.get(path, headers=admin_headers).json()
+    assert len(body["consultations"]) == body["total"] == 120
+
+    page = client.get(path, params={"skip": 100, "limit": 50}, headers=admin_headers).json()
+    assert (len(page["consultations"]), page["page"], page["size"]) == (20, 3, 50)
+
+    streamed = client.get(path, params={"stream": "true"}, headers=admin_headers)
+    assert streamed.headers["x-total-count"] == "120"
+    assert len(streamed.text.splitlines()) == 120
+
+
+def test_cache_stats_requires_admin(client, admin_headers, user_headers):
+    path = "/api/admin/cache-stats"
+    assert client.get(path).status_code in (401, 403)
+    assert client.get(path, headers=user_headers).status_code == 403
+    assert "entries" in client.get(path, headers=admin_headers).json()
@@ -0,0 +1,48 @@
+from app.core.auth_cache import principal_cache, token_cache
+
+CREDENTIALS = {"email": "member@example.com", "password": "secret-pass"}
+
+
+def _register_and_login(client) -> dict:
+    response = client.post("/api/auth/register", json={
+        **CREDENTIALS, "username": "member", "full_name": "회원",
+    })
+    assert response.status_code == 200
+    response = client.post("/api/auth/login", json=CREDENTIALS)
+    assert response.status_code == 200
+    return response.json()
+
+
+def _bearer(token: str) -> dict:
+    return {"Authorization": f"Bearer {token}"}
+
+
+def test_login_token_authenticates_protected_route(client):
+    tokens = _register_and_login(client)
+
+    response = client.get("/api/auth/me", headers=_bearer(tokens["access_token"]))
+    assert response.status_code == 200
+    assert response.json()["email"] == CREDENTIALS["email"]
+    # 두 번째 요청은 토큰/principal 캐시에서 처리
+    token_hits, principal_hits = token_cache.hits, principal_cache.hits
+    assert client.get("/api/auth/me", headers=_bearer(tokens["access_token"])).status_code == 200
+    assert token_cache.hits > token_hits and principal_cache.hits > principal_hits
+
+    refreshed = client.post("/api/auth/refresh", params={"refresh_token": tokens["refresh_token"]})
+    assert refreshed.status_code == 200
+    assert client.get("/api/auth/me", headers=_bearer(refreshed.json()["access_token"])).status_code == 200
+
+
+def test_deactivated_user_is_rejected_with_cached_token(client, admin_headers):
+    tokens = _register_and_login(client)
+    headers = _bearer(tokens["access_token"])
+    user_id = client.get("/api/auth/me", headers=headers).json()["id"]
+
+    toggled = client.patch(f"/api/admin/users/{user_id}/toggle-status", headers=admin_headers)
+    assert toggled.json()["is_active"] is False
+    response = client.get("/api/auth/me", headers=headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Inactive user"
+
+    client.patch(f"/api/admin/users/{user_id}/toggle-status", headers=admin_headers)
+    assert client.get("/api/auth/me", headers=headers).status_code == 200
@@ -0,0 +1,104 @@
+"""
+Redis 공유 캐시(L2) 테스트
+
+fakeredis 서버 하나를 여러 RedisCacheBackend가 함께 쓰게 해 워커 여러 개를 흉내 냅니다.
+"""
+import queue
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.core import cache_backend
+from app.core.cache import response_cache
+from app.core.totals import totals
+from app.core.cache_backend import RedisCacheBackend, versioned_key
+
+
+def _worker(server) -> RedisCacheBackend:
+    backend = RedisCacheBackend("redis://fake", prefix="test:", socket_timeout=0.2, retry_interval=0.1)
+    backend.client = fakeredis.FakeRedis(server=server)
+    return backend
+
+
+@pytest.fixture
+def workers():
+    server = fakeredis.FakeServer()
+    backends = [_worker(server), _worker(server)]
+    yield backends
+    for backend in backends:
+        backend.close()
+
+
+def test_invalidation_changes_versioned_key(workers):
+    first, second = workers
+    versions = first.tag_versions(["notices", "counselors"])
+    assert versions == (0, 0)
+    first.set(versioned_key("resp", "/a", versions), b"old", ttl=60)
+    assert second.get(versioned_key("resp", "/a", second.tag_versions(["notices", "counselors"]))) == b"old"
+
+    second.invalidate_tags(["notices"])
+
+    versions = first.tag_versions(["notices", "counselors"])
+    assert versions == (1, 0)
+    assert first.get(versioned_key("resp", "/a", versions)) is None
+
+
+def test_invalidation_is_published_to_other_workers(workers):
+    first, second = workers
+    received = {name: queue.Queue() for name in ("first", "second")}
+    first.subscribe(received["first"].put)
+    second.subscribe(received["second"].put)
+    # 구독 스레드가 채널에 붙을 때까지 대기
+    for _ in range(50):
+        if first.client.pubsub_numsub(first.channel)[0][1] == 2:
+            break
+        second._stop.wait(0.05)
+
+    first.invalidate_tags(["reviews", "counselors"])
+
+    assert received["second"].get(timeout=3) == ["reviews", "counselors"]
+    # 자기 자신이 보낸 무효화는 다시 받지 않음
+    with pytest.raises(queue.Empty):
+        received["first"].get(timeout=0.3)
+
+
+def test_shared_response_cache_follows_other_worker_invalidation(client, workers, monkeypatch):
+    first, second = workers
+    monkeypatch.setattr(cache_backend, "_backend", first)
+    path = "/api/notices/published"
+
+    assert client.get(path).headers["x-cache"] == "MISS"
+    response_cache.clear()  # L1이 빈 다른 워커처럼 조회
+    assert client.get(path).headers["x-cache"] == "HIT-SHARED"
+
+    second.invalidate_tags(["notices"])
+    response_cache.clear()
+    assert client.get(path).headers["x-cache"] == "MISS"
+
+
+def test_list_etag_uses_shared_table_versions(client, workers, monkeypatch):
+    first, second = workers
+    monkeypatch.setattr(cache_backend, "_backend", first)
+    path = "/api/notices/published"
+    etag = client.get(path).headers["etag"]
+
+    # 워커마다 다른 로컬 세대는 ETag에 영향을 주지 않음 (다른 워커가 준 ETag로도 304)
+    totals.invalidate("notices")
+    response_cache.clear()
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 304
+
+    # 다른 워커의 쓰기로 공유 버전이 오르면 새 ETag
+    second.invalidate_tags(["notices"])
+    response_cache.clear()
+    assert client.get(path, headers={"If-None-Match": etag}).status_code == 200
+
+
+def test_unreachable_redis_falls_back_to_local_cache():
+    backend = RedisCacheBackend("redis://127.0.0.1:1", prefix="test:", socket_timeout=0.05, retry_interval=60)
+    try:
+        assert backend.tag_versions(["notices"]) is None
+        assert not backend.available
+        assert backend.get("any") is None  # 재시도 간격 동안은 호출하지 않음
+    finally:
+        backend.close()
@@ -0,0 +1,65 @@
+import asyncio
+import os
+
+import pytest
+
+from app.config import settings
+
+FILE_SIZE = settings.STATIC_SMALL_FILE_MAX_SIZE + 1  # 메모리 캐시 대신 파일 전송 경로를 타는 크기
+
+
+def _request(app, path: str, extension: str):
+    """서버 확장을 켠 ASGI 요청을 보내고 앱이 보낸 메시지 목록 반환"""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"test"), (b"accept-encoding", b"gzip")],
+        "server": ("test", 80),
+        "client": ("127.0.0.1", 1234),
+        "extensions": {extension: {}},
+    }
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+    return messages
+
+
+@pytest.mark.parametrize("extension", ["http.response.pathsend", "http.response.zerocopysend"])
+@pytest.mark.parametrize("filename", ["large.txt", "large.png"])
+def test_file_send_extensions_pass_through_compression(client, extension, filename):
+    from app.main import app
+
+    os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    with open(os.path.join(settings.UPLOAD_DIR, filename), "wb") as f:
+        f.write(b"a" * FILE_SIZE)
+
+    messages = _request(app, f"/uploads/{filename}", extension)
+
+    assert [message["type"] for message in messages] == ["http.response.start", extension]
+    start = messages[0]
+    assert start["status"] == 200
+    headers = dict(start["headers"])
+    assert b"content-encoding" not in headers
+    assert headers[b"content-length"] == str(FILE_SIZE).encode()
+    if extension == "http.response.zerocopysend":
+        assert (messages[1]["offset"], messages[1]["count"]) == (0, FILE_SIZE)
+
+
+def test_small_json_response_is_still_compressed(client):
+    response = client.get("/api/counselors/", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["vary"]
@@ -0,0 +1,126 @@
+from contextlib import contextmanager
+from datetime import datetime
+
+from sqlalchemy import event
+
+from app.core.cache import response_cache
+from app.database import async_read_engine
+from app.models.notice import Notice, NoticeStatus
+
+PATH = "/api/notices/published"
+
+
+@contextmanager
+def count_queries():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if "count(" in statement.lower():
+            statements.append(statement)
+
+    event.listen(async_read_engine.sync_engine, "before_cursor_execute", record)
+    try:
+        yield statements
+    finally:
+        event.remove(async_read_engine.sync_engine, "before_cursor_execute", record)
+
+
+def _notices(db, admin, count):
+    notices = [
+        Notice(author_id=admin.id, title=f"공지 {i}", content="본문", status=NoticeStatus.PUBLISHED)
+        for i in range(count)
+    ]
+    db.add_all(notices)
+    db.commit()
+    return notices
+
+
+def test_list_total_comes_from_totals_cache(client, db, admin, admin_headers):
+    _notices(db, admin, 3)
+    # 검증자는 행 수를 세지 않으므로 COUNT는 totals 캐시가 비었을 때 한 번만
+    with count_queries() as statements:
+        assert client.get(PATH, params={"total": "exact"}).json()["total"] == 3
+    assert len(statements) == 1
+
+    response_cache.clear()
+    with count_queries() as statements:
+        assert client.get(PATH).json()["total"] == 3  # 기본값 estimate - 캐시된 개수
+    assert statements == []
+
+    # 라우터의 쓰기는 캐시된 개수를 무효화
+    created = client.post("/api/notices/", json={
+        "title": "새 공지", "content": "본문", "status": NoticeStatus.PUBLISHED.value,
+    }, headers=admin_headers)
+    assert created.status_code == 200
+    with count_queries() as statements:
+        assert client.get(PATH, params={"total": "exact"}).json()["total"] == 4
+    assert len(statements) == 1
+
+    with count_queries() as statements:
+        assert client.get(PATH, params={"total": "none"}).json()["total"] is None
+    assert statements == []
+
+
+def test_list_not_modified_only_on_matching_etag(client, db, admin):
+    notices = _notices(db, admin, 3)
+    first = client.get(PATH)
+    etag = first.headers["etag"]
+    assert "last-modified" not in first.headers
+
+    response_cache.clear()
+    assert client.get(PATH, headers={"If-None-Match": etag}).status_code == 304
+    # Last-Modified가 없으므로 If-Modified-Since만으로는 304를 주지 않음
+    response_cache.clear()
+    assert client.get(PATH, headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"}).status_code == 200
+
+    # 가장 최근 행을 지워 max(updated_at)이 과거로 돌아가도 ETag가 바뀜
+    newest = notices[-1]
+    db.query(Notice).filter(Notice.id == newest.id).update({"updated_at": datetime(2100, 1, 1)})
+    db.commit()
+    response_cache.clear()
+    etag = client.get(PATH).headers["etag"]
+    db.delete(newest)
+    db.commit()
+    response_cache.clear()
+    response = client.get(PATH, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert newest.id not in [item["id"] for item in response.json()["notices"]]
+
+
+def _pin_timestamps(db, when=datetime(2030, 1, 1, 12, 0, 0)):
+    """모든 공지의 변경 시각을 같은 초로 고정 (같은 초 안에 일어난 쓰기 재현)"""
+    db.query(Notice).update({"created_at": when, "updated_at": when}, synchronize_session=False)
+    db.commit()
+
+
+def test_list_etag_changes_on_same_second_edit(client, db, admin, admin_headers):
+    notices = _notices(db, admin, 3)
+    _pin_timestamps(db)
+    etag = client.get(PATH).headers["etag"]
+
+    edited = client.put(f"/api/notices/{notices[0].id}", json={"title": "수정된 공지"}, headers=admin_headers)
+    assert edited.status_code == 200
+    _pin_timestamps(db)
+
+    # 행 수와 max(updated_at)은 그대로지만 쓰기 세대가 바뀌었으므로 새 목록을 보냄
+    response = client.get(PATH, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert "수정된 공지" in [item["title"] for item in response.json()["notices"]]
+    assert client.get(PATH, headers={"If-None-Match": response.headers["etag"]}).status_code == 304
+
+
+def test_list_etag_changes_on_delete_and_insert_with_same_count(client, db, admin, admin_headers):
+    notices = _notices(db, admin, 3)
+    _pin_timestamps(db)
+    etag = client.get(PATH).headers["etag"]
+
+    assert client.delete(f"/api/notices/{notices[0].id}", headers=admin_headers).status_code == 200
+    created = client.post("/api/notices/", json={
+        "title": "새 공지", "content": "본문", "status": NoticeStatus.PUBLISHED.value,
+    }, headers=admin_headers)
+    assert created.status_code == 200
+    _pin_timestamps(db)
+
+    response = client.get(PATH, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["total"] == 3
@@ -0,0 +1,80 @@
+import json
+
+import pytest
+from PIL import Image
+
+from app.core import storage as storage_module
+from app.core.image_pipeline import MANIFEST_NAME, pick_variant, process_image, variant_prefix
+from app.core.storage import LocalStorageBackend
+
+SOURCE_KEY = "profile_images/source.jpg"
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    backend = LocalStorageBackend(str(tmp_path), "/uploads")
+    monkeypatch.setattr(storage_module, "_storage", backend)
+    # process_image가 바꾸는 전역 픽셀 상한을 테스트 후 복원
+    monkeypatch.setattr(Image, "MAX_IMAGE_PIXELS", Image.MAX_IMAGE_PIXELS)
+    return backend
+
+
+def _store_rotated_jpeg(storage, tmp_path):
+    """가로 400x200으로 저장됐지만 EXIF 방향(6)상 세로로 보여야 하는 사진"""
+    exif = Image.Exif()
+    exif[0x0112] = 6  # Orientation: 시계 방향 90도 회전
+    exif[0x010F] = "Test Camera"  # Make - 변환본에는 남지 않아야 함
+    path = tmp_path / "upload.jpg"
+    Image.new("RGB", (400, 200), "red").save(path, "JPEG", exif=exif)
+    storage.store_file(str(path), SOURCE_KEY, "image/jpeg")
+
+
+def test_variant_prefix():
+    assert variant_prefix("profile_images/abc.jpg") == "profile_images/variants/abc/"
+
+
+def test_process_image_writes_manifest_and_variants(storage, tmp_path):
+    _store_rotated_jpeg(storage, tmp_path)
+
+    manifest = process_image(SOURCE_KEY, [256, 64, 768], ["webp"], 80, 40_000_000)
+
+    prefix = variant_prefix(SOURCE_KEY)
+    with open(storage.local_path(prefix + MANIFEST_NAME), encoding="utf-8") as handle:
+        assert json.load(handle) == manifest
+    assert manifest["source"] == "source.jpg"
+    assert manifest["bytes"] == storage.head(SOURCE_KEY).size
+
+    # 작은 크기부터, 방향을 반영한 세로 이미지로, 원본(긴 변 400)보다 크게 늘리지 않음
+    assert [(v["size"], v["width"], v["height"]) for v in manifest["variants"]] == [
+        (64, 32, 64), (256, 128, 256), (768, 200, 400),
+    ]
+    for variant in manifest["variants"]:
+        assert variant["format"] == "webp"
+        # file은 원본과 같은 디렉터리 기준 상대 경로
+        key = "profile_images/" + variant["file"]
+        assert key.startswith(prefix)
+        assert storage.head(key).size == variant["bytes"]
+        with Image.open(storage.local_path(key)) as image:
+            assert image.format == "WEBP"
+            assert (image.width, image.height) == (variant["width"], variant["height"])
+            assert not image.getexif()
+
+
+def test_pick_variant_prefers_smallest_covering_size(storage, tmp_path):
+    _store_rotated_jpeg(storage, tmp_path)
+    manifest = process_image(SOURCE_KEY, [64, 256, 768], ["webp"], 80, 40_000_000)
+
+    assert pick_variant(manifest, 64)["size"] == 64
+    assert pick_variant(manifest, 100)["size"] == 256
+    # 요청 크기보다 큰 변환본이 없으면 가장 큰 것
+    assert pick_variant(manifest, 2000)["size"] == 768
+    assert pick_variant(manifest, 64, "avif") is None
+
+
+def test_process_image_rejects_pixel_bomb(storage, tmp_path):
+    _store_rotated_jpeg(storage, tmp_path)
+
+    with pytest.raises(Image.DecompressionBombError):
+        process_image(SOURCE_KEY, [64], ["webp"], 80, 10_000)
+    # manifest는 마지막에 기록하므로 실패하면 남지 않음
+    assert storage.head(variant_prefix(SOURCE_KEY) + MANIFEST_NAME) is None
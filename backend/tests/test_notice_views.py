@@ -0,0 +1,23 @@
+from datetime import datetime
+from app.models.notice import Notice, NoticeStatus
+from app.services.notice_service import NoticeViewCounter
+
+
+def test_flush_adds_views_without_touching_updated_at(db, admin):
+    edited = datetime(2026, 1, 2, 3, 4, 5, 678901)
+    notice = Notice(author_id=admin.id, title="공지", content="본문", status=NoticeStatus.PUBLISHED, view_count=3)
+    db.add(notice)
+    db.commit()
+    db.query(Notice).filter(Notice.id == notice.id).update({"updated_at": edited})
+    db.commit()
+
+    counter = NoticeViewCounter(flush_interval=60)
+    for _ in range(4):
+        counter.record(notice.id)
+    assert counter.flush() == 1
+
+    db.expire_all()
+    stored = db.get(Notice, notice.id)
+    assert stored.view_count == 7
+    assert stored.updated_at == edited
+    assert counter.pending(notice.id) == 0
@@ -0,0 +1,70 @@
+from sqlalchemy import text
+import pytest
+
+# func.now() 기본값(초 단위)과 Python datetime(마이크로초) 형식이 섞인 같은 초의 시각들
+CREATED_AT = [
+    "2026-01-01 10:00:00",
+    "2026-01-01 10:00:00.000000",
+    "2026-01-01 10:00:00.000001",
+    "2026-01-01 10:00:00",
+    "2026-01-01 10:00:00.500000",
+    "2026-01-01 10:00:00.000001",
+    "2026-01-01 09:59:59.999999",
+    "2026-01-01 10:00:01",
+    "2026-01-01 10:00:00",
+]
+
+
+def _normalized(value: str) -> str:
+    seconds, _, fraction = value.partition(".")
+    return f"{seconds}.{fraction.ljust(6, '0')}"
+
+
+@pytest.fixture
+def notices(db, admin):
+    for i, created_at in enumerate(CREATED_AT, start=1):
+        db.execute(text(
+            "INSERT INTO notices (id, author_id, title, content, notice_type, status, is_pinned, is_active, view_count, created_at) "
+            "VALUES (:id, :author, :title, '본문', 'GENERAL', 'PUBLISHED', :pinned, 1, 0, :created_at)"
+        ), {"id": i, "author": admin.id, "title": f"공지 {i}", "pinned": i == 5, "created_at": created_at})
+    db.commit()
+    rows = [(i == 5, _normalized(created_at), i) for i, created_at in enumerate(CREATED_AT, start=1)]
+    return [i for _, _, i in sorted(rows, reverse=True)]
+
+
+def _walk(client, path: str, limit: int, headers=None) -> list:
+    ids, cursor = [], None
+    for _ in range(len(CREATED_AT) + 1):
+        params = {"limit": limit, **({"cursor": cursor} if cursor else {})}
+        body = client.get(path, params=params, headers=headers).json()
+        ids.extend(notice["id"] for notice in body["notices"])
+        cursor = body["next_cursor"]
+        if cursor is None:
+            break
+    return ids
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3])
+def test_published_cursor_pages_mixed_timestamp_formats(client, notices, limit):
+    assert _walk(client, "/api/notices/published", limit) == notices
+
+
+@pytest.mark.parametrize("limit", [1, 2, 4])
+def test_admin_cursor_pages_mixed_timestamp_formats(client, notices, limit):
+    assert _walk(client, "/api/notices/?status=PUBLISHED&is_active=true", limit) == notices
+
+
+def test_cursor_ordering_uses_sortable_index(db, notices):
+    """정렬 식이 표현식 색인과 일치해 임시 정렬이 생기지 않음"""
+    from app.core.pagination import page_statement
+    from app.api.notices import NOTICE_COLUMNS, NOTICE_SORT_KEY
+    from app.models.notice import Notice, NoticeStatus
+    from sqlalchemy import select
+
+    statement = page_statement(
+        select(*NOTICE_COLUMNS).where(Notice.status == NoticeStatus.PUBLISHED, Notice.is_active == True),
+        NOTICE_SORT_KEY, 0, 10,
+    )
+    sql = statement.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    plan = db.connection().exec_driver_sql(f"EXPLAIN QUERY PLAN {sql}").all()
+    assert not any("TEMP B-TREE" in row[3] for row in plan), plan
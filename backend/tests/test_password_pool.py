@@ -0,0 +1,46 @@
+from passlib.context import CryptContext
+from app.core.password_pool import password_pool
+from app.core.security import get_password_hash
+from app.models.user import User
+
+CREDENTIALS = {"email": "member@example.com", "password": "secret-pass"}
+
+
+def _add_user(db, hashed_password: str) -> User:
+    user = User(email=CREDENTIALS["email"], username="member", full_name="회원", hashed_password=hashed_password)
+    db.add(user)
+    db.commit()
+    return user
+
+
+def test_login_is_shed_with_503_when_pool_is_full(client, db, monkeypatch):
+    _add_user(db, get_password_hash(CREDENTIALS["password"]))
+    password_pool.start()
+    rejected = password_pool.rejected
+    # 대기 작업이 상한까지 찬 상태 - 작업자 풀에 넣지 않고 바로 거절해야 함
+    monkeypatch.setattr(password_pool, "_pending", password_pool.max_pending)
+
+    response = client.post("/api/auth/login", json=CREDENTIALS)
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "1"
+    assert password_pool.rejected == rejected + 1
+
+    monkeypatch.setattr(password_pool, "_pending", 0)
+    assert client.post("/api/auth/login", json=CREDENTIALS).status_code == 200
+
+
+def test_login_rehashes_password_with_changed_cost(client, db):
+    # 현재 설정(BCRYPT_ROUNDS=4)과 다른 비용으로 만든 기존 해시
+    old_hash = CryptContext(schemes=["bcrypt"], bcrypt__rounds=5).hash(CREDENTIALS["password"])
+    user = _add_user(db, old_hash)
+
+    assert client.post("/api/auth/login", json=CREDENTIALS).status_code == 200
+    db.refresh(user)
+    assert user.hashed_password != old_hash
+    assert user.hashed_password.startswith("$2b$04$")
+
+    # 새 해시로도 로그인되고, 다시 바꾸지는 않음
+    new_hash = user.hashed_password
+    assert client.post("/api/auth/login", json=CREDENTIALS).status_code == 200
+    db.refresh(user)
+    assert user.hashed_password == new_hash
@@ -0,0 +1,74 @@
+"""
+목록 라우터 쿼리의 EXPLAIN QUERY PLAN 점검
+
+실제 라우터가 실행하는 SELECT를 가로채 실행 계획을 확인합니다.
+색인 없는 테이블 전체 스캔이나 정렬용 임시 B-tree가 생기면 실패합니다.
+(python benchmark.py plans와 같은 경로/데이터 분포를 사용합니다.)
+"""
+import os
+import re
+
+import pytest
+from sqlalchemy import event
+
+from app.core.cache import response_cache
+from app.core.security import create_access_token
+from app.core.totals import totals
+from app.database import Base, async_read_engine, engine, read_engine
+from app.models.user import User
+from benchmark import PLAN_CHECK_PATHS, _plan_problems, _seed_plan_data
+
+PLAN_ROWS = 600
+TURSO_SCHEMA = os.path.join(os.path.dirname(__file__), "..", "..", "turso_schema.sql")
+
+
+@pytest.fixture
+def plan_client(client, db):
+    _seed_plan_data(engine, PLAN_ROWS)
+    admin = db.query(User).filter(User.email == "bench@example.com").one()
+    client.headers["Authorization"] = f"Bearer {create_access_token({'sub': str(admin.id)})}"
+    return client
+
+
+@pytest.mark.parametrize("path", PLAN_CHECK_PATHS)
+def test_list_queries_use_indexes(plan_client, path):
+    captured = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    watched = (engine, read_engine, async_read_engine.sync_engine)
+    response_cache.clear()
+    totals.clear()
+    for watched_engine in watched:
+        event.listen(watched_engine, "before_cursor_execute", capture)
+    try:
+        response = plan_client.get(path)
+    finally:
+        for watched_engine in watched:
+            event.remove(watched_engine, "before_cursor_execute", capture)
+
+    assert response.status_code == 200
+    assert captured
+    with engine.connect() as conn:
+        for statement, parameters in captured:
+            plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).all()
+            scans, sorts = _plan_problems(plan)
+            assert not scans and not sorts, (statement, scans + sorts)
+
+
+def test_turso_schema_has_model_indexes():
+    with open(TURSO_SCHEMA, encoding="utf-8") as f:
+        schema = f.read()
+    tables = set(re.findall(r"CREATE TABLE IF NOT EXISTS (\w+)", schema))
+    declared = set(re.findall(r"CREATE INDEX IF NOT EXISTS (\w+)", schema))
+
+    # 기본 키/UNIQUE 컬럼 색인은 테이블 정의에 포함되어 있으므로 제외
+    expected = {
+        index.name
+        for table in Base.metadata.sorted_tables if table.name in tables
+        for index in table.indexes
+        if not index.unique and [column.name for column in index.columns] != ["id"]
+    }
+    assert expected <= declared
@@ -0,0 +1,20 @@
+from fastapi.responses import ORJSONResponse
+
+from app.core.responses import list_response
+
+
+def test_app_serializes_with_orjson_by_default():
+    from app.main import app
+
+    assert app.router.default_response_class is ORJSONResponse
+
+
+def test_list_response_uses_fastapi_orjson_response(client):
+    response = list_response("items", [], 0, 0, 10, None)
+    assert type(response) is ORJSONResponse
+    assert response.body == b'{"items":[],"total":0,"page":1,"size":10,"next_cursor":null}'
+
+    # dict를 반환하는 일반 라우트도 기본 응답 클래스(orjson)로 직렬화
+    health = client.get("/api/health")
+    assert health.status_code == 200
+    assert health.headers["content-type"] == "application/json"
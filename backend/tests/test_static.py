@@ -0,0 +1,145 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+from starlette.applications import Starlette
+from starlette.routing import Mount
+
+from app.config import settings
+from app.core.static import StaticFileServer
+
+BODY = bytes(range(256)) * 4  # 1KB
+DIGEST = "ab" * 32
+
+
+@pytest.fixture
+def files(tmp_path):
+    root = tmp_path / "public"
+    root.mkdir()
+    (root / "photo.png").write_bytes(BODY)
+    (root / f"{DIGEST}.png").write_bytes(BODY)
+    (root / "large.bin").write_bytes(os.urandom(settings.STATIC_SMALL_FILE_MAX_SIZE * 2 + 123))
+    (root / ".env").write_text("SECRET_KEY=x")
+    (tmp_path / "secret.txt").write_text("outside")
+    os.symlink(tmp_path / "secret.txt", root / "link.txt")
+    return root
+
+
+@pytest.fixture
+def server(files):
+    return StaticFileServer(str(files))
+
+
+@pytest.fixture
+def static_client(server):
+    with TestClient(Starlette(routes=[Mount("/uploads", server)])) as test_client:
+        yield test_client
+
+
+def test_full_response_and_cache_headers(static_client):
+    response = static_client.get("/uploads/photo.png")
+    assert response.status_code == 200
+    assert response.content == BODY
+    assert response.headers["accept-ranges"] == "bytes"
+    assert response.headers["cache-control"] == "public, max-age=300"
+
+    # 내용 주소 파일은 다이제스트가 ETag이고 immutable
+    response = static_client.get(f"/uploads/{DIGEST}.png")
+    assert response.headers["etag"] == f'"{DIGEST}"'
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_if_none_match_returns_304(static_client, server):
+    etag = static_client.get("/uploads/photo.png").headers["etag"]
+
+    for header in (etag, f"W/{etag}", f'"other", {etag}', "*"):
+        response = static_client.get("/uploads/photo.png", headers={"If-None-Match": header})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+    assert static_client.get("/uploads/photo.png", headers={"If-None-Match": '"other"'}).status_code == 200
+    # 두 번째 요청부터는 stat 캐시 적중
+    assert server.hits > 0
+
+
+@pytest.mark.parametrize("range_header, start, end", [
+    ("bytes=10-19", 10, 19),
+    ("bytes=1000-", 1000, 1023),
+    ("bytes=-5", 1019, 1023),
+    ("bytes=1000-5000", 1000, 1023),
+])
+def test_range_returns_206(static_client, range_header, start, end):
+    response = static_client.get("/uploads/photo.png", headers={"Range": range_header})
+    assert response.status_code == 206
+    assert response.headers["content-range"] == f"bytes {start}-{end}/{len(BODY)}"
+    assert response.content == BODY[start:end + 1]
+
+
+def test_range_on_large_file_streams_slice(static_client, files):
+    data = (files / "large.bin").read_bytes()
+    response = static_client.get("/uploads/large.bin", headers={"Range": "bytes=70000-140000"})
+    assert response.status_code == 206
+    assert response.content == data[70000:140001]
+    assert static_client.get("/uploads/large.bin").content == data
+
+
+@pytest.mark.parametrize("range_header", ["bytes=1024-", "bytes=5000-6000", "bytes=-0"])
+def test_unsatisfiable_range_returns_416(static_client, range_header):
+    response = static_client.get("/uploads/photo.png", headers={"Range": range_header})
+    assert response.status_code == 416
+    assert response.headers["content-range"] == f"bytes */{len(BODY)}"
+
+
+def test_unparseable_or_multiple_ranges_send_full_body(static_client):
+    for range_header in ("bytes=0-1,5-6", "items=0-1", "bytes=9-3"):
+        response = static_client.get("/uploads/photo.png", headers={"Range": range_header})
+        assert response.status_code == 200
+        assert response.content == BODY
+
+
+def test_if_range(static_client):
+    first = static_client.get("/uploads/photo.png")
+    etag, last_modified = first.headers["etag"], first.headers["last-modified"]
+
+    for validator in (etag, last_modified):
+        response = static_client.get("/uploads/photo.png", headers={"Range": "bytes=0-9", "If-Range": validator})
+        assert response.status_code == 206
+        assert response.content == BODY[:10]
+
+    # 파일이 바뀐 뒤의 검증자(약한 ETag 포함)면 범위를 무시하고 전체 전송
+    for validator in ('"stale"', f"W/{etag}", "Thu, 01 Jan 1970 00:00:00 GMT"):
+        response = static_client.get("/uploads/photo.png", headers={"Range": "bytes=0-9", "If-Range": validator})
+        assert response.status_code == 200
+        assert response.content == BODY
+
+
+@pytest.mark.parametrize("path", [
+    "/uploads/.env",
+    "/uploads/%2eenv",
+    "/uploads/%2e%2e/secret.txt",
+    "/uploads/..%2fsecret.txt",
+    "/uploads/link.txt",  # 디렉터리 밖을 가리키는 심볼릭 링크
+    "/uploads/",
+    "/uploads/missing.png",
+])
+def test_hidden_and_outside_paths_are_not_served(static_client, path):
+    response = static_client.get(path)
+    assert response.status_code == 404
+    assert b"SECRET" not in response.content and b"outside" not in response.content
+
+
+def test_resolve_rejects_traversal(server):
+    assert server._resolve("/../secret.txt") is None
+    assert server._resolve("/a/../../secret.txt") is None
+    assert server._resolve("/sub\\..\\secret.txt") is None
+    assert server._resolve("/photo.png") == os.path.join(server.directory, "photo.png")
+
+
+def test_only_get_and_head_are_allowed(static_client):
+    head = static_client.head("/uploads/photo.png")
+    assert head.status_code == 200
+    assert head.headers["content-length"] == str(len(BODY))
+    assert head.content == b""
+    response = static_client.post("/uploads/photo.png")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET, HEAD"
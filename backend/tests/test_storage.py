@@ -0,0 +1,200 @@
+"""
+저장소 백엔드 테스트
+
+S3 백엔드는 서명된 URL로 실제 HTTP PUT을 보내야 하므로 모의 객체 대신 로컬 moto 서버를 띄웁니다.
+(moto/boto3가 없으면 S3 테스트만 건너뜁니다.)
+"""
+import hashlib
+import io
+import os
+import socket
+import tempfile
+
+import httpx
+import pytest
+
+from PIL import Image
+
+from app.core import storage as storage_module
+from app.core.image_pipeline import image_pipeline
+from app.core.storage import LocalStorageBackend, S3StorageBackend, StorageBackend
+from app.services.file_service import profile_image_store
+
+BUCKET = "test-uploads"
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_backend_missing_methods_fails_on_creation():
+    class Incomplete(StorageBackend):
+        def url(self, key: str) -> str:
+            return key
+
+    with pytest.raises(TypeError, match="abstract"):
+        Incomplete()
+
+
+def test_local_backend_round_trip(tmp_path):
+    backend = LocalStorageBackend(str(tmp_path), "/uploads")
+    backend.store_file(_temp_file(b"hello"), "p/a.txt", "text/plain")
+    backend.store_file(_temp_file(b"x"), "p/variants/a/1.webp", "image/webp")
+
+    assert backend.url("p/a.txt") == "/uploads/p/a.txt"
+    assert backend.head("p/a.txt").size == 5
+    assert backend.read_range("p/a.txt", 1, 3) == b"ell"
+    assert [obj.key for obj in backend.iter_objects("p/")] == ["p/a.txt"]
+    assert backend.delete_prefix("p/variants/a/") == 1
+    assert backend.delete("p/a.txt") and not backend.exists("p/a.txt")
+    with pytest.raises(ValueError):
+        backend.head("../outside.txt")
+
+
+@pytest.fixture(scope="module")
+def moto_endpoint():
+    pytest.importorskip("boto3")
+    ThreadedMotoServer = pytest.importorskip("moto.server").ThreadedMotoServer
+    port = _free_port()
+    server = ThreadedMotoServer(ip_address="127.0.0.1", port=port, verbose=False)
+    server.start()
+    yield f"http://127.0.0.1:{port}"
+    server.stop()
+
+
+@pytest.fixture
+def s3_storage(moto_endpoint):
+    backend = S3StorageBackend(
+        bucket=BUCKET,
+        region="us-east-1",
+        endpoint_url=moto_endpoint,
+        access_key_id="test",
+        secret_access_key="test",
+    )
+    backend.client.create_bucket(Bucket=BUCKET)
+    yield backend
+    backend.delete_prefix("")
+    backend.client.delete_bucket(Bucket=BUCKET)
+    backend.close()
+
+
+def _temp_file(data: bytes) -> str:
+    fd, path = tempfile.mkstemp()
+    with os.fdopen(fd, "wb") as f:
+        f.write(data)
+    return path
+
+
+def _png(color: str) -> bytes:
+    buf = io.BytesIO()
+    Image.new("RGB", (64, 48), color).save(buf, "PNG")
+    return buf.getvalue()
+
+
+def test_store_file_and_read_back(s3_storage):
+    data = os.urandom(256 * 1024)
+    path = _temp_file(data)
+
+    s3_storage.store_file(path, "profile_images/a.bin", "application/octet-stream", "public, max-age=60")
+
+    assert not os.path.exists(path)  # 임시 파일은 전송 후 삭제
+    head = s3_storage.client.head_object(Bucket=BUCKET, Key="profile_images/a.bin")
+    assert (head["ContentType"], head["CacheControl"]) == ("application/octet-stream", "public, max-age=60")
+    assert s3_storage.head("profile_images/a.bin").size == len(data)
+    assert s3_storage.read_range("profile_images/a.bin", 10, 5) == data[10:15]
+    assert s3_storage.head("profile_images/missing.bin") is None
+
+    target = _temp_file(b"")
+    try:
+        s3_storage.download_file("profile_images/a.bin", target)
+        with open(target, "rb") as f:
+            assert f.read() == data
+    finally:
+        os.unlink(target)
+
+
+def test_delete_prefix_removes_only_matching_keys(s3_storage):
+    for key in ("p/variants/a/1.webp", "p/variants/a/2.webp", "p/variants/ab/1.webp", "p/a.png"):
+        s3_storage.store_file(_temp_file(b"x"), key, "image/webp")
+
+    assert s3_storage.delete_prefix("p/variants/a/") == 2
+    assert sorted(obj.key for obj in s3_storage.iter_objects("p/", recursive=True)) == [
+        "p/a.png", "p/variants/ab/1.webp",
+    ]
+    assert s3_storage.delete("p/a.png") is True
+    assert s3_storage.delete("p/a.png") is False
+
+
+@pytest.fixture
+def variant_jobs(monkeypatch):
+    """예약된 변환 작업 (버킷을 지우기 전에 끝날 때까지 대기)"""
+    jobs = []
+    submit = image_pipeline.submit
+    monkeypatch.setattr(image_pipeline, "submit", lambda *args, **kwargs: jobs.append(submit(*args, **kwargs)))
+    yield jobs
+    for job in jobs:
+        if job is not None:
+            job.result(timeout=30)
+
+
+@pytest.fixture
+def s3_app(client, s3_storage, variant_jobs, monkeypatch):
+    monkeypatch.setattr(storage_module, "_storage", s3_storage)
+    return client
+
+
+def _presign(client, headers, data: bytes, content_type: str = "image/png"):
+    body = {"sha256": hashlib.sha256(data).hexdigest(), "size": len(data), "content_type": content_type}
+    return client.post("/api/counselors/upload-image/presign", json=body, headers=headers)
+
+
+def _complete(client, headers, data: bytes, content_type: str = "image/png"):
+    body = {"sha256": hashlib.sha256(data).hexdigest(), "content_type": content_type}
+    return client.post("/api/counselors/upload-image/complete", json=body, headers=headers)
+
+
+def test_presigned_upload_and_complete(s3_app, s3_storage, variant_jobs, admin_headers):
+    data = _png("green")
+    presigned = _presign(s3_app, admin_headers, data).json()
+    assert presigned["exists"] is False and presigned["method"] == "PUT"
+
+    put = httpx.put(presigned["upload_url"], content=data, headers=presigned["headers"])
+    assert put.status_code == 200
+
+    done = _complete(s3_app, admin_headers, data)
+    assert done.status_code == 200
+    assert done.json()["image_url"] == presigned["image_url"]
+    key = profile_image_store.key(done.json()["filename"])
+    assert s3_storage.read_range(key, 0, len(data)) == data
+    # 변환본은 같은 버킷의 variants/ 아래에 생성
+    assert len(variant_jobs) == 1
+    variant_jobs[0].result(timeout=30)
+    assert any(s3_storage.iter_objects(profile_image_store.variants_prefix(done.json()["filename"])))
+
+    # 같은 내용은 다시 올리지 않고 기존 URL 재사용
+    again = _presign(s3_app, admin_headers, data).json()
+    assert again == {**again, "exists": True, "image_url": presigned["image_url"]}
+
+
+def test_complete_rejects_and_deletes_non_image(s3_app, s3_storage, admin_headers):
+    data = b"not an image" * 10
+    presigned = _presign(s3_app, admin_headers, data).json()
+    httpx.put(presigned["upload_url"], content=data, headers=presigned["headers"])
+
+    response = _complete(s3_app, admin_headers, data)
+
+    assert response.status_code == 400
+    filename = profile_image_store.filename(hashlib.sha256(data).hexdigest(), "png")
+    assert not s3_storage.exists(profile_image_store.key(filename))
+
+
+def test_direct_upload_endpoints_require_admin(s3_app, user_headers):
+    data = _png("red")
+    for headers in ({}, user_headers):
+        assert _presign(s3_app, headers, data).status_code in (401, 403)
+        assert _complete(s3_app, headers, data).status_code in (401, 403)
+    # 서버 경유 업로드는 기존 프런트엔드가 인증 없이 호출하므로 그대로 허용
+    response = s3_app.post("/api/counselors/upload-image", files={"file": ("a.png", data, "image/png")})
+    assert response.status_code == 200
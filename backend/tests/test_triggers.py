@@ -0,0 +1,182 @@
+"""트리거로 관리하는 통계 카운터/상담사 평점/전문 검색 색인 회귀 테스트"""
+import pytest
+from app.core.cache import invalidate_tables
+from app.models.consultation import Consultation, ConsultationStatus, ConsultationType
+from app.models.counselor import Counselor
+from app.models.notice import Notice, NoticeStatus
+from app.models.review import Review
+from app.services import stats_service
+
+
+def _counselor(db, name: str = "김상담", **values) -> Counselor:
+    counselor = Counselor(name=name, email=f"{name}@example.com", **values)
+    db.add(counselor)
+    db.commit()
+    return counselor
+
+
+def _consultation(db, user, counselor, status: ConsultationStatus) -> Consultation:
+    consultation = Consultation(
+        user_id=user.id, counselor_id=counselor.id, consultation_type=ConsultationType.INDIVIDUAL,
+        status=status, title="상담", description="내용",
+        contact_name="신청자", contact_phone="010-0000-0000", contact_email="c@example.com",
+    )
+    db.add(consultation)
+    db.commit()
+    return consultation
+
+
+def _review(db, user, counselor, rating: int, approved: bool = True) -> Review:
+    review = Review(
+        user_id=user.id, counselor_id=counselor.id, rating=rating,
+        title="후기", content="좋았습니다", is_approved=approved,
+    )
+    db.add(review)
+    db.commit()
+    return review
+
+
+def test_stat_counters_follow_insert_update_delete(db, admin):
+    active = _counselor(db, "가")
+    inactive = _counselor(db, "나", is_active=False)
+    pending = _consultation(db, admin, active, ConsultationStatus.PENDING)
+    _consultation(db, admin, active, ConsultationStatus.PENDING)
+    review = _review(db, admin, active, 5, approved=False)
+    db.add(Notice(author_id=admin.id, title="공지", content="본문", status=NoticeStatus.PUBLISHED))
+    db.commit()
+
+    stats = stats_service.get_admin_stats(db)
+    assert stats["counselors"] == 2 and stats["active_counselors"] == 1
+    assert stats["consultations_by_status"] == {"PENDING": 2}
+    assert stats["reviews_pending_approval"] == 1 and stats["reviews_approved"] == 0
+    assert stats["notices_by_status"] == {"PUBLISHED": 1}
+
+    pending.status = ConsultationStatus.CONFIRMED
+    review.is_approved = True
+    inactive.is_active = True
+    db.commit()
+    stats = stats_service.get_admin_stats(db)
+    assert stats["consultations_by_status"] == {"PENDING": 1, "CONFIRMED": 1}
+    assert stats["reviews_pending_approval"] == 0 and stats["reviews_approved"] == 1
+    assert stats["active_counselors"] == 2
+
+    db.delete(pending)
+    db.delete(review)
+    db.commit()
+    stats = stats_service.get_admin_stats(db)
+    assert stats["consultations"] == 1
+    assert stats["consultations_by_status"]["CONFIRMED"] == 0
+    assert stats["reviews"] == 0 and stats["reviews_approved"] == 0
+
+    # 증분 결과가 원본 테이블에서 다시 계산한 값과 같아야 함
+    def nonzero(values):
+        return {key: value for key, value in values.items() if value}
+
+    incremental = stats_service.get_admin_stats(db)
+    stats_service.rebuild_stat_counters(db)
+    rebuilt = stats_service.get_admin_stats(db)
+    for key in ("consultations_by_status", "notices_by_status"):
+        incremental[key], rebuilt[key] = nonzero(incremental[key]), nonzero(rebuilt[key])
+    assert incremental == rebuilt
+
+
+def test_counselor_rating_follows_review_changes(db, admin):
+    counselor = _counselor(db)
+    first = _review(db, admin, counselor, 5)
+    second = _review(db, admin, counselor, 3)
+    _review(db, admin, counselor, 1, approved=False)  # 승인 전 후기는 제외
+
+    def current():
+        db.refresh(counselor)
+        return round(counselor.rating, 6), counselor.total_reviews
+
+    assert current() == (4.0, 2)
+
+    second.rating = 4
+    db.commit()
+    assert current() == (4.5, 2)
+
+    first.is_active = False
+    db.commit()
+    assert current() == (4.0, 1)
+
+    db.delete(second)
+    db.commit()
+    assert current() == (0, 0)
+
+
+@pytest.mark.parametrize("source", ["notices"])
+def test_search_index_follows_insert_update_delete(client, db, admin, source):
+    notice = Notice(author_id=admin.id, title="마음 챙김 명상 안내", content="스트레스 관리 프로그램", status=NoticeStatus.PUBLISHED)
+    db.add(notice)
+    db.commit()
+
+    def hits(q: str) -> list:
+        # 직접 쓴 변경이므로 API 쓰기 경로처럼 응답 캐시를 무효화한 뒤 조회
+        invalidate_tables(source)
+        response = client.get("/api/search", params={"q": q, "types": source})
+        assert response.status_code == 200
+        return [hit["id"] for hit in response.json()["results"][source]]
+
+    assert hits("챙김 명상") == [notice.id]
+    assert hits("스트레스") == [notice.id]
+    assert hits("명상") == [notice.id]  # 3글자 미만 검색어
+
+    notice.title = "가족 상담 프로그램 안내"
+    db.commit()
+    assert hits("챙김 명상") == []
+    assert hits("가족 상담") == [notice.id]
+
+    notice.status = NoticeStatus.DRAFT  # 비공개 공지사항은 검색 결과에서 제외
+    db.commit()
+    assert hits("가족 상담") == []
+
+    notice.status = NoticeStatus.PUBLISHED
+    db.commit()
+    db.delete(notice)
+    db.commit()
+    assert hits("가족 상담") == []
+    assert hits("스트레스") == []
+
+
+def test_reconcile_ratings_updates_only_drifted_counselors(db, admin):
+    from datetime import datetime
+    from app.services import counselor_service
+
+    correct = _counselor(db, "가")
+    drifted = _counselor(db, "나")
+    stale = _counselor(db, "다")  # 후기가 없는데 값이 남은 상담사
+    for rating in (5, 4, 4):
+        _review(db, admin, correct, rating)
+    _review(db, admin, drifted, 2)
+    edited = datetime(2026, 1, 2, 3, 4, 5)
+    db.query(Counselor).update({"updated_at": edited})
+    db.query(Counselor).filter(Counselor.id == drifted.id).update({"rating": 4.5, "total_reviews": 7})
+    db.query(Counselor).filter(Counselor.id == stale.id).update({"rating": 3.0, "total_reviews": 1})
+    db.commit()
+
+    assert counselor_service.reconcile_counselor_ratings(db) == 2
+    db.expire_all()
+    assert (drifted.rating, drifted.total_reviews) == (2, 1)
+    assert (stale.rating, stale.total_reviews) == (0, 0)
+    assert correct.updated_at == edited  # 값이 맞는 상담사는 건드리지 않음
+    assert drifted.updated_at != edited
+
+    assert counselor_service.reconcile_counselor_ratings(db) == 0
+
+
+def test_reconcile_ratings_requires_admin(client, admin_headers, user_headers):
+    path = "/api/admin/counselors/reconcile-ratings"
+    assert client.post(path).status_code in (401, 403)
+    assert client.post(path, headers=user_headers).status_code == 403
+    # 시작 시 넣은 샘플 상담사도 후기 기준 값(0)과 일치
+    assert client.post(path, headers=admin_headers).json()["updated_count"] == 0
+
+
+def test_sample_counselor_rating_starts_from_reviews(client, db, admin):
+    counselor = db.query(Counselor).filter(Counselor.email == "counselor1@suwon-healing.com").one()
+    assert (counselor.rating, counselor.total_reviews) == (0, 0)
+
+    _review(db, admin, counselor, 3)
+    db.refresh(counselor)
+    assert (counselor.rating, counselor.total_reviews) == (3, 1)
@@ -0,0 +1,100 @@
+"""
+스트리밍 업로드 테스트
+
+크기 초과와 형식 위반은 본문을 끝까지 받지 않고 중단해야 하며, 임시 파일이나 저장된 파일이 남지 않아야 합니다.
+"""
+import asyncio
+import io
+import os
+
+import pytest
+from fastapi import HTTPException, Request
+from PIL import Image
+
+from app.api import counselors as counselors_api
+from app.core.uploads import receive_image_upload
+from app.services.file_service import profile_image_store
+
+BOUNDARY = "test-boundary"
+UPLOAD_URL = "/api/counselors/upload-image"
+
+
+def _png() -> bytes:
+    buffer = io.BytesIO()
+    Image.new("RGB", (8, 8), "white").save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+def _multipart(data: bytes, filename: str = "a.png", content_type: str = "image/png") -> bytes:
+    return (
+        f"--{BOUNDARY}\r\n"
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f"Content-Type: {content_type}\r\n\r\n"
+    ).encode() + data + f"\r\n--{BOUNDARY}--\r\n".encode()
+
+
+def _post(client, body):
+    return client.post(UPLOAD_URL, content=body, headers={"Content-Type": f"multipart/form-data; boundary={BOUNDARY}"})
+
+
+@pytest.fixture
+def upload_dir(client):
+    directory = profile_image_store.spool_directory()
+    before = set(os.listdir(directory))
+    yield lambda: set(os.listdir(directory)) - before
+
+
+def test_upload_stores_content_addressed_file(client, upload_dir):
+    response = _post(client, _multipart(_png()))
+    assert response.status_code == 200
+    assert response.json()["filename"] in upload_dir()
+
+
+def test_oversize_declared_length_is_rejected_before_reading(client, upload_dir, monkeypatch):
+    monkeypatch.setattr(counselors_api, "MAX_FILE_SIZE", 1024)
+    body = _multipart(_png() + b"\0" * 200_000)
+
+    response = _post(client, body)
+    assert response.status_code == 413
+    assert upload_dir() == set()
+
+
+def _streaming_request(body: bytes, chunk_size: int = 4096):
+    """Content-Length 없이 청크로 도착하는 요청 - 읽어 간 청크 수를 기록"""
+    chunks = [body[start:start + chunk_size] for start in range(0, len(body), chunk_size)]
+    received = []
+
+    async def receive():
+        chunk = chunks[len(received)]
+        received.append(chunk)
+        return {"type": "http.request", "body": chunk, "more_body": len(received) < len(chunks)}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "headers": [(b"content-type", f"multipart/form-data; boundary={BOUNDARY}".encode())],
+    }
+    return Request(scope, receive), received, len(chunks)
+
+
+def test_oversize_stream_is_aborted_midway(client, upload_dir):
+    request, received, total = _streaming_request(_multipart(_png() + b"\0" * 1_000_000))
+
+    with pytest.raises(HTTPException) as error:
+        asyncio.run(receive_image_upload(request, profile_image_store, max_size=16 * 1024))
+    assert error.value.status_code == 413
+    # 상한을 넘은 청크에서 읽기를 멈추고, 임시 파일도 남기지 않음
+    assert len(received) < total // 10
+    assert upload_dir() == set()
+
+
+@pytest.mark.parametrize("data", [
+    b"<?php echo 'x'; ?>" + b"\0" * 64,  # 확장자/Content-Type만 이미지인 스크립트
+    b"GIF89a" + b"\0" * 64,  # 허용하지 않는 이미지 형식
+])
+def test_content_is_sniffed_not_trusted(client, upload_dir, data):
+    response = _post(client, _multipart(data, filename="a.png", content_type="image/png"))
+    assert response.status_code == 400
+    assert "지원되지 않는 파일 형식" in response.json()["detail"]
+    assert upload_dir() == set()
+
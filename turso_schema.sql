@@ -94,6 +94,21 @@ CREATE TABLE IF NOT EXISTS reviews (
     FOREIGN KEY (consultation_id) REFERENCES consultations(id)
 );
 
+-- 목록 조회 색인 (backend/alembic/versions 마이그레이션과 같은 정의)
+-- 공지사항 created_at은 형식이 섞여 있어도 정렬되도록 마이크로초 고정 폭 식으로 색인
+CREATE INDEX IF NOT EXISTS ix_consultations_user_status ON consultations (user_id, status);
+CREATE INDEX IF NOT EXISTS ix_consultations_user_id ON consultations (user_id);
+CREATE INDEX IF NOT EXISTS ix_consultations_status ON consultations (status);
+CREATE INDEX IF NOT EXISTS ix_consultations_status_created ON consultations (status, created_at, id);
+CREATE INDEX IF NOT EXISTS ix_consultations_created ON consultations (created_at, id);
+CREATE INDEX IF NOT EXISTS ix_consultations_counselor_id ON consultations (counselor_id);
+CREATE INDEX IF NOT EXISTS ix_reviews_counselor_approved_active ON reviews (counselor_id, is_approved, is_active);
+CREATE INDEX IF NOT EXISTS ix_reviews_public ON reviews (id) WHERE is_approved = 1 AND is_active = 1;
+CREATE INDEX IF NOT EXISTS ix_reviews_user_id ON reviews (user_id);
+CREATE INDEX IF NOT EXISTS ix_notices_status_active_pinned_created ON notices (status, is_active, is_pinned, (substr(created_at, 1, 19) || '.' || substr(substr(created_at, 21) || '000000', 1, 6)));
+CREATE INDEX IF NOT EXISTS ix_notices_published ON notices (is_pinned, (substr(created_at, 1, 19) || '.' || substr(substr(created_at, 21) || '000000', 1, 6)), id, updated_at) WHERE status = 'PUBLISHED' AND is_active = 1;
+CREATE INDEX IF NOT EXISTS ix_counselors_online_active ON counselors (is_online, is_active);
+
 -- 샘플 데이터 삽입
 INSERT OR IGNORE INTO counselors (name, email, phone, specialization, education, experience, bio, is_online, is_active, rating, total_reviews) VALUES
 ('김상담', 'counselor1@suwon-healing.com', '010-1000-1000', '개인상담', '서울대학교 심리학과 졸업', '10년', '따뜻하고 전문적인 상담을 제공합니다.', 1, 1, 4.8, 25),